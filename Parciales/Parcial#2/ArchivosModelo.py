@@ -0,0 +1,517 @@
+# ArchivosModelo.py
+# Lectura y escritura de modelos completos en formato MPS libre y CPLEX LP.
+# Los lectores recorren el archivo línea por línea y van guardando los no ceros en arreglos
+# compactos (array de la biblioteca estándar); al terminar se arma la matriz CSC de una vez.
+# No se crea una lista de Python por fila ni se construye un string por restricción.
+#
+# Uso:
+#   modelo = leer_modelo("problema.mps")          # o .lp
+#   solver = SimplexSolver(sparse=True)
+#   modelo.cargar_en(solver)
+#   escribir_lp(modelo, "problema.lp")
+
+import re
+from array import array
+
+import numpy as np
+
+from MatrizDispersa import MatrizCSC
+from Parser import TablaVariables, parse_many
+
+INF = float("inf")
+
+
+# ################ Modelo en arreglos ################
+class ModeloLP:
+    """
+    Modelo de PL en arreglos: optimizar c^T x sujeto a A x (tipos) b, lo <= x <= up.
+    - A: MatrizCSC (m x n); tipos: lista de "<=", ">=", "="; b, c, lo, up: vectores NumPy
+    - offset: constante de la función objetivo (RHS de la fila objetivo en MPS)
+    """
+
+    def __init__(self, nombre, modo, var_names, c, A, tipos, b, row_names, lo=None, up=None, offset=0.0):
+        self.nombre = nombre
+        self.modo = modo
+        self.var_names = list(var_names)
+        self.c = np.asarray(c, dtype=float)
+        self.A = A
+        self.tipos = list(tipos)
+        self.b = np.asarray(b, dtype=float)
+        self.row_names = list(row_names)
+        n = self.c.size
+        self.lo = np.zeros(n) if lo is None else np.asarray(lo, dtype=float)
+        self.up = np.full(n, INF) if up is None else np.asarray(up, dtype=float)
+        self.offset = float(offset)
+
+    @classmethod
+    def desde_texto(cls, modo: str, funcion_objetivo: str, restricciones: list[str], nombre: str = "modelo"):
+        """Modelo a partir de la FO y restricciones en texto (el formato de la interfaz y de Lote.py)."""
+        tabla = TablaVariables.ordenada([funcion_objetivo] + list(restricciones))
+        parsed = parse_many([funcion_objetivo] + list(restricciones), tabla)
+        filas, columnas, valores = parsed["filas"], parsed["columnas"], parsed["valores"]
+        n, m = len(tabla), len(restricciones)
+        fo = filas == 0
+        c = np.zeros(n)
+        c[columnas[fo]] = valores[fo]
+        A = MatrizCSC.from_triplets(filas[~fo] - 1, columnas[~fo], valores[~fo], (m, n))
+        return cls(nombre, modo, tabla.nombres, c, A, parsed["operadores"][1:], parsed["constantes"][1:],
+                   [f"c{i+1}" for i in range(m)])
+
+    @property
+    def shape(self):
+        return self.A.shape
+
+    def forma_para_solver(self):
+        """
+        (c, A, tipos, b) para initialize_from_arrays. Los solvers asumen x >= 0, así que las cotas
+        finitas se agregan como filas (x_j <= up, x_j >= lo; si lo == up, el par x_j <= valor y
+        x_j >= valor, porque SolverDualSimplex no admite filas "=").
+        """
+        if np.any(self.lo < 0):
+            malas = [self.var_names[j] for j in np.flatnonzero(self.lo < 0)[:5]]
+            raise ValueError(f"Variables libres o con cota inferior negativa no soportadas: {', '.join(malas)}")
+        fijas = self.lo == self.up
+        sup = np.flatnonzero(np.isfinite(self.up) & ~fijas)
+        inf = np.flatnonzero((self.lo > 0) & ~fijas)
+        fij = np.flatnonzero(fijas)
+        if sup.size + inf.size + fij.size == 0:
+            return self.c, self.A, self.tipos, self.b
+        m, n = self.A.shape
+        cols = np.concatenate([sup, inf, fij, fij])
+        k = cols.size
+        A = self.A.agregar_filas(m + np.arange(k), cols, np.ones(k), (m + k, n))
+        tipos = self.tipos + ["<="] * sup.size + [">="] * inf.size + ["<="] * fij.size + [">="] * fij.size
+        b = np.concatenate([self.b, self.up[sup], self.lo[inf], self.lo[fij], self.lo[fij]])
+        return self.c, A, tipos, b
+
+    def cargar_en(self, solver):
+        """Inicializa un SimplexSolver o SolverDualSimplex con este modelo.
+        SimplexSolver maneja las cotas de las variables sin agregar filas; en SolverDualSimplex
+        se agregan como filas (forma_para_solver). El offset de la FO queda sumado en el Z del solver."""
+        if hasattr(solver, "cotas_nativas"):
+            solver.initialize_from_arrays(self.modo, self.c, self.A, self.tipos, self.b, var_names=self.var_names,
+                                          lo=self.lo, up=self.up, offset=self.offset)
+            return solver
+        c, A, tipos, b = self.forma_para_solver()
+        solver.initialize_from_arrays(self.modo, c, A, tipos, b, var_names=self.var_names, offset=self.offset)
+        return solver
+
+
+# ################ Utilidades de lectura ################
+class _Acumulador:
+    """Tripletas (fila, columna, valor) en arreglos compactos que crecen sin listas por fila."""
+
+    def __init__(self):
+        self.filas = array("q")
+        self.columnas = array("q")
+        self.valores = array("d")
+
+    def agregar(self, fila, columna, valor):
+        self.filas.append(fila)
+        self.columnas.append(columna)
+        self.valores.append(valor)
+
+    def matriz(self, m, n):
+        return MatrizCSC.from_triplets(np.frombuffer(self.filas, dtype=np.int64) if self.filas else np.zeros(0, dtype=np.int64),
+                                       np.frombuffer(self.columnas, dtype=np.int64) if self.columnas else np.zeros(0, dtype=np.int64),
+                                       np.frombuffer(self.valores, dtype=float) if self.valores else np.zeros(0),
+                                       (m, n))
+
+def _vector(valores: dict, n: int, defecto: float) -> np.ndarray:
+    v = np.full(n, defecto)
+    for j, x in valores.items():
+        v[j] = x
+    return v
+
+def _num(x: float) -> str:
+    """Número con la precisión justa para volver a leerlo igual."""
+    if np.isinf(x):
+        return "inf" if x > 0 else "-inf"
+    return repr(float(x)) if x != int(x) or abs(x) >= 1e16 else str(int(x))
+
+
+# ################ MPS libre ################
+SECCIONES_MPS = {"NAME", "OBJSENSE", "OBJSENSE MAX", "OBJSENSE MIN", "ROWS", "COLUMNS", "RHS", "RANGES", "BOUNDS", "ENDATA"}
+TIPOS_MPS = {"L": "<=", "G": ">=", "E": "="}
+
+def leer_mps(ruta: str) -> ModeloLP:
+    """Lee un archivo MPS libre (campos separados por espacios). Sin RANGES ni variables enteras."""
+    nombre, modo = "", "Min"
+    fila_obj = None
+    filas = {}          # nombre de fila -> índice
+    row_names, tipos = [], []
+    tabla = TablaVariables()
+    nz = _Acumulador()
+    c, rhs, lo, up = {}, {}, {}, {}
+    offset = 0.0
+    seccion = None
+
+    with open(ruta, "r", encoding="utf-8") as f:
+        for nro, linea in enumerate(f, start=1):
+            if not linea.strip() or linea.startswith("*"):
+                continue
+            campos = linea.split()
+            if not linea[0].isspace() and (campos[0].upper() in SECCIONES_MPS or " ".join(campos[:2]).upper() in SECCIONES_MPS):
+                seccion = campos[0].upper()
+                if seccion == "NAME":
+                    nombre = " ".join(campos[1:])
+                elif seccion == "OBJSENSE" and len(campos) > 1:
+                    modo = "Max" if campos[1].upper().startswith("MAX") else "Min"
+                elif seccion == "RANGES":
+                    raise ValueError(f"{ruta}:{nro}: la sección RANGES no está soportada.")
+                elif seccion == "ENDATA":
+                    break
+                continue
+
+            if seccion == "OBJSENSE":
+                modo = "Max" if campos[0].upper().startswith("MAX") else "Min"
+            elif seccion == "ROWS":
+                tipo, fila = campos[0].upper(), campos[1]
+                if tipo == "N":
+                    if fila_obj is None:
+                        fila_obj = fila
+                    continue
+                if tipo not in TIPOS_MPS:
+                    raise ValueError(f"{ruta}:{nro}: tipo de fila desconocido '{tipo}'.")
+                filas[fila] = len(row_names)
+                row_names.append(fila)
+                tipos.append(TIPOS_MPS[tipo])
+            elif seccion == "COLUMNS":
+                if len(campos) > 2 and campos[1].strip("'").upper() == "MARKER":
+                    raise ValueError(f"{ruta}:{nro}: variables enteras (MARKER) no soportadas.")
+                j = tabla.indice(campos[0])
+                for fila, valor in zip(campos[1::2], campos[2::2]):
+                    if fila == fila_obj:
+                        c[j] = c.get(j, 0.0) + float(valor)
+                    elif fila in filas:
+                        nz.agregar(filas[fila], j, float(valor))
+                    else:
+                        raise ValueError(f"{ruta}:{nro}: fila desconocida '{fila}'.")
+            elif seccion == "RHS":
+                pares = campos[1:] if len(campos) % 2 == 1 else campos
+                for fila, valor in zip(pares[0::2], pares[1::2]):
+                    if fila == fila_obj:
+                        offset = -float(valor)
+                    elif fila in filas:
+                        rhs[filas[fila]] = float(valor)
+                    else:
+                        raise ValueError(f"{ruta}:{nro}: fila desconocida '{fila}'.")
+            elif seccion == "BOUNDS":
+                tipo = campos[0].upper()
+                if tipo in ("FR", "MI", "PL", "BV"):
+                    var = campos[-1] if len(campos) <= 3 else campos[2]
+                    valor = None
+                else:
+                    var, valor = (campos[2], float(campos[3])) if len(campos) >= 4 else (campos[1], float(campos[2]))
+                j = tabla.indice(var)
+                if tipo == "UP":
+                    up[j] = valor
+                    if valor < 0 and lo.get(j, 0.0) == 0.0:
+                        lo[j] = -INF
+                elif tipo == "LO":
+                    lo[j] = valor
+                elif tipo == "FX":
+                    lo[j] = up[j] = valor
+                elif tipo == "FR":
+                    lo[j], up[j] = -INF, INF
+                elif tipo == "MI":
+                    lo[j] = -INF
+                elif tipo == "PL":
+                    up[j] = INF
+                else:
+                    raise ValueError(f"{ruta}:{nro}: cota '{tipo}' no soportada (sólo PL continua).")
+            else:
+                raise ValueError(f"{ruta}:{nro}: línea fuera de sección.")
+
+    m, n = len(row_names), len(tabla)
+    return ModeloLP(nombre, modo, tabla.nombres, _vector(c, n, 0.0), nz.matriz(m, n), tipos,
+                    _vector(rhs, m, 0.0), row_names, _vector(lo, n, 0.0), _vector(up, n, INF), offset)
+
+def escribir_mps(modelo: ModeloLP, ruta: str):
+    """Escribe el modelo en MPS libre recorriendo A por columnas (orden natural de la CSC)."""
+    A = modelo.A
+    with open(ruta, "w", encoding="utf-8") as f:
+        f.write(f"NAME {modelo.nombre or 'modelo'}\n")
+        f.write(f"OBJSENSE\n    {'MAX' if modelo.modo == 'Max' else 'MIN'}\n")
+        f.write("ROWS\n N  obj\n")
+        letra = {v: k for k, v in TIPOS_MPS.items()}
+        for nombre, tipo in zip(modelo.row_names, modelo.tipos):
+            f.write(f" {letra[tipo]}  {nombre}\n")
+        f.write("COLUMNS\n")
+        for j, var in enumerate(modelo.var_names):
+            if modelo.c[j] != 0.0:
+                f.write(f"    {var}  obj  {_num(modelo.c[j])}\n")
+            for k in range(A.indptr[j], A.indptr[j + 1]):
+                f.write(f"    {var}  {modelo.row_names[A.indices[k]]}  {_num(A.data[k])}\n")
+        f.write("RHS\n")
+        if modelo.offset != 0.0:
+            f.write(f"    RHS  obj  {_num(-modelo.offset)}\n")
+        for i in np.flatnonzero(modelo.b):
+            f.write(f"    RHS  {modelo.row_names[i]}  {_num(modelo.b[i])}\n")
+        cotas = np.flatnonzero((modelo.lo != 0.0) | np.isfinite(modelo.up))
+        if cotas.size:
+            f.write("BOUNDS\n")
+            for j in cotas:
+                var, l, u = modelo.var_names[j], modelo.lo[j], modelo.up[j]
+                if l == u:
+                    f.write(f" FX BND  {var}  {_num(l)}\n")
+                elif np.isinf(l) and np.isinf(u):
+                    f.write(f" FR BND  {var}\n")
+                else:
+                    if np.isinf(l):
+                        f.write(f" MI BND  {var}\n")
+                    elif l != 0.0:
+                        f.write(f" LO BND  {var}  {_num(l)}\n")
+                    if np.isfinite(u):
+                        f.write(f" UP BND  {var}  {_num(u)}\n")
+        f.write("ENDATA\n")
+
+
+# ################ CPLEX LP ################
+SECCIONES_LP = {
+    "maximize": "max", "maximise": "max", "maximum": "max", "max": "max",
+    "minimize": "min", "minimise": "min", "minimum": "min", "min": "min",
+    "subject to": "st", "such that": "st", "st": "st", "s.t.": "st", "st.": "st",
+    "bounds": "bounds", "bound": "bounds",
+    "general": "int", "generals": "int", "gen": "int", "integer": "int", "integers": "int",
+    "binary": "int", "binaries": "int", "bin": "int",
+    "end": "end",
+}
+SECCION_LP = re.compile(r"^\s*(subject\s+to|such\s+that|s\.t\.|st\.?|maximi[sz]e|maximum|max|minimi[sz]e|minimum|min|bounds?|generals?|gen|integers?|binary|binaries|bin|end)\b\s*(.*)$", re.IGNORECASE)
+TOKEN_LP = re.compile(r"\s*(<=|=<|>=|=>|<|>|=|[+-]|:|(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?|[A-Za-z_!\"#$%&()/,;?@`'{}|~][\w!\"#$%&()/,.;?@`'{}|~]*)")
+OPERADORES_LP = {"<=": "<=", "=<": "<=", "<": "<=", ">=": ">=", "=>": ">=", ">": ">=", "=": "="}
+
+def _tokens_lp(texto: str, ruta: str, nro: int) -> list:
+    tokens, pos = [], 0
+    texto = texto.rstrip()
+    while pos < len(texto):
+        t = TOKEN_LP.match(texto, pos)
+        if not t:
+            raise ValueError(f"{ruta}:{nro}: no se reconoce '{texto[pos:].strip()[:20]}'.")
+        tokens.append(t.group(1))
+        pos = t.end()
+    return tokens
+
+def _es_numero(tok: str) -> bool:
+    return tok[0].isdigit() or (tok[0] == "." and len(tok) > 1)
+
+def _valor_lp(tok: str) -> float:
+    if tok.lower() in ("inf", "infinity"):
+        return INF
+    return float(tok)
+
+class _ExpresionLP:
+    """Estado de la expresión lineal que se está leyendo (puede ocupar varias líneas)."""
+
+    def __init__(self):
+        self.limpiar()
+
+    def limpiar(self):
+        self.etiqueta = None
+        self.signo = 1.0
+        self.numero = None
+        self.operador = None
+        self.terminos = 0
+
+    def vacia(self):
+        return self.terminos == 0 and self.numero is None and self.operador is None
+
+
+def leer_lp(ruta: str) -> ModeloLP:
+    """Lee un archivo en formato CPLEX LP (objetivo, Subject To, Bounds, End). Sin variables enteras.
+    Un número sin variable en la FO es la constante del objetivo (offset)."""
+    nombre, modo = "", "Min"
+    tabla = TablaVariables()
+    nz = _Acumulador()
+    c, lo, up = {}, {}, {}
+    row_names, tipos = [], []
+    rhs = array("d")
+    offset = 0.0
+    seccion = None
+    expr = _ExpresionLP()
+
+    def cerrar_constante():
+        # un número de la FO sin variable a continuación es la constante (offset)
+        nonlocal offset
+        if seccion == "obj" and expr.numero is not None:
+            offset += expr.signo * expr.numero
+            expr.signo, expr.numero = 1.0, None
+
+    def cerrar_fila(valor):
+        tipos.append(OPERADORES_LP[expr.operador])
+        rhs.append(valor)
+        row_names.append(expr.etiqueta or f"c{len(row_names) + 1}")
+        expr.limpiar()
+
+    def leer_cota(tokens, nro):
+        # x free | x op v | v op x | v op x op v | x = v  (v puede ser [-]inf)
+        vals, ops, var, signo = [], [], None, 1.0
+        for tok in tokens:
+            if tok in ("+", "-"):
+                signo = -1.0 if tok == "-" else 1.0
+            elif tok in OPERADORES_LP:
+                ops.append(OPERADORES_LP[tok])
+            elif _es_numero(tok) or tok.lower() in ("inf", "infinity"):
+                vals.append((len(ops), signo * _valor_lp(tok)))
+                signo = 1.0
+            elif tok.lower() == "free":
+                j = tabla.indice(var)
+                lo[j], up[j] = -INF, INF
+                return
+            else:
+                var = tok
+        if var is None or not ops:
+            raise ValueError(f"{ruta}:{nro}: cota inválida.")
+        j = tabla.indice(var)
+        for lado, v in vals:
+            # lado == 0: el número está antes del primer operador (v op x); si no, x op v
+            op = ops[0] if lado == 0 else ops[lado - 1]
+            if op == "=":
+                lo[j] = up[j] = v
+            elif (op == "<=") == (lado == 0):
+                lo[j] = v
+            else:
+                up[j] = v
+
+    with open(ruta, "r", encoding="utf-8") as f:
+        for nro, linea in enumerate(f, start=1):
+            linea = linea.split("\\", 1)[0]
+            if not linea.strip():
+                continue
+            sec = SECCION_LP.match(linea)
+            # Una palabra clave abre sección salvo en medio de una restricción o si es una etiqueta/variable
+            if sec and (seccion != "st" or expr.vacia()) and not (sec.group(2) and sec.group(2)[0] in ":<>="):
+                cerrar_constante()
+                expr.limpiar()
+                clave = SECCIONES_LP.get(" ".join(sec.group(1).lower().split()), "st")
+                if clave in ("max", "min"):
+                    modo = "Max" if clave == "max" else "Min"
+                    seccion = "obj"
+                elif clave == "int":
+                    seccion = "int"
+                elif clave == "end":
+                    break
+                else:
+                    seccion = clave
+                linea = sec.group(2)
+                if not linea.strip():
+                    continue
+
+            tokens = _tokens_lp(linea, ruta, nro)
+            if seccion == "bounds":
+                leer_cota(tokens, nro)
+                continue
+            if seccion == "int":
+                raise ValueError(f"{ruta}:{nro}: variables enteras no soportadas (sólo PL continua).")
+            if seccion not in ("obj", "st"):
+                raise ValueError(f"{ruta}:{nro}: se esperaba una sección (Maximize, Minimize, Subject To...).")
+
+            k = 0
+            while k < len(tokens):
+                tok = tokens[k]
+                if k + 1 < len(tokens) and tokens[k + 1] == ":" and expr.vacia():
+                    expr.etiqueta = tok
+                    k += 2
+                    continue
+                if tok in ("+", "-"):
+                    cerrar_constante()
+                    expr.signo *= -1.0 if tok == "-" else 1.0
+                elif tok in OPERADORES_LP:
+                    if seccion != "st" or expr.numero is not None:
+                        raise ValueError(f"{ruta}:{nro}: operador '{tok}' inesperado.")
+                    expr.operador = tok
+                    expr.signo = 1.0
+                elif _es_numero(tok) or (expr.operador and tok.lower() in ("inf", "infinity")):
+                    if expr.operador is not None:
+                        cerrar_fila(expr.signo * _valor_lp(tok))
+                    else:
+                        expr.numero = float(tok)
+                elif expr.operador is not None:
+                    raise ValueError(f"{ruta}:{nro}: se esperaba un número después de '{expr.operador}'.")
+                else:
+                    valor = expr.signo * (1.0 if expr.numero is None else expr.numero)
+                    j = tabla.indice(tok)
+                    if seccion == "obj":
+                        c[j] = c.get(j, 0.0) + valor
+                    else:
+                        nz.agregar(len(row_names), j, valor)
+                    expr.signo, expr.numero = 1.0, None
+                    expr.terminos += 1
+                k += 1
+
+    cerrar_constante()
+    if expr.operador is not None or (seccion == "st" and expr.terminos > 0):
+        raise ValueError(f"{ruta}: restricción incompleta al final del archivo.")
+    m, n = len(row_names), len(tabla)
+    return ModeloLP(nombre, modo, tabla.nombres, _vector(c, n, 0.0), nz.matriz(m, n), tipos,
+                    np.frombuffer(rhs, dtype=float) if rhs else np.zeros(0), row_names,
+                    _vector(lo, n, 0.0), _vector(up, n, INF), offset)
+
+def _escribir_terminos(f, columnas, valores, nombres):
+    """Escribe los términos de una expresión, varios por línea (las líneas LP tienen largo máximo)."""
+    if columnas.size == 0:
+        f.write(f" 0 {nombres[0]}" if nombres else " 0")
+        return
+    for k, (j, v) in enumerate(zip(columnas, valores)):
+        if k > 0 and k % 8 == 0:
+            f.write("\n   ")
+        signo = "-" if v < 0 else "+"
+        if k == 0 and signo == "+":
+            f.write(f" {_num(abs(v))} {nombres[j]}")
+        else:
+            f.write(f" {signo} {_num(abs(v))} {nombres[j]}")
+
+def escribir_lp(modelo: ModeloLP, ruta: str):
+    """Escribe el modelo en formato CPLEX LP recorriendo A por filas (sin listas por fila)."""
+    A = modelo.A
+    m, n = A.shape
+    nombres = modelo.var_names
+    # Orden por filas de los no ceros de la CSC (equivale a construir la CSR)
+    filas, columnas, valores = A.triplets()
+    orden = np.lexsort((columnas, filas))
+    filas, columnas, valores = filas[orden], columnas[orden], valores[orden]
+    inicio = np.searchsorted(filas, np.arange(m + 1))
+    with open(ruta, "w", encoding="utf-8") as f:
+        f.write(f"\\ {modelo.nombre or 'modelo'}\n")
+        f.write("Maximize\n" if modelo.modo == "Max" else "Minimize\n")
+        f.write(" obj:")
+        cols_c = np.flatnonzero(modelo.c)
+        _escribir_terminos(f, cols_c, modelo.c[cols_c], nombres)
+        if modelo.offset != 0.0:
+            f.write(f" {'-' if modelo.offset < 0 else '+'} {_num(abs(modelo.offset))}")
+        f.write("\nSubject To\n")
+        for i in range(m):
+            s, e = inicio[i], inicio[i + 1]
+            f.write(f" {modelo.row_names[i]}:")
+            _escribir_terminos(f, columnas[s:e], valores[s:e], nombres)
+            f.write(f" {modelo.tipos[i]} {_num(modelo.b[i])}\n")
+        cotas = np.flatnonzero((modelo.lo != 0.0) | np.isfinite(modelo.up))
+        if cotas.size:
+            f.write("Bounds\n")
+            for j in cotas:
+                var, l, u = nombres[j], modelo.lo[j], modelo.up[j]
+                if l == u:
+                    f.write(f" {var} = {_num(l)}\n")
+                elif np.isinf(l) and np.isinf(u):
+                    f.write(f" {var} free\n")
+                else:
+                    f.write(f" {_num(l)} <= {var} <= {_num(u)}\n")
+        f.write("End\n")
+
+
+# ################ Por extensión ################
+def leer_modelo(ruta: str) -> ModeloLP:
+    """Elige el lector por la extensión (.mps o .lp)."""
+    if ruta.lower().endswith(".mps"):
+        return leer_mps(ruta)
+    if ruta.lower().endswith(".lp"):
+        return leer_lp(ruta)
+    raise ValueError(f"Extensión no reconocida (se espera .mps o .lp): {ruta}")
+
+def escribir_modelo(modelo: ModeloLP, ruta: str):
+    if ruta.lower().endswith(".mps"):
+        escribir_mps(modelo, ruta)
+    elif ruta.lower().endswith(".lp"):
+        escribir_lp(modelo, ruta)
+    else:
+        raise ValueError(f"Extensión no reconocida (se espera .mps o .lp): {ruta}")
@@ -0,0 +1,270 @@
+# Benchmark.py
+# Banco de pruebas de rendimiento para todos los solvers de PL del repositorio.
+# Genera problemas aleatorios (factibles, infactibles, no acotados y degenerados) de tamaños
+# configurables, los resuelve con cada solver y registra tiempo de pared, pivotes y memoria pico.
+#
+# Solvers comparados:
+#   - simplex     : Simplex/SolverSimplex.SimplexSolver
+#   - dualsimplex : DualSimplex/SolverDualSimplex.SolverDualSimplex
+#   - optimizer   : Parcial#2v2/optimizer.Optimizer (sólo restricciones <=)
+#   - dosfases    : Parcial#2p2/SimplexDosFases.simplex_por_b_inv (vía metodo_dos_fases)
+#   - pulp        : Parcial#1/Solver.resolverPL (sólo 2 variables; requiere pulp)
+#
+# Uso:
+#   python Benchmark.py --tamanos 5x5 20x30 --tipos factible degenerado --repeticiones 3 --salida informe.csv
+#   python Benchmark.py --solvers simplex dualsimplex --instancias 5 --salida informe.json
+#
+# La memoria pico se mide con tracemalloc en una corrida aparte (tracemalloc enlentece la
+# ejecución, así que no se mezcla con la medición de tiempo). pulp resuelve con CBC en otro
+# proceso: su memoria no queda registrada.
+
+import argparse
+import contextlib
+import csv
+import importlib.util
+import io
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+DIR_PARCIAL = os.path.abspath(os.path.dirname(__file__))
+sys.path.append(DIR_PARCIAL)
+from Lote import resolver_instancia, METODOS
+from Parser import Parsear, parse_many
+
+TIPOS = ["factible", "infactible", "no_acotado", "degenerado"]
+ESPERADO = {"factible": "optimal", "infactible": "infeasible", "no_acotado": "unbounded", "degenerado": "optimal"}
+SOLVERS = METODOS + ["pulp"]
+CAMPOS = ["tamano", "tipo", "instancia", "solver", "esperado", "status", "pivotes",
+          "tiempo_min", "tiempo_medio", "memoria_pico_kib", "Z", "error"]
+
+
+# ################ Generación de problemas ################
+def _expresion(coefs) -> str:
+    """'3x1 + 2x2 -4x3' con los coeficientes no nulos (el signo pegado al número sirve a todos los parsers)."""
+    partes = []
+    for j, a in enumerate(coefs, start=1):
+        a = int(a)
+        if a == 0:
+            continue
+        if not partes:
+            partes.append(f"{a}x{j}")
+        else:
+            partes.append(f"+ {a}x{j}" if a > 0 else f"-{-a}x{j}")
+    return " ".join(partes)
+
+def generar_lp(m: int, n: int, tipo: str = "factible", semilla: int = 0,
+               densidad: float = 1.0, frac_mayor: float = 0.0) -> dict:
+    """
+    Problema aleatorio Max c^T x con m restricciones y n variables, coeficientes enteros.
+      - factible   : A >= 0 y un punto x0 >= 0 que cumple todas las restricciones; cada columna
+                     aparece con coeficiente positivo en alguna fila <= (óptimo acotado)
+      - infactible : factible + la fila 0 repetida con >= y un lado derecho mayor
+      - no_acotado : factible con x1 negativa en las filas <= y ausente en las >= (c1 > 0)
+      - degenerado : sólo filas <= y la mitad de los lados derechos en 0
+    frac_mayor es la fracción de filas >= (b = A x0 - holgura) en los tipos que las admiten.
+    Devuelve un problema en el formato de Lote.py más "tipo" y "esperado".
+    """
+    if tipo not in TIPOS:
+        raise ValueError(f"Tipo de problema desconocido: {tipo}")
+    rng = np.random.default_rng(semilla)
+    A = rng.integers(1, 10, size=(m, n)) * (rng.random((m, n)) < densidad)
+    c = rng.integers(1, 10, size=n)
+    x0 = rng.integers(0, 5, size=n)
+
+    mayor = rng.random(m) < (0.0 if tipo == "degenerado" else frac_mayor)
+    mayor[0] = False  # la fila 0 siempre es <= (la usa el tipo infactible)
+    menores = np.flatnonzero(~mayor)
+    # Cada columna necesita un coeficiente positivo en alguna fila <= para que el óptimo sea finito
+    for j in np.flatnonzero((A[menores] == 0).all(axis=0)):
+        A[rng.choice(menores), j] = rng.integers(1, 10)
+
+    if tipo == "no_acotado":
+        # x1 sólo resta en las filas <= y no aparece en las >=: crece sin límite con c1 > 0
+        A[:, 0] = 0
+        A[menores, 0] = -rng.integers(1, 10, size=menores.size)
+        x0[0] = 0
+
+    holgura = rng.integers(0, 10, size=m)
+    Ax0 = A @ x0
+    b = np.where(mayor, np.maximum(Ax0 - holgura, 0), Ax0 + holgura)
+    if tipo == "degenerado":
+        b[rng.random(m) < 0.5] = 0
+
+    restricciones = [f"{_expresion(A[i])} {'>=' if mayor[i] else '<='} {int(b[i])}" for i in range(m)]
+    if tipo == "infactible":
+        restricciones.append(f"{_expresion(A[0])} >= {int(b[0]) + 1 + int(rng.integers(0, 10))}")
+
+    return {
+        "nombre": f"{tipo}_{m}x{n}_s{semilla}",
+        "tipo": tipo,
+        "esperado": ESPERADO[tipo],
+        "modo": "Max",
+        "funcion_objetivo": _expresion(c),
+        "restricciones": restricciones,
+    }
+
+
+# ################ Parcial #1 (pulp) ################
+def _cargar_modulo(nombre: str, ruta: str):
+    spec = importlib.util.spec_from_file_location(nombre, ruta)
+    modulo = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(modulo)
+    return modulo
+
+def _cargar_resolverPL():
+    """Parcial#1/Solver.py importa su propio 'Parser' (homónimo del de este parcial): se carga por ruta."""
+    dir1 = os.path.join(os.path.dirname(DIR_PARCIAL), "Parcial#1")
+    previo = sys.modules.get("Parser")
+    try:
+        sys.modules["Parser"] = _cargar_modulo("Parcial1_Parser", os.path.join(dir1, "Parser.py"))
+        return _cargar_modulo("Parcial1_Solver", os.path.join(dir1, "Solver.py")).resolverPL
+    finally:
+        if previo is not None:
+            sys.modules["Parser"] = previo
+        else:
+            sys.modules.pop("Parser", None)
+
+def _resolver_pulp(problema: dict) -> dict:
+    """Parcial#1: sólo problemas de 2 variables, escritos como 'ax+by <= c'."""
+    try:
+        resolverPL = _cargar_resolverPL()
+    except ImportError as e:
+        return {"status": "no_disponible", "iterations": None, "solution": None, "error": str(e)}
+    fo = Parsear(problema["funcion_objetivo"])
+    parsed = parse_many(problema["restricciones"], densa=True)
+    if max(fo["max_var"], parsed["max_var"]) > 1:
+        return {"status": "no_disponible", "iterations": None, "solution": None,
+                "error": "resolverPL sólo admite 2 variables"}
+
+    def xy(coef) -> str:
+        a, b = (list(coef) + [0.0, 0.0])[:2]
+        return f"{a:g}x{b:+g}y"
+
+    coef = np.zeros((len(parsed["operadores"]), 2))
+    coef[:, :parsed["coef"].shape[1]] = parsed["coef"]
+    restricciones = [f"{xy(fila)}{op}{c:g}" for fila, op, c in zip(coef, parsed["operadores"], parsed["constantes"])]
+    salida = resolverPL(xy(fo["coef"]), restricciones, problema["modo"])
+    estado = {"Optimal": "optimal", "Infeasible": "infeasible", "Unbounded": "unbounded"}.get(salida["estado"], salida["estado"])
+    solucion = {"x1": salida["x"], "x2": salida["y"], "Z": salida["z"]} if estado == "optimal" else None
+    return {"status": estado, "iterations": None, "solution": solucion}
+
+
+# ################ Mediciones ################
+def _ejecutar(problema: dict, solver: str, max_iter: int, sparse: bool) -> dict:
+    """Una corrida; los avisos que los solvers imprimen por consola se descartan."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        if solver != "pulp":
+            return resolver_instancia(problema, solver, max_iter, sparse)
+        inicio = time.perf_counter()
+        resultado = _resolver_pulp(problema)
+        resultado["tiempo"] = time.perf_counter() - inicio
+        return resultado
+
+def medir(problema: dict, solver: str, repeticiones: int = 3, max_iter: int = 5000,
+          sparse: bool = False, memoria: bool = True) -> dict:
+    """
+    Resuelve el problema `repeticiones` veces y devuelve una fila del informe:
+    status y pivotes de la primera corrida, tiempo mínimo y medio, y memoria pico (KiB)
+    de una corrida extra bajo tracemalloc.
+    """
+    tiempos = []
+    resultado = None
+    for _ in range(max(1, repeticiones)):
+        res = _ejecutar(problema, solver, max_iter, sparse)
+        tiempos.append(res["tiempo"])
+        resultado = resultado or res
+        if res["status"] in ("error", "no_disponible"):
+            break
+
+    pico = None
+    if memoria and resultado["status"] not in ("error", "no_disponible") and solver != "pulp":
+        tracemalloc.start()
+        try:
+            _ejecutar(problema, solver, max_iter, sparse)
+            pico = tracemalloc.get_traced_memory()[1] / 1024.0
+        finally:
+            tracemalloc.stop()
+
+    solucion = resultado.get("solution") or {}
+    return {
+        "tipo": problema.get("tipo", ""),
+        "solver": solver,
+        "esperado": problema.get("esperado", ""),
+        "status": resultado["status"],
+        "pivotes": resultado.get("iterations"),
+        "tiempo_min": min(tiempos),
+        "tiempo_medio": sum(tiempos) / len(tiempos),
+        "memoria_pico_kib": pico,
+        "Z": solucion.get("Z"),
+        "error": resultado.get("error") or resultado.get("message"),
+    }
+
+def ejecutar_banco(tamanos: list[tuple[int, int]], tipos: list[str] = TIPOS, solvers: list[str] = SOLVERS,
+                   instancias: int = 1, repeticiones: int = 3, semilla: int = 0, densidad: float = 1.0,
+                   frac_mayor: float = 0.0, max_iter: int = 5000, sparse: bool = False, memoria: bool = True):
+    """Generador de filas del informe: una por (tamaño, tipo, instancia, solver)."""
+    for m, n in tamanos:
+        for tipo in tipos:
+            for k in range(instancias):
+                problema = generar_lp(m, n, tipo, semilla + k, densidad, frac_mayor)
+                for solver in solvers:
+                    fila = {"tamano": f"{m}x{n}", "instancia": k}
+                    fila.update(medir(problema, solver, repeticiones, max_iter, sparse, memoria))
+                    yield fila
+
+
+# ################ Informe ################
+def escribir_informe(filas: list[dict], ruta: str):
+    """CSV si la ruta termina en .csv; JSON (lista de filas) en otro caso."""
+    with open(ruta, "w", encoding="utf-8", newline="") as f:
+        if ruta.lower().endswith(".csv"):
+            w = csv.DictWriter(f, fieldnames=CAMPOS)
+            w.writeheader()
+            w.writerows(filas)
+        else:
+            json.dump(filas, f, ensure_ascii=False, indent=2)
+
+def _tamano(texto: str) -> tuple[int, int]:
+    try:
+        m, n = texto.lower().split("x")
+        return int(m), int(n)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Tamaño inválido '{texto}' (se espera MxN, p. ej. 20x30)")
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Banco de pruebas de los solvers de PL.")
+    ap.add_argument("--tamanos", nargs="+", type=_tamano, default=[(2, 2), (10, 10), (30, 40)],
+                    help="Tamaños MxN (restricciones x variables)")
+    ap.add_argument("--tipos", nargs="+", choices=TIPOS, default=TIPOS)
+    ap.add_argument("--solvers", nargs="+", choices=SOLVERS, default=SOLVERS)
+    ap.add_argument("--instancias", type=int, default=1, help="Problemas generados por tamaño y tipo")
+    ap.add_argument("--repeticiones", type=int, default=3, help="Corridas cronometradas por problema")
+    ap.add_argument("--semilla", type=int, default=0)
+    ap.add_argument("--densidad", type=float, default=1.0, help="Fracción de coeficientes no nulos de A")
+    ap.add_argument("--frac-mayor", type=float, default=0.0, help="Fracción de restricciones >=")
+    ap.add_argument("--max-iter", type=int, default=5000)
+    ap.add_argument("--sparse", action="store_true", help="Guardar A en formato disperso (CSC)")
+    ap.add_argument("--sin-memoria", action="store_true", help="No medir la memoria pico")
+    ap.add_argument("--salida", default="benchmark.csv", help="Informe .csv o .json")
+    args = ap.parse_args(argv)
+
+    filas = []
+    for fila in ejecutar_banco(args.tamanos, args.tipos, args.solvers, args.instancias, args.repeticiones,
+                               args.semilla, args.densidad, args.frac_mayor, args.max_iter, args.sparse,
+                               not args.sin_memoria):
+        filas.append(fila)
+        pivotes = "-" if fila["pivotes"] is None else fila["pivotes"]
+        print(f"{fila['tamano']:>9} {fila['tipo']:<11} #{fila['instancia']} {fila['solver']:<12} "
+              f"{fila['status']:<15} pivotes={pivotes:<6} t={fila['tiempo_min']:.4f}s", file=sys.stderr)
+    escribir_informe(filas, args.salida)
+    print(f"Informe con {len(filas)} filas escrito en {args.salida}.", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
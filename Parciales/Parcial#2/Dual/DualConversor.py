@@ -7,8 +7,10 @@ import numpy as np
 # ################ Parser Interno ################
 def Parsear(expresion: str) -> dict:
     """
-    Parsea una restricción o función objetivo con hasta 10 variables.
-    Retorna: { 'coef': [...], 'operador': <=|>=|=|None, 'constante': float, 'max_var': int }
+    Parsea una restricción o función objetivo con cualquier número de variables.
+    Retorna: { 'coef': [...], 'terminos': [(idx, valor), ...], 'operador': <=|>=|=|None, 'constante': float, 'max_var': int }
+    'terminos' son los pares dispersos (índice, coeficiente) en orden de aparición; 'coef' es la
+    misma información como lista densa de al menos 10 posiciones.
     """
     match = re.search(r"(<=|>=|=)", expresion)
     if match:
@@ -21,7 +23,7 @@ def Parsear(expresion: str) -> dict:
         izquierda = expresion.strip()
         derecha = "0"
 
-    coef = [0.0] * 10
+    coef = {}  # índice -> coeficiente (tabla dispersa, sin límite de variables)
     max_idx = -1
 
     terminos = re.finditer(r"([+-]?\s*\d*(?:\.\d+)?)\s*([a-zA-Z]\d*)", izquierda)
@@ -38,8 +40,8 @@ def Parsear(expresion: str) -> dict:
         else:
             raise ValueError(f"Variable no reconocida: {var_str}")
 
-        if idx < 0 or idx >= 10:
-            raise ValueError(f"Variable fuera de rango (1..10): {var_str}")
+        if idx < 0:
+            raise ValueError(f"Variable fuera de rango (x1, x2, ...): {var_str}")
 
         if coef_str in ["", "+"]:
             valor = 1.0
@@ -48,7 +50,7 @@ def Parsear(expresion: str) -> dict:
         else:
             valor = float(coef_str)
 
-        coef[idx] += valor
+        coef[idx] = coef.get(idx, 0.0) + valor
         if idx > max_idx:
             max_idx = idx
 
@@ -57,7 +59,20 @@ def Parsear(expresion: str) -> dict:
     except ValueError:
         raise ValueError(f"Constante inválida: {derecha}")
 
-    return {"coef": coef, "operador": operador, "constante": constante, "max_var": max_idx}
+    pares = list(coef.items())
+    densa = [0.0] * max(10, max_idx + 1)
+    for idx, valor in pares:
+        densa[idx] = valor
+
+    return {"coef": densa, "terminos": pares, "operador": operador, "constante": constante, "max_var": max_idx}
+
+
+def fila_densa(parsed: dict, n_vars: int) -> list:
+    """Coeficientes de una expresión parseada como lista de largo n_vars."""
+    fila = [0.0] * n_vars
+    for idx, valor in parsed["terminos"]:
+        fila[idx] = valor
+    return fila
 
 
 # ################ Formato ################
@@ -155,7 +170,7 @@ class DualConversor:
         for r in restricciones:
             p = Parsear(r)
             # Filtrar no negatividad (xj >= 0 o <= 0 con constante 0)
-            nonzero_vars = [abs(c) > 1e-9 for c in p["coef"]]
+            nonzero_vars = [abs(c) > 1e-9 for _, c in p["terminos"]]
             if sum(nonzero_vars) == 1 and abs(p["constante"]) < 1e-9:
                 continue
             parsed_constraints.append(p)
@@ -171,8 +186,8 @@ class DualConversor:
 
         n_vars = max_idx + 1
 
-        c = parsed_fo["coef"][:n_vars]
-        A = [p["coef"][:n_vars] for p in parsed_constraints]
+        c = fila_densa(parsed_fo, n_vars)
+        A = [fila_densa(p, n_vars) for p in parsed_constraints]
         b = [p["constante"] for p in parsed_constraints]
         tipos = [p["operador"] for p in parsed_constraints]
 
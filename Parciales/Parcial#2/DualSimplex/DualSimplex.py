@@ -153,6 +153,9 @@ class DualSimplexApp(Screen):
             elif info["status"] == "infeasible":
                 self.notify("❌ El problema dual no tiene solución factible.", severity="error")
 
+            elif info["status"] == "unbounded":
+                self.notify("♾ El problema no es acotado (el óptimo depende de la cota artificial).", severity="error")
+
             elif info["status"] == "dual_infeasible":
                 self.notify("⚠ El problema no cumple con optimalidad dual inicial.", severity="warning")
 
@@ -8,9 +8,17 @@ import os
 
 # Importar el parser desde el directorio padre
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-from Parser import Parsear
+from Parser import Parsear, parse_many, TablaVariables
+from Precios import MotorPrecios
+from MatrizDispersa import MatrizCSC
+from Factorizacion import FactorizacionLU
 
 EPS = 1e-9
+TOL_HARRIS = 1e-9    # holgura de la primera pasada de Harris en la razón dual
+TOL_DUAL = 1e-7      # r_j > TOL_DUAL se considera pérdida de optimalidad dual (Harris admite hasta TOL_HARRIS)
+RECALCULO_CADA = 50  # pivotes con actualización incremental antes de recalcular xB, y, r y B^{-1}
+REGLAS_SALIDA = ("dantzig", "steepest")
+BIG_M = 1e6          # lado derecho de la cota artificial (relativo al mayor |b_i|)
 
 class SolverDualSimplex:
     """
@@ -22,6 +30,9 @@ class SolverDualSimplex:
     - Variable SALIENTE: la más negativa (infactible)
     - Variable ENTRANTE: por razón dual mínima
     
+    Si la base de holguras no es dual factible se agrega una cota artificial sum x_j <= M
+    (ver _agregar_cota_artificial) en lugar de devolver "dual_infeasible".
+
     Uso:
         solver = DualSimplexSolver()
         solver.initialize(modo, funcion_objetivo_str, restricciones_list)
@@ -29,7 +40,12 @@ class SolverDualSimplex:
             info = solver.iterate_one()
     """
 
-    def __init__(self):
+    def __init__(self, sparse: bool = False, cota_artificial: bool = True, regla_salida: str = "dantzig"):
+        if regla_salida not in REGLAS_SALIDA:
+            raise ValueError(f"Regla de salida desconocida: {regla_salida} (opciones: {', '.join(REGLAS_SALIDA)})")
+        self.sparse = sparse  # True: A se guarda en CSC (MatrizDispersa) en lugar de densa
+        self.regla_salida = regla_salida  # "dantzig": la más negativa; "steepest": mayor x_i^2 / ||e_i^T B^{-1}||^2
+        self.cota_artificial = cota_artificial  # False: sin optimalidad dual inicial se devuelve "dual_infeasible"
         self.reset()
 
     def reset(self):
@@ -38,11 +54,17 @@ class SolverDualSimplex:
         self.A = None
         self.b = None
         self.c = None
+        self.z0 = 0.0  # constante de la FO en la forma interna (Max)
         self.basis = []
         self.iteration = 0
         self.status_flag = "initialized"
         self.history = []
         self.phase = 2  # Dual Simplex trabaja directamente en fase II
+        self.signos = None  # -1 en las filas >= (se guardan multiplicadas por -1)
+        self.holguras = []  # columna de la holgura de cada fila (para reparar bases singulares)
+        self._estado = None  # xB, y, r, Z y B_inv de la base actual, actualizados en cada pivote
+        self.fila_cota = None  # fila de la cota artificial sum x_j <= M (None si no hizo falta)
+        self.pricing = MotorPrecios()  # máscara de no básicas + costos reducidos vectorizados
 
 
     # ################ Inicialización ################
@@ -55,84 +77,100 @@ class SolverDualSimplex:
         self.reset()
         self.modo = modo if modo in ("Max", "Min") else "Max"
 
-        # Parsear función objetivo
+        # Parsear función objetivo (la tabla asigna columnas en orden de índice: x1, x2, ...)
+        tabla = TablaVariables.ordenada([funcion_objetivo] + list(restricciones))
         if not any(op in funcion_objetivo for op in ("<=", ">=", "=")):
-            parsed_fo = Parsear(funcion_objetivo + " <= 0")
+            parsed_fo = Parsear(funcion_objetivo + " <= 0", tabla)
         else:
-            parsed_fo = Parsear(funcion_objetivo)
+            parsed_fo = Parsear(funcion_objetivo, tabla)
         
-        # Parsear restricciones
-        parsed_constraints = [Parsear(r) for r in restricciones]
+        # Parsear restricciones (tripletas dispersas en un solo paso)
+        parsed = parse_many(restricciones, tabla)
 
-        # Determinar número de variables originales
-        max_idx = parsed_fo.get("max_var", -1)
-        for p in parsed_constraints:
-            if p.get("max_var", -1) > max_idx:
-                max_idx = p["max_var"]
+        # Número de variables originales
+        n_orig = len(tabla)
         
-        if max_idx < 0:
+        if n_orig == 0:
             raise ValueError("No se detectaron variables en la entrada.")
 
-        n_orig = max_idx + 1
-        c_orig = parsed_fo["coef"][:n_orig]
+        c_orig = [0.0] * n_orig
+        for j, v in parsed_fo["terminos"]:
+            c_orig[j] = v
+
+        self._build(c_orig, list(tabla.nombres), parsed["filas"], parsed["columnas"], parsed["valores"],
+                    parsed["operadores"], parsed["constantes"])
 
-        # Construcción de la forma estándar
-        A_rows = []
+    def initialize_from_arrays(self, modo: str, c, A, tipos: list[str], b, var_names: list[str] = None,
+                               offset: float = 0.0):
+        """
+        Inicializa desde arreglos (sin parsear texto): c (n), A (m x n densa o MatrizCSC),
+        tipos (m operadores) y b (m); offset es la constante de la FO (se suma a Z).
+        Usado por los lectores MPS / LP (ArchivosModelo.py).
+        """
+        self.reset()
+        self.modo = modo if modo in ("Max", "Min") else "Max"
+        c = np.asarray(c, dtype=float)
+        if isinstance(A, MatrizCSC):
+            filas, columnas, valores = A.triplets()
+        else:
+            A = np.asarray(A, dtype=float).reshape(len(tipos), c.size)
+            filas, columnas = np.nonzero(A)
+            valores = A[filas, columnas]
+        if var_names is None:
+            var_names = [f"x{j+1}" for j in range(c.size)]
+        self.z0 = -offset if self.modo == "Min" else offset
+        self._build(c.tolist(), list(var_names), filas, columnas, valores, list(tipos), np.asarray(b, dtype=float))
+
+    def _build(self, c_orig, var_names, filas, columnas, valores, operadores, constantes):
+        """Forma estándar con una holgura básica por fila (las filas >= se multiplican por -1)."""
         b = []
-        var_names = [f"x{i+1}" for i in range(n_orig)]
+        signos = []
         c = list(c_orig)
         basis = []
         s_count = 0
 
         # Procesar restricciones y añadir variables de holgura
-        for ridx, p in enumerate(parsed_constraints):
-            row = p["coef"][:n_orig]
-            oper = p["operador"]
-            rhs = p["constante"]
-
+        for oper, rhs in zip(operadores, np.asarray(constantes, dtype=float).tolist()):
             if oper == "<=":
                 # Añadir slack positivo
-                s_count += 1
-                row.extend([1.0])
-                var_names.append(f"s{s_count}")
-                c.append(0.0)
-                basis.append(len(c) - 1)
-            
+                signos.append(1.0)
             elif oper == ">=":
                 # Añadir surplus negativo (para >= multiplicamos por -1)
                 # Convertir: a1*x1 + a2*x2 >= b  →  -a1*x1 - a2*x2 + s = -b
-                row = [-coef for coef in row]
+                signos.append(-1.0)
                 rhs = -rhs
-                s_count += 1
-                row.extend([1.0])
-                var_names.append(f"s{s_count}")
-                c.append(0.0)
-                basis.append(len(c) - 1)
-            
-            elif oper == "=" or oper is None:
-                # Para igualdad, añadir artificial (en Dual Simplex necesitamos base inicial)
-                s_count += 1
-                row.extend([1.0])
-                var_names.append(f"s{s_count}")
-                c.append(0.0)
-                basis.append(len(c) - 1)
-            
+            elif oper == "=":
+                # Una holgura sola convertiría la igualdad en <=: se pide escribirla como dos filas
+                raise ValueError(f"Restricción {len(b) + 1}: el Dual Simplex no admite igualdades "
+                                 "(escribirla como un par <= / >=).")
+            elif oper is None:
+                signos.append(1.0)
             else:
                 raise ValueError(f"Operador no soportado: {oper}")
 
-            A_rows.append(row)
+            s_count += 1
+            var_names.append(f"s{s_count}")
+            c.append(0.0)
+            basis.append(len(c) - 1)
             b.append(rhs)
 
-        # Normalizar longitud de filas
-        n_total = len(c)
-        for i in range(len(A_rows)):
-            if len(A_rows[i]) < n_total:
-                A_rows[i].extend([0.0] * (n_total - len(A_rows[i])))
+        # A como tripletas fila/columna/valor: no ceros de las variables originales + holgura de cada fila
+        m = len(b)
+        filas = np.asarray(filas, dtype=np.int64)
+        rows_idx = np.concatenate([filas, np.arange(m)])
+        cols_idx = np.concatenate([np.asarray(columnas, dtype=np.int64), np.array(basis, dtype=np.int64)])
+        vals = np.concatenate([np.asarray(valores, dtype=float) * np.array(signos)[filas], np.ones(m)])
 
-        # Guardar estructuras
+        # Guardar estructuras: CSC si se pidió almacenamiento disperso, densa en otro caso
+        shape = (m, len(c))
         self.var_names = var_names
-        self.A = np.array(A_rows, dtype=float)
+        if self.sparse:
+            self.A = MatrizCSC.from_triplets(rows_idx, cols_idx, vals, shape)
+        else:
+            self.A = np.zeros(shape)
+            self.A[rows_idx, cols_idx] = vals
         self.b = np.array(b, dtype=float)
+        self.signos = np.array(signos, dtype=float)
         
         # Convertir a Max interno si es Min
         if self.modo == "Min":
@@ -141,32 +179,127 @@ class SolverDualSimplex:
             self.c = np.array(c, dtype=float)
 
         self.basis = basis.copy()
+        self.holguras = basis.copy()  # holgura de cada fila (coeficiente +1)
         self.iteration = 0
         self.status_flag = "ready"
 
-        # Verificar optimalidad dual inicial
-        if not self.check_dual_feasibility():
-            print("⚠️ Advertencia: el problema no tiene optimalidad dual inicial (r_j > 0 para alguna variable no básica).")
+        # Verificar optimalidad dual inicial (si falta, se fuerza con la cota artificial)
+        if not self.check_dual_feasibility() and self.cota_artificial:
+            self._agregar_cota_artificial()
+        elif not self.check_dual_feasibility():
+            print("⚠️ Advertencia: el problema no tiene optimalidad dual inicial (r_j > 0 para alguna variable no básica).", file=sys.stderr)
+
+
+
+    def _agregar_cota_artificial(self):
+        """
+        Arranque dual factible: agrega la fila sum_j x_j + sM = M sobre las variables originales y
+        hace un pivote en ella con la entrante de mayor r_j. Como todas las columnas con r_j > 0
+        están en esa fila con coeficiente 1, después del pivote r_j - r_q <= 0 para todas.
+        Cuando sM entra a la base la cota deja de influir (su precio sombra es 0) y se quita
+        (_quitar_cota). Si se llega al óptimo con sM no básica y precio sombra > 0, el óptimo
+        depende de M: el modelo original es no acotado.
+        """
+        m, n = self.A.shape
+        originales = np.setdiff1d(np.arange(n), self.holguras)
+        M = BIG_M * max(1.0, float(np.abs(self.b).max()) if m else 1.0)
+        k = originales.size
+        if self.sparse:
+            self.A = self.A.agregar_filas(np.full(k + 1, m), np.append(originales, n), np.ones(k + 1), (m + 1, n + 1))
+        else:
+            A = np.zeros((m + 1, n + 1))
+            A[:m, :n] = self.A
+            A[m, originales] = 1.0
+            A[m, n] = 1.0
+            self.A = A
+        self.b = np.append(self.b, M)
+        self.c = np.append(self.c, 0.0)
+        self.signos = np.append(self.signos, 1.0)
+        self.var_names.append("sM")
+        self.holguras.append(n)
+        self.basis.append(n)
+        self.fila_cota = m
+        self._estado = None
+
+        # Pivote sobre la fila de la cota: entra la de mayor costo reducido
+        _, _, B_inv = self._compute_current_solution()
+        r = self._reduced_costs(B_inv)
+        entering = int(np.argmax(np.where(self.pricing.nonbasic, r, -np.inf)))
+        self.basis[m] = entering
+        self.pricing.pivot(m, entering, n)
+        self._estado = None
+
+    def _quitar_cota(self):
+        """
+        Elimina la fila y la columna de la cota artificial cuando sM es básica. Como su columna es
+        e_fila, B sin esa fila ni esa columna sigue siendo invertible, y los costos reducidos no
+        cambian (y_fila = 0), así que la base sigue siendo dual factible. Se evita además arrastrar
+        valores del orden de M en xB.
+        """
+        fila, sM = self.fila_cota, self.holguras[self.fila_cota]
+        filas = [i for i in range(self.A.shape[0]) if i != fila]
+        cols = [j for j in range(self.A.shape[1]) if j != sM]
+        if isinstance(self.A, MatrizCSC):
+            self.A = self.A.take(rows=filas, cols=cols)
+        else:
+            self.A = self.A[np.ix_(filas, cols)]
+        self.b = np.delete(self.b, fila)
+        self.c = np.delete(self.c, sM)
+        self.signos = np.delete(self.signos, fila)
+        del self.var_names[sM]
+        del self.holguras[fila]
+        self.basis.remove(sM)
+        self.fila_cota = None
+        self._estado = None
+
+    def _cota_activa(self):
+        """True si la cota artificial limita el óptimo actual (sM no básica con precio sombra > 0)."""
+        if self.fila_cota is None:
+            return False
+        _, _, B_inv = self._compute_current_solution()
+        y = self.c[self.basis].dot(B_inv)
+        return y[self.fila_cota] > EPS
+
 
+    # ################ Acceso a A (densa o CSC) ################
+    def _col(self, j):
+        """Columna a_j como vector denso"""
+        return self.A.column(j) if isinstance(self.A, MatrizCSC) else self.A[:, j]
+
+    def _cols(self, idx):
+        """Bloque denso A[:, idx]"""
+        return self.A.columns(idx) if isinstance(self.A, MatrizCSC) else self.A[:, idx]
+
+    def _yA(self, y):
+        """Producto y^T A"""
+        return self.A.rmatvec(y) if isinstance(self.A, MatrizCSC) else y.dot(self.A)
 
 
     # ################ Cálculos Internos ################
     def _get_B_and_inv(self):
         """Obtiene matriz básica B y su inversa"""
         m = self.A.shape[0]
-        Bcols = [self.A[:, j] for j in self.basis]
-        B = np.column_stack(Bcols) if len(Bcols) > 0 else np.zeros((m, 0))
+        B = self._cols(self.basis) if len(self.basis) > 0 else np.zeros((m, 0))
         
         try:
             B_inv = np.linalg.inv(B) if B.size > 0 else np.zeros((m, m))
         except np.linalg.LinAlgError:
-            B_inv = np.linalg.pinv(B)
+            # Base singular: las columnas dependientes se cambian por la holgura de una fila sin pivote
+            factor = FactorizacionLU(B, logicas=np.ones(m))
+            for pos, fila in factor.reparadas:
+                self.basis[pos] = self.holguras[fila]
+            B = self._cols(self.basis)
+            B_inv = factor.inverse()
         
         return B, B_inv
 
 
     def _compute_current_solution(self):
-        """Calcula solución básica actual"""
+        """Calcula solución básica actual (xB, Z, B_inv); si la base no cambió por fuera de los
+        pivotes se devuelve el estado mantenido por _actualizar_estado sin recalcular nada."""
+        estado = self._estado
+        if estado is not None and estado["basis"] == self.basis:
+            return estado["xB"], estado["Z"], estado["B_inv"]
         B, B_inv = self._get_B_and_inv()
         
         if B_inv.size == 0:
@@ -175,52 +308,59 @@ class SolverDualSimplex:
             xB = B_inv.dot(self.b)
         
         # Calcular valor objetivo
-        cB = np.array([self.c[j] for j in self.basis]) if len(self.basis) > 0 else np.zeros(0)
-        Z = float(cB.dot(xB)) if xB.size > 0 else 0.0
-        
+        cB = self.c[self.basis] if len(self.basis) > 0 else np.zeros(0)
+        Z = (float(cB.dot(xB)) if xB.size > 0 else 0.0) + self.z0
+        y = cB.dot(B_inv) if cB.size > 0 else np.zeros(B_inv.shape[0])
+        self._estado = {"basis": list(self.basis), "xB": xB, "Z": Z, "B_inv": B_inv, "y": y, "r": None,
+                        "pesos": None, "pivotes": 0}
         return xB, Z, B_inv
 
 
     def _reduced_costs(self, B_inv):
-        """Calcula costos reducidos"""
+        """Calcula costos reducidos r = c - y^T A en un solo producto matriz-vector
+        (o los devuelve ya actualizados si B_inv es la del estado vigente)"""
         m = self.A.shape[0]
-        n = self.A.shape[1]
-        
-        cB = np.array([self.c[j] for j in self.basis]) if len(self.basis) > 0 else np.zeros(0)
+        self.pricing.sync(self.basis, self.A.shape[1])
+        estado = self._estado
+        if estado is not None and estado["B_inv"] is B_inv and estado["basis"] == self.basis:
+            if estado["r"] is None:
+                estado["r"] = self.pricing.reduced_costs(self.A, self.c, estado["y"])
+            return estado["r"]
+        cB = self.c[self.basis] if len(self.basis) > 0 else np.zeros(0)
         yT = cB.dot(B_inv) if B_inv is not None and cB.size > 0 else np.zeros((m,))
-        
-        r = np.zeros(n)
-        for j in range(n):
-            if j in self.basis:
-                r[j] = 0.0
-            else:
-                a_j = self.A[:, j]
-                r[j] = self.c[j] - yT.dot(a_j)
-        
-        return r
+        return self.pricing.reduced_costs(self.A, self.c, yT)
 
 
     # ################ Método Dual Simplex: Selección de Variables ################
     def _choose_leaving_dual(self, xB):
         """
-        REGLA DUAL: Variable SALIENTE es la básica MÁS NEGATIVA (infactible)
+        REGLA DUAL: Variable SALIENTE entre las básicas infactibles (x_i < 0)
+        - "dantzig": la MÁS NEGATIVA
+        - "steepest": la de mayor x_i^2 / w_i con w_i = ||e_i^T B^{-1}||^2 (steepest-edge dual)
+        Empates: la de menor fila.
         Retorna: (índice en basis, valor de la variable)
         """
-        min_val = 0
-        leaving_row = None
-        
-        for i, val in enumerate(xB):
-            if val < min_val - EPS:  # Buscar la más negativa
-                min_val = val
-                leaving_row = i
-        
-        if leaving_row is None:
+        xB = np.asarray(xB, dtype=float)
+        infactibles = xB < -EPS
+        if not infactibles.any():
             return None, None
-        
+        if self.regla_salida == "steepest":
+            puntaje = np.where(infactibles, xB ** 2 / self._pesos_duales(), -1.0)
+        else:
+            puntaje = np.where(infactibles, -xB, -1.0)
+        leaving_row = int(np.argmax(puntaje))
         return leaving_row, self.basis[leaving_row]
 
+    def _pesos_duales(self):
+        """Pesos w_i = ||e_i^T B^{-1}||^2 de la base actual: exactos al recalcular el estado y
+        actualizados en cada pivote por _actualizar_estado."""
+        estado = self._estado
+        if estado["pesos"] is None:
+            estado["pesos"] = (estado["B_inv"] ** 2).sum(axis=1)
+        return estado["pesos"]
+
 
-    def _choose_entering_dual(self, B_inv, leaving_row, r):
+    def _choose_entering_dual(self, B_inv, leaving_row, r, y_kj=None):
         """
         REGLA DUAL: Variable ENTRANTE por razón dual mínima
         
@@ -235,33 +375,38 @@ class SolverDualSimplex:
         Si minimizando:
             - Considerar j donde y_kj > 0  
             - Elegir j que minimiza |r_j / y_kj|
+
+        Prueba de razón de Harris en dos pasadas (en modelos degenerados muchas razones empatan
+        en 0 y la mínima exacta suele caer en un pivote chico):
+            1) theta_max = min_j (|r_j| + TOL_HARRIS) / |y_kj|
+            2) entre las j con |r_j| / |y_kj| <= theta_max, la de mayor |y_kj| (menor índice en empates)
+        Los r_j pueden quedar positivos hasta TOL_HARRIS; _iterate tolera hasta TOL_DUAL.
+
+        y_kj: fila k del tableau si ya se calculó
         """
         if leaving_row is None:
             return None
         
-        # Obtener fila k de B_inv (multiplicadores para restricción k)
-        y_k = B_inv[leaving_row, :]
-        
-        # Calcular productos y_kj para cada columna no básica
-        n = self.A.shape[1]
-        nonbas = [j for j in range(n) if j not in self.basis]
-        
-        ratios = []
-        for j in nonbas:
-            a_j = self.A[:, j]
-            y_kj = y_k.dot(a_j)
-            
-            # Regla según optimización (internamente siempre Max por conversión)
-            if y_kj < -EPS:  # Para Max, necesitamos y_kj < 0
-                ratio = abs(r[j] / y_kj)
-                ratios.append((ratio, j, y_kj))
-        
-        if not ratios:
+        # Fila k del tableau: y_kj = (fila k de B_inv) · a_j para todas las columnas en un solo producto.
+        # La razón dual tiene que recorrer todas las no básicas (un bloque parcial podría romper la
+        # optimalidad dual), así que aquí no se usan precios parciales.
+        if y_kj is None:
+            y_kj = self._yA(B_inv[leaving_row, :])
+        nonbasic = self.pricing.sync(self.basis, len(r))
+
+        # Regla según optimización (internamente siempre Max por conversión): y_kj < 0
+        candidatos = np.flatnonzero(nonbasic & (y_kj < -EPS))
+        if candidatos.size == 0:
             return None
-        
-        # Elegir la razón mínima (regla de Bland para desempate)
-        ratios.sort(key=lambda x: (x[0], x[1]))
-        return ratios[0][1]  # índice de variable entrante
+
+        # |r_j| con los r_j levemente positivos (dentro de la tolerancia) tomados como 0
+        dist = np.maximum(-r[candidatos], 0.0)
+        alpha = -y_kj[candidatos]
+        theta_max = ((dist + TOL_HARRIS) / alpha).min()
+        # Segunda pasada: el pivote más grande entre las razones que no superan theta_max;
+        # argmax devuelve el menor índice en empates
+        admisibles = dist / alpha <= theta_max
+        return int(candidatos[admisibles][np.argmax(alpha[admisibles])])  # índice de variable entrante
 
 
     # ################ Iteración Dual Simplex ################
@@ -274,8 +419,14 @@ class SolverDualSimplex:
         4. Elegir variable entrante (razón dual mínima)
         5. Pivotear
         """
+        return self._iterate(snapshot=True, record=True)
+
+    def _iterate(self, snapshot: bool = True, record: bool = True):
+        """Cuerpo de iterate_one. snapshot=False evita construir el tableau y record=False no guarda historial"""
         if self.status_flag in ("optimal", "unbounded", "infeasible"):
             return {"status": self.status_flag}
+        if self.fila_cota is not None and self._columna_cota() in self.basis:
+            self._quitar_cota()
 
         # Calcular solución actual
         xB, Z, B_inv = self._compute_current_solution()
@@ -284,7 +435,7 @@ class SolverDualSimplex:
         # VERIFICAR OPTIMALIDAD DUAL (costos reducidos correctos)
         # Para Max: todos r_j <= 0 para no básicas
         # (Internamente siempre trabajamos como Max)
-        dual_optimal = all(r[j] <= EPS for j in range(len(r)) if j not in self.basis)
+        dual_optimal = not np.any(r > TOL_DUAL)
         
         if not dual_optimal:
             self.status_flag = "dual_infeasible"
@@ -297,6 +448,11 @@ class SolverDualSimplex:
         # VERIFICAR FACTIBILIDAD PRIMAL (todas básicas >= 0)
         primal_feasible = all(xB[i] >= -EPS for i in range(len(xB)))
         
+        if primal_feasible and self._cota_activa():
+            # El óptimo depende de la cota artificial M: el modelo original no es acotado
+            self.status_flag = "unbounded"
+            return {"status": "unbounded", "iteration": self.iteration, "Z": Z}
+
         if primal_feasible:
             # ¡ÓPTIMO! Tenemos optimalidad dual Y factibilidad primal
             self.status_flag = "optimal"
@@ -304,7 +460,7 @@ class SolverDualSimplex:
                 "status": "optimal",
                 "iteration": self.iteration,
                 "Z": Z,
-                "snapshot": self.get_tableau_display()
+                "snapshot": self.get_tableau_display() if snapshot else None
             }
 
         # PASO DUAL: Elegir variable SALIENTE (la más negativa)
@@ -316,7 +472,8 @@ class SolverDualSimplex:
             return {"status": "error", "message": "No se encontró variable saliente"}
 
         # PASO DUAL: Elegir variable ENTRANTE (razón dual mínima)
-        entering = self._choose_entering_dual(B_inv, leaving_row, r)
+        y_kj = self._yA(B_inv[leaving_row, :])  # fila del pivote en el tableau
+        entering = self._choose_entering_dual(B_inv, leaving_row, r, y_kj)
         
         if entering is None:
             # No hay variable entrante válida → problema infactible
@@ -328,13 +485,15 @@ class SolverDualSimplex:
                 "leaving": self.basis[leaving_row]
             }
 
-        # PIVOTEAR: Reemplazar básica
+        # PIVOTEAR: Reemplazar básica (y actualizar xB, y, r, Z y B_inv con el paso theta)
+        primal_infeasibility = float(xB.min())
         leaving_index = self.basis[leaving_row]
+        self._actualizar_estado(leaving_row, entering, y_kj)
         self.basis[leaving_row] = entering
+        self.pricing.pivot(leaving_row, entering, leaving_index)
 
         # Actualizar iteración
         self.iteration += 1
-        snapshot = self.get_tableau_display()
         
         info = {
             "status": "continue",
@@ -344,14 +503,92 @@ class SolverDualSimplex:
             "leaving": leaving_index,
             "leaving_name": self.var_names[leaving_index] if 0 <= leaving_index < len(self.var_names) else str(leaving_index),
             "Z": float(Z),
-            "snapshot": snapshot,
-            "primal_infeasibility": float(min(xB)),  # Qué tan infactible estamos
+            "snapshot": self.get_tableau_display() if snapshot else None,
+            "primal_infeasibility": primal_infeasibility,  # Qué tan infactible estamos
         }
         
-        self.history.append(info)
+        if record:
+            self.history.append(info)
         return info
 
 
+    def _actualizar_estado(self, row, entering, y_kj):
+        """
+        Actualización incremental tras el pivote (fila row, entrante q), con d = B^{-1} a_q y la fila
+        del pivote del tableau y_kj, en O(m) para xB / y, O(n) para r y O(m²) para B^{-1}:
+            theta_p = xB_r / d_r:   xB <- xB - theta_p d,  xB_r <- theta_p,  Z <- Z + theta_p r_q
+            theta_d = r_q / d_r:    y <- y + theta_d (fila r de B^{-1}),  r <- r - theta_d y_kj
+        Con steepest-edge dual, los pesos w_i = ||rho_i||^2 (rho_i = fila i de B^{-1}, tau = B^{-1} rho_r):
+            w_r <- w_r / d_r^2,   w_i <- w_i - 2 (d_i / d_r) tau_i + (d_i / d_r)^2 w_r
+        Cada RECALCULO_CADA pivotes se descarta el estado para recalcularlo desde cero (deriva numérica).
+        """
+        estado = self._estado
+        B_inv, xB = estado["B_inv"], estado["xB"]
+        r = self._reduced_costs(B_inv)
+        d = B_inv.dot(self._col(entering))
+        piv = d[row]
+        theta_p = xB[row] / piv
+        theta_d = r[entering] / piv
+        estado["Z"] += theta_p * r[entering]
+        xB -= theta_p * d
+        xB[row] = theta_p
+        fila = B_inv[row, :] / piv
+        if estado["pesos"] is not None:
+            w, cociente = estado["pesos"], d / piv
+            tau = B_inv.dot(B_inv[row, :])
+            w_r = w[row]
+            w += cociente * (cociente * w_r - 2.0 * tau)
+            w[row] = w_r / piv ** 2
+            np.maximum(w, EPS, out=w)
+        estado["y"] += r[entering] * fila
+        r -= theta_d * y_kj
+        r[entering] = 0.0
+        B_inv -= np.outer(d, fila)
+        B_inv[row, :] = fila
+        estado["basis"][row] = entering
+        estado["pivotes"] += 1
+        if estado["pivotes"] >= RECALCULO_CADA:
+            self._estado = None
+
+
+    # ################ Resolución completa (sin interfaz) ################
+    def solve(self, max_iter: int = 1000, record_history: bool = False):
+        """
+        Itera hasta un estado final sin construir snapshots (uso por lotes, sin Textual/Rich).
+        Requiere initialize() previo.
+        Devuelve dict: {'status': 'optimal'|'infeasible'|'unbounded'|'dual_infeasible'|'error'|'iteration_limit',
+                        'iterations': k, 'solution': get_solution() si es óptimo, si no None}
+        """
+        if self.A is None:
+            raise RuntimeError("Debe llamar a initialize() antes de solve().")
+        status = "iteration_limit"
+        for _ in range(max_iter):
+            info = self._iterate(snapshot=False, record=record_history)
+            if info["status"] != "continue":
+                status = info["status"]
+                break
+        return {
+            "status": status,
+            "iterations": self.iteration,
+            "solution": self.get_solution() if status == "optimal" else None,
+        }
+
+
+    # ################ Cambios sobre la base óptima ################
+    def cambiar_rhs(self, fila: int, valor: float):
+        """
+        Cambia el lado derecho de la restricción 'fila' conservando la base óptima (sigue siendo
+        dual factible): el próximo solve() continúa con pivotes duales desde ella. También vale tras
+        un "infeasible" de esos pivotes (la base sigue siendo dual factible).
+        """
+        if self.status_flag not in ("optimal", "infeasible") or self.fila_cota is not None:
+            raise RuntimeError(f"El modelo tiene que estar resuelto con estado 'optimal' (estado: {self.status_flag}).")
+        self.b = self.b.copy()  # las iteraciones anteriores conservan su b
+        self.b[fila] = self.signos[fila] * valor
+        self._estado = None
+        self.status_flag = "ready"
+
+
     # ################ Estado y Solución ################
     def is_optimal(self):
         """Verifica si estamos en óptimo (dual óptimo Y primal factible)"""
@@ -362,7 +599,7 @@ class SolverDualSimplex:
         r = self._reduced_costs(B_inv)
         
         # Verificar optimalidad dual
-        dual_optimal = all(r[j] <= EPS for j in range(len(r)) if j not in self.basis)
+        dual_optimal = not np.any(r > TOL_DUAL)
         
         # Verificar factibilidad primal
         primal_feasible = all(xB[i] >= -EPS for i in range(len(xB)))
@@ -380,7 +617,7 @@ class SolverDualSimplex:
         tableau_rows = []
         for i in range(m):
             base_idx = self.basis[i]
-            row_i = B_inv[i, :].dot(self.A) if B_inv.size > 0 else np.zeros(n)
+            row_i = self._yA(B_inv[i, :]) if B_inv.size > 0 else np.zeros(n)
             rhs_val = xB[i] if i < len(xB) else 0.0
             
             tableau_rows.append({
@@ -419,12 +656,24 @@ class SolverDualSimplex:
         if self.modo == "Min":
             Z_val = -Z_val
         
-        sol = {self.var_names[i]: float(x[i]) for i in range(n)}
+        sol = {self.var_names[i]: float(x[i]) for i in range(n) if i != self._columna_cota()}
         sol["Z"] = float(Z_val)
         
         return sol
 
 
+    def get_duals(self):
+        """Precios sombra (y_i = dZ/db_i, en el sentido de la FO original) de cada restricción"""
+        _, _, B_inv = self._compute_current_solution()
+        y = self.c[self.basis].dot(B_inv) * self.signos
+        if self.fila_cota is not None:
+            y = np.delete(y, self.fila_cota)  # la cota artificial no es una restricción del modelo
+        return -y if self.modo == "Min" else y
+
+    def _columna_cota(self):
+        return None if self.fila_cota is None else self.holguras[self.fila_cota]
+
+
     def status(self):
         return self.status_flag
 
@@ -439,7 +688,7 @@ class SolverDualSimplex:
         r = self._reduced_costs(B_inv)
         
         # Para Max: todos r_j <= 0
-        return all(r[j] <= EPS for j in range(len(r)) if j not in self.basis)
+        return not np.any(r > EPS)
 
 
     def check_primal_feasibility(self):
@@ -0,0 +1,69 @@
+# Escalado.py
+# Escalado (equilibrado) de A antes de resolver: A' = R A S con R, S diagonales.
+# Pasadas alternadas de media geométrica por filas y por columnas (cada fila / columna se divide
+# por sqrt(max|a_ij| * min|a_ij|)) y al final un equilibrado de columnas a max|a_ij| ~ 1.
+# Los factores se redondean a potencias de 2: escalar y desescalar no agrega error de redondeo.
+#
+# Con A' = R A S el modelo escalado es b' = R b, c' = S c, x = S x', y = R y' (duales);
+# la función objetivo no cambia (c'^T x' = c^T x).
+#
+# Uso:
+#   R, S = factores_escala(filas, columnas, valores, (m, n))
+#   valores = valores * R[filas] * S[columnas]
+
+import numpy as np
+
+PASADAS = 8
+TOL_MEJORA = 0.1  # se corta cuando la dispersión log2(max/min) mejora menos que esto
+
+
+def _extremos(idx, l, k):
+    """max y min de l agrupado por idx (k grupos; -inf / inf en los grupos vacíos)"""
+    mx = np.full(k, -np.inf)
+    mn = np.full(k, np.inf)
+    np.maximum.at(mx, idx, l)
+    np.minimum.at(mn, idx, l)
+    return mx, mn
+
+
+def _centrar(idx, l, k):
+    """-(max + min) / 2 en log2 por grupo: la media geométrica de los extremos pasa a 1"""
+    mx, mn = _extremos(idx, l, k)
+    ok = np.isfinite(mx)
+    paso = np.zeros(k)
+    paso[ok] = -(mx[ok] + mn[ok]) / 2.0
+    return paso
+
+
+def factores_escala(filas, columnas, valores, shape, pasadas: int = PASADAS):
+    """
+    Factores de escala de filas (R, m) y columnas (S, n), potencias de 2, para las tripletas de A.
+    Filas o columnas sin no ceros quedan con factor 1.
+    """
+    m, n = shape
+    filas = np.asarray(filas, dtype=np.int64)
+    columnas = np.asarray(columnas, dtype=np.int64)
+    valores = np.asarray(valores, dtype=float)
+    nz = valores != 0.0
+    filas, columnas = filas[nz], columnas[nz]
+    logs = np.log2(np.abs(valores[nz]))
+    r = np.zeros(m)
+    s = np.zeros(n)
+    if logs.size == 0:
+        return np.ones(m), np.ones(n)
+
+    dispersion = logs.max() - logs.min()
+    for _ in range(pasadas):
+        r += _centrar(filas, logs + s[columnas], m)
+        s += _centrar(columnas, logs + r[filas], n)
+        l = logs + r[filas] + s[columnas]
+        nueva = l.max() - l.min()
+        if dispersion - nueva < TOL_MEJORA:
+            break
+        dispersion = nueva
+
+    # equilibrado final de columnas (con R ya redondeado): el mayor |a_ij| de cada columna queda cerca de 1
+    r = np.round(r)
+    mx, _ = _extremos(columnas, logs + r[filas], n)
+    s = np.where(np.isfinite(mx), -np.round(mx), 0.0)
+    return np.exp2(r), np.exp2(s)
@@ -0,0 +1,146 @@
+# Factorizacion.py
+# Factorización de la matriz básica B = LU con actualizaciones en forma producto (archivo eta).
+# Evita invertir B en cada pivote: se factoriza una vez y cada cambio de base añade un eta.
+
+import numpy as np
+
+EPS_PIVOTE = 1e-11
+REFACTOR_CADA = 50  # número de etas acumulados antes de refactorizar
+
+class FactorizacionLU:
+    """
+    Factorización de la base con archivo eta (forma producto de la inversa).
+    Uso:
+        <p>f = FactorizacionLU(B)<br/>
+        x = f.ftran(a)      # resuelve B x = a<br/>
+        y = f.btran(c)      # resuelve y^T B = c^T<br/>
+        f.update(r, d)      # la columna r de B se reemplaza; d = f.ftran(a_entrante)<p/>
+
+    - refactor(B): descarta los etas y vuelve a factorizar (O(m³), sólo cada REFACTOR_CADA pivotes).
+    - ftran / btran / update: O(m²) por la LU + O(m) por cada eta acumulado.
+    - Si B es singular lanza np.linalg.LinAlgError (igual que np.linalg.inv), salvo que se pase
+      logicas: entonces cada columna dependiente se reemplaza por la columna lógica (holgura) de una
+      fila sin pivote y el cambio queda en reparadas = [(posición en la base, fila)].
+    """
+
+    def __init__(self, B=None, refactor_cada: int = REFACTOR_CADA, logicas=None):
+        self.refactor_cada = refactor_cada
+        self.m = 0
+        self.LU = None        # L (unitaria, bajo la diagonal) y U (diagonal y encima) en una sola matriz
+        self.perm = None      # permutación de filas: B[perm] = L U
+        self.etas = []        # lista de (r, d) con d = B^{-1} a_entrante al momento del pivote
+        self.reparadas = []   # (posición, fila) de las columnas reemplazadas por lógicas en el último refactor
+        if B is not None:
+            self.refactor(B, logicas)
+
+
+    # ################ Factorización ################
+    def refactor(self, B, logicas=None):
+        """
+        Factoriza P B = L U con pivoteo parcial y limpia el archivo eta.
+        logicas (m): signo (+1 / -1) de la columna lógica de cada fila, 0 si la fila no tiene.
+        Una columna sin pivote aceptable es combinación de las anteriores: se reemplaza por
+        la lógica de una fila todavía sin pivote (reparación de la base).
+        """
+        LU = np.array(B, dtype=float, copy=True)
+        m = LU.shape[0]
+        perm = np.arange(m)
+        reparadas = []
+        for k in range(m):
+            p = k + int(np.argmax(np.abs(LU[k:, k])))
+            if abs(LU[p, k]) < EPS_PIVOTE:
+                libres = [] if logicas is None else np.flatnonzero(np.asarray(logicas)[perm[k:]] != 0)
+                if len(libres) == 0:
+                    raise np.linalg.LinAlgError("Matriz básica singular.")
+                # L^{-1} deja igual a e_fila si la fila no pivoteó: la columna eliminada es ±e_k
+                p = k + int(libres[0])
+                LU[[k, p], :] = LU[[p, k], :]
+                perm[[k, p]] = perm[[p, k]]
+                LU[:, k] = 0.0
+                LU[k, k] = logicas[perm[k]]
+                reparadas.append((k, int(perm[k])))
+                continue
+            if p != k:
+                LU[[k, p], :] = LU[[p, k], :]
+                perm[[k, p]] = perm[[p, k]]
+            LU[k+1:, k] /= LU[k, k]
+            # sólo las filas con multiplicador no nulo: con B dispersa (holguras, pocas columnas
+            # estructurales) casi todos los pasos tocan pocas filas o ninguna
+            filas = k + 1 + np.flatnonzero(LU[k+1:, k])
+            if filas.size == m - k - 1:
+                LU[k+1:, k+1:] -= np.outer(LU[k+1:, k], LU[k, k+1:])
+            elif filas.size:
+                LU[filas, k+1:] -= np.outer(LU[filas, k], LU[k, k+1:])
+        self.m = m
+        self.LU = LU
+        self.perm = perm
+        self.etas = []
+        self.reparadas = reparadas
+
+    def necesita_refactor(self):
+        return len(self.etas) >= self.refactor_cada
+
+
+    # ################ Resolución de sistemas ################
+    def ftran(self, a):
+        """Resuelve B x = a (a puede ser vector o matriz de columnas)."""
+        x = np.array(a, dtype=float, copy=True)
+        if self.m == 0:
+            return x
+        LU = self.LU
+        x = x[self.perm]
+        # L y = P a (L unitaria)
+        for k in range(self.m - 1):
+            if x.ndim == 1:
+                x[k+1:] -= LU[k+1:, k] * x[k]
+            else:
+                x[k+1:] -= np.outer(LU[k+1:, k], x[k])
+        # U x = y
+        for k in range(self.m - 1, -1, -1):
+            x[k] /= LU[k, k]
+            if k > 0:
+                if x.ndim == 1:
+                    x[:k] -= LU[:k, k] * x[k]
+                else:
+                    x[:k] -= np.outer(LU[:k, k], x[k])
+        # Aplicar los etas en orden: x_r = x_r / d_r ; x_i -= d_i x_r
+        for r, d in self.etas:
+            xr = x[r] / d[r]
+            if x.ndim == 1:
+                x -= d * xr
+            else:
+                x -= np.outer(d, xr)
+            x[r] = xr
+        return x
+
+    def btran(self, c):
+        """Resuelve y^T B = c^T (equivalente a c^T B^{-1})."""
+        y = np.array(c, dtype=float, copy=True)
+        if self.m == 0:
+            return y
+        # Aplicar los etas en orden inverso: y_r = (c_r - sum_{i!=r} c_i d_i) / d_r
+        for r, d in reversed(self.etas):
+            y[r] = (y[r] - (y.dot(d) - y[r] * d[r])) / d[r]
+        LU = self.LU
+        # U^T w = c
+        for k in range(self.m):
+            if k > 0:
+                y[k] -= LU[:k, k].dot(y[:k])
+            y[k] /= LU[k, k]
+        # L^T v = w
+        for k in range(self.m - 2, -1, -1):
+            y[k] -= LU[k+1:, k].dot(y[k+1:])
+        # P y = v
+        out = np.empty_like(y)
+        out[self.perm] = y
+        return out
+
+    def update(self, r, d):
+        """Registra el reemplazo de la columna r de la base (d = B^{-1} a_entrante)."""
+        if abs(d[r]) < EPS_PIVOTE:
+            raise np.linalg.LinAlgError("Pivote nulo al actualizar la factorización.")
+        self.etas.append((r, np.array(d, dtype=float, copy=True)))
+
+    def inverse(self):
+        """Materializa B^{-1} (sólo para visualización del tableau)."""
+        return self.ftran(np.eye(self.m))
@@ -0,0 +1,290 @@
+# Historial.py
+# Historial compacto de iteraciones del Simplex y vistas perezosas del tableau.
+# Cada pivote ocupa un registro de tamaño fijo en arreglos NumPy (entrante, saliente, fila, Z, razón);
+# la base de cualquier iteración retenida se reconstruye aplicando esos deltas sobre una base de control.
+
+import os
+from collections.abc import Mapping
+
+import numpy as np
+from Factorizacion import FactorizacionLU
+from MatrizDispersa import MatrizCSC
+
+# Un registro por pivote (~41 bytes): 10k pivotes ocupan ~400 KB
+DTYPE_REGISTRO = np.dtype([
+    ("iteration", np.int64),
+    ("entering", np.int32),
+    ("leaving", np.int32),
+    ("row", np.int32),
+    ("epoca", np.int32),    # modelo (A, b, c, nombres) vigente en el pivote
+    ("Z", np.float64),
+    ("ratio", np.float64),  # razón mínima (primal) o |r_j / alpha_j| (dual)
+    ("superior", np.int8),  # 1 si la saliente quedó en su cota superior (variables acotadas)
+])
+# row = -1 marca un cambio de cota: la entrante pasa de una cota a la otra sin cambiar la base
+CAPACIDAD_INICIAL = 64
+
+
+# ################ Snapshot perezoso del tableau ################
+class VistaTableau(Mapping):
+    """
+    Snapshot perezoso de una iteración: guarda sólo la base (y referencias al modelo de ese
+    momento) y arma B^{-1}A, RHS y costos reducidos la primera vez que se consulta.
+    Se usa como el dict de get_tableau_display(): {"var_names", "rows", "z_row"}.
+    Uso:
+        <p>vista = info["snapshot"]         # O(m) en memoria por iteración<br/>
+        vista["rows"]                      # materializa el tableau (una sola vez)<br/>
+        vista.materializar()               # dict completo<p/>
+    """
+    CLAVES = ("var_names", "rows", "z_row")
+
+    def __init__(self, A, b, c, var_names, basis, factor=None, cotas=None):
+        # A, b, c y var_names se reemplazan (no se modifican) al eliminar artificiales o en
+        # cambiar_rhs / cambiar_costo, así que basta con guardar las referencias de la iteración
+        self.A = A
+        self.b = b
+        self.c = c
+        self.var_names = var_names
+        self.basis = np.array(basis, dtype=np.int32)
+        # variables acotadas: (upper, en_superior, z0); las no básicas en su cota superior mueven el RHS
+        self.cotas = cotas
+        self._factor = factor
+        self._tabla = None
+
+    def materializar(self) -> dict:
+        if self._tabla is None:
+            self._tabla = self._construir()
+            self._factor = None
+        return self._tabla
+
+    def _construir(self) -> dict:
+        A, basis = self.A, self.basis
+        m, n = A.shape
+        factor = self._factor
+        if factor is None:
+            # las bases registradas ya fueron factorizadas (y reparadas si hacía falta) por el solver
+            factor = FactorizacionLU(A.columns(basis) if isinstance(A, MatrizCSC) else A[:, basis])
+        # B_inv * A completo con una sola resolución matricial sobre la factorización
+        if m == 0:
+            T = np.zeros((0, n))
+        elif isinstance(A, MatrizCSC):
+            T = A.rmatmat(factor.inverse())
+        else:
+            T = factor.ftran(A)
+        b, Z = self.b, 0.0
+        if self.cotas is not None:
+            upper, superior, z0 = self.cotas
+            xN = np.where(superior, upper, 0.0)
+            b = b - (A.matvec(xN) if isinstance(A, MatrizCSC) else A.dot(xN))
+            Z = float(np.dot(self.c, xN)) + z0
+        xB = factor.ftran(b) if m > 0 else np.zeros(0)
+        cB = self.c[basis]
+        Z += float(cB.dot(xB)) if xB.size > 0 else 0.0
+        # fila de costos reducidos r = c - y^T A (0 en las básicas)
+        y = factor.btran(cB) if m > 0 else np.zeros(0)
+        yA = A.rmatvec(y) if isinstance(A, MatrizCSC) else y.dot(A)
+        red_costs = np.asarray(self.c, dtype=float) - yA
+        red_costs[basis] = 0.0
+
+        names = self.var_names
+        rows = [{
+            "base_name": names[bidx] if 0 <= bidx < len(names) else f"b{bidx}",
+            "coeffs": T[i].tolist(),
+            "rhs": float(xB[i])
+        } for i, bidx in enumerate(basis)]
+        return {
+            "var_names": list(names),
+            "rows": rows,
+            "z_row": {"base_name": "Z", "coeffs": red_costs.tolist(), "rhs": Z}
+        }
+
+    def __getitem__(self, clave):
+        return self.materializar()[clave]
+
+    def __iter__(self):
+        return iter(self.CLAVES)
+
+    def __len__(self):
+        return len(self.CLAVES)
+
+
+# ################ Historial de pivotes ################
+class _Epoca:
+    """Modelo vigente entre cambios de estructura (p.ej. al eliminar artificiales) y su estado de control."""
+
+    def __init__(self, A, b, c, var_names, basis, cotas=None, superior=None):
+        self.A, self.b, self.c, self.var_names = A, b, c, var_names
+        self.cotas = cotas  # (upper, z0) si el modelo tiene variables acotadas
+        # estado antes del registro más viejo retenido de la época
+        self.basis = np.array(basis, dtype=np.int32)
+        self.superior = None if cotas is None else np.array(superior, dtype=bool)
+
+    def estado(self):
+        return self.basis.copy(), None if self.superior is None else self.superior.copy()
+
+
+def _aplicar(basis, superior, reg):
+    """Aplica el delta de un registro sobre (basis, superior)."""
+    row, entering = int(reg["row"]), int(reg["entering"])
+    if row < 0:
+        superior[entering] = not superior[entering]
+        return
+    basis[row] = entering
+    if superior is not None:
+        superior[entering] = False
+        superior[int(reg["leaving"])] = bool(reg["superior"])
+
+
+class HistorialIteraciones:
+    """
+    Historial de pivotes en arreglos NumPy preasignados, con retención acotada opcional.
+    capacidad=None crece sin límite (duplicando); con un entero funciona como buffer circular
+    y los registros desalojados se descartan o, si se pasa archivo, se agregan a ese archivo binario.
+    Uso:
+        <p>h = HistorialIteraciones(capacidad=1000, archivo="pivotes.bin")<br/>
+        h.registrar(k, entering, leaving, row, Z, ratio, (A, b, c, nombres), basis)<br/>
+        h[-1]                 # dict de la última iteración (snapshot = VistaTableau)<br/>
+        h.tableau(k)          # tableau materializado de la iteración k o None<br/>
+        h.registros()         # arreglo estructurado, del más viejo al más nuevo<br/>
+        HistorialIteraciones.leer_archivo("pivotes.bin")  # registros desalojados<p/>
+    """
+
+    def __init__(self, capacidad: int = None, archivo: str = None):
+        if capacidad is not None and capacidad < 1:
+            raise ValueError("La capacidad del historial debe ser positiva.")
+        self.capacidad = capacidad
+        self.archivo = archivo
+        self.limpiar()
+
+    def limpiar(self):
+        tam = self.capacidad if self.capacidad is not None else CAPACIDAD_INICIAL
+        self._datos = np.zeros(tam, dtype=DTYPE_REGISTRO)
+        self._inicio = 0     # posición del registro más viejo en el buffer
+        self._n = 0          # registros retenidos
+        self.total = 0       # registros recibidos (retenidos + desalojados)
+        self._epocas = []
+        if self.archivo is not None and os.path.exists(self.archivo):
+            open(self.archivo, "wb").close()  # no mezclar con pivotes de una resolución anterior
+
+    def __len__(self):
+        return self._n
+
+    # ---------------- Escritura ----------------
+    def registrar(self, iteration, entering, leaving, row, Z, ratio, modelo, basis,
+                  cotas=None, superior=None, sale_superior=False):
+        """
+        Agrega un pivote (row = -1: cambio de cota de la entrante). modelo = (A, b, c, var_names) vigente;
+        basis (y superior, la máscara de no básicas en cota superior) = estado ANTES del pivote.
+        cotas = (upper, z0) si hay variables acotadas; sale_superior: la saliente queda en su cota superior.
+        Se abre una época nueva cuando cambia el modelo (se compara por identidad de A, b y c).
+        """
+        A, b, c, var_names = modelo
+        ultima = self._epocas[-1] if self._epocas else None
+        if ultima is None or ultima.A is not A or ultima.b is not b or ultima.c is not c:
+            self._epocas.append(_Epoca(A, b, c, var_names, basis, cotas, superior))
+
+        if self._n == self._datos.size:
+            if self.capacidad is None:
+                self._crecer()
+            else:
+                self._desalojar()
+        pos = (self._inicio + self._n) % self._datos.size
+        self._datos[pos] = (iteration, entering, leaving, row, len(self._epocas) - 1, Z, ratio, sale_superior)
+        self._n += 1
+        self.total += 1
+
+    def _crecer(self):
+        datos = np.zeros(2 * self._datos.size, dtype=DTYPE_REGISTRO)
+        datos[:self._n] = self.registros()
+        self._datos, self._inicio = datos, 0
+
+    def _desalojar(self):
+        """Saca el registro más viejo: avanza el estado de control de su época y lo derrama a disco si corresponde."""
+        reg = self._datos[self._inicio]
+        epoca = self._epocas[reg["epoca"]]
+        _aplicar(epoca.basis, epoca.superior, reg)
+        if self.archivo is not None:
+            with open(self.archivo, "ab") as f:
+                self._datos[self._inicio:self._inicio + 1].tofile(f)
+        self._inicio = (self._inicio + 1) % self._datos.size
+        self._n -= 1
+        # las épocas anteriores a la del registro más viejo ya no se consultan: se sueltan sus matrices
+        if self._n > 0:
+            for e in self._epocas[:self._datos[self._inicio]["epoca"]]:
+                e.A = e.b = e.c = e.cotas = e.superior = None
+
+    # ---------------- Lectura ----------------
+    def registros(self):
+        """Arreglo estructurado (copia) con los registros retenidos en orden cronológico."""
+        idx = (self._inicio + np.arange(self._n)) % self._datos.size
+        return self._datos[idx]
+
+    def _posicion(self, i):
+        if i < 0:
+            i += self._n
+        if not 0 <= i < self._n:
+            raise IndexError("Índice fuera del historial retenido.")
+        return i
+
+    def _estado_en(self, i):
+        """Base (y máscara de cota superior) después del registro retenido i, reaplicando los deltas de su época."""
+        reg = self.registros()[:i + 1]
+        ep = int(reg[i]["epoca"])
+        basis, superior = self._epocas[ep].estado()
+        propios = reg[reg["epoca"] == ep]
+        if superior is None:
+            basis[propios["row"]] = propios["entering"]  # en orden: la última escritura de cada fila gana
+        else:
+            for r in propios:
+                _aplicar(basis, superior, r)
+        return basis, superior
+
+    def _item(self, reg, basis, superior):
+        epoca = self._epocas[int(reg["epoca"])]
+        names = epoca.var_names
+        entering, leaving = int(reg["entering"]), int(reg["leaving"])
+        cotas = None if epoca.cotas is None else (epoca.cotas[0], superior, epoca.cotas[1])
+        return {
+            "status": "continue",
+            "iteration": int(reg["iteration"]),
+            "entering": entering,
+            "entering_name": names[entering],
+            "leaving": leaving,
+            "leaving_name": names[leaving] if 0 <= leaving < len(names) else str(leaving),
+            "row": int(reg["row"]),
+            "bound_flip": int(reg["row"]) < 0,
+            "Z": float(reg["Z"]),
+            "ratio": float(reg["ratio"]),
+            "snapshot": VistaTableau(epoca.A, epoca.b, epoca.c, names, basis, cotas=cotas)
+        }
+
+    def __getitem__(self, i):
+        i = self._posicion(i)
+        return self._item(self._datos[(self._inicio + i) % self._datos.size], *self._estado_en(i))
+
+    def __iter__(self):
+        # recorrido incremental: una sola copia de los registros y un delta por paso
+        estados = {}
+        for reg in self.registros():
+            ep = int(reg["epoca"])
+            if ep not in estados:
+                estados[ep] = self._epocas[ep].estado()
+            basis, superior = estados[ep]
+            _aplicar(basis, superior, reg)
+            yield self._item(reg, basis.copy(), None if superior is None else superior.copy())
+
+    def buscar(self, k: int):
+        """Posición del registro con iteration == k entre los retenidos, o None."""
+        its = self.registros()["iteration"]
+        pos = int(np.searchsorted(its, k))
+        return pos if pos < its.size and its[pos] == k else None
+
+    def tableau(self, k: int):
+        """Tableau materializado de la iteración k (None si no se registró o ya fue desalojada)."""
+        pos = self.buscar(k)
+        return self[pos]["snapshot"].materializar() if pos is not None else None
+
+    @staticmethod
+    def leer_archivo(archivo: str):
+        """Registros derramados a disco (arreglo estructurado con DTYPE_REGISTRO)."""
+        return np.fromfile(archivo, dtype=DTYPE_REGISTRO)
@@ -0,0 +1,273 @@
+# Lote.py
+# Resolución por lotes (sin interfaz) de problemas de PL con los solvers del Parcial #2.
+# No importa Textual ni Rich: sólo los solvers, el parser y NumPy.
+#
+# Formato de los archivos de entrada (.json, .mps, .lp o texto plano, según la extensión):
+#   - .json : un problema o una lista de problemas con las claves de EjerciciosDemo
+#             {"modo": "Max", "funcion_objetivo": "3x1 + 5x2", "restricciones": ["x1 <= 4", ...]}
+#   - .mps / .lp : un modelo en MPS libre o CPLEX LP (ArchivosModelo.py), cargado directo en arreglos;
+#             sólo con los métodos "simplex" y "dualsimplex"
+#   - otro  : texto plano; cada problema empieza con "Max <FO>" o "Min <FO>" seguido de una
+#             restricción por línea. Los problemas se separan con una línea en blanco y '#' inicia comentario.
+#
+# Uso:
+#   python Lote.py modelos/*.txt --metodo simplex --max-iter 1000 --salida resultados.jsonl
+#   python Lote.py modelos/*.txt --procesos 8 --bloque 4     (en paralelo, resultados en orden de llegada)
+#   python Lote.py modelos/*.mps --presolve                  (reduce el modelo antes de resolver, ver Presolve.py)
+#   python Lote.py modelos/*.mps --escalar                   (equilibra A, b y c en 'simplex', ver Escalado.py)
+#
+# Los métodos "optimizer" (Parcial#2v2) y "dosfases" (Parcial#2p2) usan Rich internamente;
+# sólo se importan si se eligen y su salida por consola se descarta.
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+DIR_PARCIAL = os.path.abspath(os.path.dirname(__file__))
+sys.path.append(DIR_PARCIAL)
+from Simplex.SolverSimplex import SimplexSolver
+from Precios import REGLAS
+from DualSimplex.SolverDualSimplex import SolverDualSimplex
+from Parser import Parsear, parse_many, TablaVariables
+from ArchivosModelo import ModeloLP, leer_modelo
+from Presolve import presolve as reducir_modelo
+
+ENCABEZADO = re.compile(r"^(max|min)\s*:?\s*(.*)$", re.IGNORECASE)
+
+SOLVERS = {
+    "simplex": SimplexSolver,
+    "dualsimplex": SolverDualSimplex,
+}
+METODOS = sorted(SOLVERS) + ["dosfases", "optimizer"]
+
+
+# ################ Lectura de instancias ################
+def _leer_texto(ruta: str) -> list[dict]:
+    problemas = []
+    actual = None
+    with open(ruta, "r", encoding="utf-8") as f:
+        for nro, linea in enumerate(f, start=1):
+            linea = linea.split("#", 1)[0].strip()
+            if not linea:
+                if actual is not None:
+                    problemas.append(actual)
+                    actual = None
+                continue
+            if actual is None:
+                match = ENCABEZADO.match(linea)
+                if not match:
+                    raise ValueError(f"{ruta}:{nro}: se esperaba 'Max <FO>' o 'Min <FO>'.")
+                actual = {"modo": match.group(1).capitalize(), "funcion_objetivo": match.group(2).strip(), "restricciones": []}
+            else:
+                actual["restricciones"].append(linea)
+    if actual is not None:
+        problemas.append(actual)
+    return problemas
+
+def cargar_instancias(ruta: str) -> list[dict]:
+    """Lee todos los problemas de un archivo (.json, .mps, .lp o texto plano) y les asigna un nombre."""
+    if ruta.lower().endswith((".mps", ".lp")):
+        return [{"nombre": os.path.basename(ruta), "modelo": leer_modelo(ruta)}]
+    if ruta.lower().endswith(".json"):
+        with open(ruta, "r", encoding="utf-8") as f:
+            datos = json.load(f)
+        problemas = datos if isinstance(datos, list) else [datos]
+    else:
+        problemas = _leer_texto(ruta)
+    base = os.path.basename(ruta)
+    for k, p in enumerate(problemas, start=1):
+        p.setdefault("nombre", base if len(problemas) == 1 else f"{base}#{k}")
+    return problemas
+
+
+# ################ Adaptadores de los otros solvers ################
+def _resolver_dosfases(problema: dict) -> dict:
+    """Parcial#2p2/SimplexDosFases.metodo_dos_fases con la entrada ya parseada."""
+    sys.path.append(os.path.join(DIR_PARCIAL, "Parcial#2p2"))
+    from SimplexDosFases import metodo_dos_fases
+
+    tabla = TablaVariables.ordenada([problema["funcion_objetivo"]] + problema["restricciones"])
+    fo = Parsear(problema["funcion_objetivo"], tabla)
+    parsed = parse_many(problema["restricciones"], tabla, densa=True)
+    n = len(tabla)
+    z = [0.0] * n
+    for j, v in fo["terminos"]:
+        z[j] = v
+    A = np.zeros((len(parsed["operadores"]), n))
+    A[:, :parsed["coef"].shape[1]] = parsed["coef"]
+    stats = {"pivotes": 0}
+    with contextlib.redirect_stdout(io.StringIO()):
+        try:
+            salida = metodo_dos_fases(problema["modo"].upper(), z, A.tolist(), parsed["operadores"],
+                                      parsed["constantes"].tolist(), show_steps=False, stats=stats)
+        except RuntimeError as e:
+            if "ilimitado" in str(e):
+                return {"status": "unbounded", "iterations": stats["pivotes"], "solution": None}
+            raise
+    if salida is None:
+        return {"status": "infeasible", "iterations": stats["pivotes"], "solution": None}
+    solucion, z = salida
+    # X1..Xn son las columnas de la tabla; holguras y demás se renombran en minúsculas
+    nombres = {f"X{j + 1}": nombre for j, nombre in enumerate(tabla.nombres)}
+    solucion = {nombres.get(k, k.lower()): v for k, v in solucion.items()}
+    solucion["Z"] = z
+    return {"status": "optimal", "iterations": stats["pivotes"], "solution": solucion}
+
+def _resolver_optimizer(problema: dict) -> dict:
+    """Parcial#2v2/optimizer.Optimizer.solve_simplex (sólo restricciones <= con RHS >= 0)."""
+    sys.path.append(os.path.join(DIR_PARCIAL, "Parcial#2v2"))
+    from optimizer import Optimizer
+    from utils import parse_constraints, parse_objective_function
+
+    opt = Optimizer(parse_objective_function(problema["funcion_objetivo"]),
+                    parse_constraints(";".join(problema["restricciones"])),
+                    problema["modo"].lower(), verbose=False)
+    with contextlib.redirect_stdout(io.StringIO()):
+        salida = opt.solve_simplex()
+    if not salida or salida[0] is None:
+        return {"status": "error", "iterations": None, "solution": None,
+                "error": salida[2] if salida else "Optimizer no encontró solución"}
+    x, z, _ = salida
+    solucion = {name: float(v) for name, v in zip(opt.var_names, x)}
+    solucion["Z"] = float(z)
+    return {"status": "optimal", "iterations": opt.pivots, "solution": solucion}
+
+EXTERNOS = {
+    "dosfases": _resolver_dosfases,
+    "optimizer": _resolver_optimizer,
+}
+
+
+# ################ Resolución ################
+def resolver_instancia(problema: dict, metodo: str = "simplex", max_iter: int = 1000, sparse: bool = False,
+                       regla_precios: str = "bland", presolve: bool = False, escalar: bool = False) -> dict:
+    """Resuelve un problema con el solver indicado y devuelve un resultado serializable.
+    regla_precios y escalar sólo aplican a "simplex" (ver Precios.REGLAS y Escalado.py); con
+    "dualsimplex", regla_precios="steepest" elige la saliente por steepest-edge dual.
+    presolve: reduce el modelo antes de resolverlo (no aplica a los métodos externos); la solución
+    se devuelve con todas las variables originales y el resultado incluye las eliminaciones hechas.
+    Si el solver falla: status "error", el mensaje en "error" e iterations None."""
+    inicio = time.perf_counter()
+    resultado = {"nombre": problema.get("nombre", ""), "metodo": metodo}
+    try:
+        if metodo in EXTERNOS:
+            if "modelo" in problema:
+                raise ValueError(f"El método '{metodo}' sólo acepta problemas en texto (no .mps / .lp).")
+            resultado.update(EXTERNOS[metodo](problema))
+        else:
+            if metodo == "simplex":
+                solver = SimplexSolver(sparse=sparse, regla_precios=regla_precios, escalar=escalar)
+            elif metodo == "dualsimplex":
+                solver = SolverDualSimplex(sparse=sparse,
+                                           regla_salida="steepest" if regla_precios == "steepest" else "dantzig")
+            else:
+                solver = SOLVERS[metodo](sparse=sparse)
+            if presolve:
+                resultado.update(_resolver_reducido(solver, problema, max_iter))
+            elif "modelo" in problema:
+                problema["modelo"].cargar_en(solver)
+                resultado.update(solver.solve(max_iter=max_iter))
+            else:
+                solver.initialize(problema["modo"], problema["funcion_objetivo"], problema["restricciones"])
+                resultado.update(solver.solve(max_iter=max_iter))
+    except Exception as e:
+        resultado.update({"status": "error", "iterations": None, "solution": None, "error": str(e)})
+    resultado["tiempo"] = time.perf_counter() - inicio
+    return resultado
+
+def _resolver_reducido(solver, problema: dict, max_iter: int) -> dict:
+    """Presolve + resolución del modelo reducido + postsolve de la solución."""
+    modelo = problema.get("modelo") or ModeloLP.desde_texto(problema["modo"], problema["funcion_objetivo"],
+                                                            problema["restricciones"])
+    reducido, post = reducir_modelo(modelo)
+    if post.estado == "infeasible":
+        res = {"status": "infeasible", "iterations": 0, "solution": None}
+    elif reducido.shape[1] == 0:
+        # todas las variables quedaron fijas: no hay nada que iterar
+        res = {"status": "optimal", "iterations": 0, "solution": post.solucion({"Z": reducido.offset})}
+    else:
+        res = reducido.cargar_en(solver).solve(max_iter=max_iter)
+        res["solution"] = post.solucion(res["solution"])
+    res["presolve"] = dict(post.eliminadas)
+    return res
+
+def _resolver_bloque(bloque: list[dict], metodo: str, max_iter: int, sparse: bool,
+                     regla_precios: str = "bland", presolve: bool = False, escalar: bool = False) -> list[dict]:
+    """Tarea de un proceso del pool: resuelve un bloque de problemas."""
+    return [resolver_instancia(p, metodo, max_iter, sparse, regla_precios, presolve, escalar) for p in bloque]
+
+def resolver_en_paralelo(problemas: list[dict], metodo: str = "simplex", max_iter: int = 1000,
+                         sparse: bool = False, procesos: int = None, bloque: int = 1,
+                         regla_precios: str = "bland", presolve: bool = False, escalar: bool = False):
+    """
+    Reparte los problemas en bloques de tamaño `bloque` sobre un ProcessPoolExecutor y
+    devuelve (generador) cada resultado en cuanto termina su bloque, en orden de llegada.
+    Cada resultado incluye 'tiempo' (segundos de resolución dentro del proceso trabajador).
+    """
+    bloques = [problemas[i:i + bloque] for i in range(0, len(problemas), max(1, bloque))]
+    with ProcessPoolExecutor(max_workers=procesos) as pool:
+        futuros = [pool.submit(_resolver_bloque, b, metodo, max_iter, sparse, regla_precios, presolve,
+                               escalar) for b in bloques]
+        for futuro in as_completed(futuros):
+            for resultado in futuro.result():
+                yield resultado
+
+
+# ################ Línea de comandos ################
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Resolución por lotes de problemas de PL (Parcial #2).")
+    ap.add_argument("archivos", nargs="+", help="Archivos con problemas (.json, .mps, .lp o texto plano)")
+    ap.add_argument("--metodo", choices=METODOS, default="simplex")
+    ap.add_argument("--max-iter", type=int, default=1000)
+    ap.add_argument("--sparse", action="store_true", help="Guardar A en formato disperso (CSC)")
+    ap.add_argument("--precios", choices=REGLAS, default="bland",
+                    help="Regla de elección de la entrante en 'simplex' (Bland sigue como anti-ciclado)")
+    ap.add_argument("--presolve", action="store_true",
+                    help="Reducir el modelo (filas vacías/duplicadas, singletons, fijas, dominadas) antes de resolver")
+    ap.add_argument("--escalar", action="store_true",
+                    help="Equilibrar A, b y c antes de resolver con 'simplex' (coeficientes de magnitudes muy distintas)")
+    ap.add_argument("--salida", default="-", help="Archivo JSON Lines de resultados ('-' = stdout)")
+    ap.add_argument("--procesos", type=int, default=1, help="Procesos trabajadores (1 = secuencial, 0 = todos los núcleos)")
+    ap.add_argument("--bloque", type=int, default=1, help="Problemas por tarea enviada a cada proceso")
+    args = ap.parse_args(argv)
+
+    out = sys.stdout if args.salida == "-" else open(args.salida, "w", encoding="utf-8")
+    inicio = time.perf_counter()
+    resueltos = 0
+    tiempo_total = 0.0
+    try:
+        if args.procesos == 1:
+            problemas = (p for ruta in args.archivos for p in cargar_instancias(ruta))
+            resultados = (resolver_instancia(p, args.metodo, args.max_iter, args.sparse, args.precios,
+                                             args.presolve, args.escalar)
+                          for p in problemas)
+        else:
+            problemas = [p for ruta in args.archivos for p in cargar_instancias(ruta)]
+            resultados = resolver_en_paralelo(problemas, args.metodo, args.max_iter, args.sparse,
+                                              procesos=args.procesos or None, bloque=args.bloque,
+                                              regla_precios=args.precios, presolve=args.presolve,
+                                              escalar=args.escalar)
+        for res in resultados:
+            out.write(json.dumps(res, ensure_ascii=False) + "\n")
+            out.flush()
+            resueltos += 1
+            tiempo_total += res["tiempo"]
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    pared = time.perf_counter() - inicio
+    print(f"{resueltos} problemas procesados en {pared:.3f} s "
+          f"(suma de tiempos por instancia: {tiempo_total:.3f} s).", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
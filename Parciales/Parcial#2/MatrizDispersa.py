@@ -0,0 +1,149 @@
+# MatrizDispersa.py
+# Almacenamiento disperso por columnas (CSC) para la matriz de restricciones de los solvers.
+# Implementación propia con NumPy: la memoria escala con los no ceros y no con m x (n + m).
+
+import numpy as np
+
+class MatrizCSC:
+    """
+    Matriz dispersa comprimida por columnas.
+    - data[k]    : valor del k-ésimo no cero
+    - indices[k] : fila del k-ésimo no cero
+    - indptr[j]  : posición en data/indices donde empieza la columna j (indptr[n] = nnz)
+    Operaciones usadas por los solvers:
+        triplets()    -> (filas, columnas, valores) de los no ceros (escalado, presolve, escritura)
+        agregar_filas -> la matriz con filas nuevas debajo (cotas como filas, cota artificial del dual)
+        column(j)     -> columna densa a_j (prueba de razón / FTRAN)
+        columns(idx)  -> bloque denso A[:, idx] (factorización de la base)
+        rmatvec(y)    -> y^T A (costos reducidos en un solo paso)
+        rmatvec_rango(y, lo, hi) / rmatvec_cols(y, idx) -> y^T A sólo en algunas columnas (precios parciales)
+        matvec(x)     -> A x
+    """
+
+    def __init__(self, data, indices, indptr, shape):
+        self.data = np.asarray(data, dtype=float)
+        self.indices = np.asarray(indices, dtype=np.int64)
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.shape = (int(shape[0]), int(shape[1]))
+        # columna de cada no cero (para rmatvec vectorizado con bincount)
+        self._cols = np.repeat(np.arange(self.shape[1]), np.diff(self.indptr))
+
+
+    # ################ Construcción ################
+    @classmethod
+    def from_triplets(cls, rows, cols, vals, shape):
+        """Construye la matriz a partir de tripletas (fila, columna, valor); suma duplicados y descarta ceros."""
+        rows = np.asarray(rows, dtype=np.int64)
+        cols = np.asarray(cols, dtype=np.int64)
+        vals = np.asarray(vals, dtype=float)
+        m, n = int(shape[0]), int(shape[1])
+        if rows.size > 0:
+            # ordenar por (columna, fila) y sumar entradas repetidas
+            key = cols * max(m, 1) + rows
+            order = np.argsort(key, kind="stable")
+            key, vals = key[order], vals[order]
+            uniq, start = np.unique(key, return_index=True)
+            vals = np.add.reduceat(vals, start)
+            rows, cols = uniq % max(m, 1), uniq // max(m, 1)
+            keep = vals != 0.0
+            rows, cols, vals = rows[keep], cols[keep], vals[keep]
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(cols, minlength=n), out=indptr[1:])
+        return cls(vals, rows, indptr, (m, n))
+
+    @classmethod
+    def from_dense(cls, A):
+        A = np.asarray(A, dtype=float)
+        cols, rows = np.nonzero(A.T)
+        return cls.from_triplets(rows, cols, A[rows, cols], A.shape)
+
+    def agregar_filas(self, filas, columnas, valores, shape=None):
+        """
+        Nueva matriz con las tripletas (fila, columna, valor) de las filas agregadas, numeradas desde m.
+        shape: forma final, si además se agregan columnas (por defecto (última fila + 1, n)).
+        """
+        filas = np.asarray(filas, dtype=np.int64)
+        if shape is None:
+            shape = (max(self.shape[0], int(filas.max()) + 1 if filas.size else 0), self.shape[1])
+        return MatrizCSC.from_triplets(np.concatenate([self.indices, filas]),
+                                       np.concatenate([self._cols, np.asarray(columnas, dtype=np.int64)]),
+                                       np.concatenate([self.data, np.asarray(valores, dtype=float)]), shape)
+
+    def toarray(self):
+        A = np.zeros(self.shape)
+        A[self.indices, self._cols] = self.data
+        return A
+
+    @property
+    def nnz(self):
+        return int(self.data.size)
+
+    def triplets(self):
+        """(filas, columnas, valores) de los no ceros, ordenados por columna (los arreglos internos: no modificar)."""
+        return self.indices, self._cols, self.data
+
+
+    # ################ Acceso ################
+    def column(self, j):
+        a = np.zeros(self.shape[0])
+        s, e = self.indptr[j], self.indptr[j + 1]
+        a[self.indices[s:e]] = self.data[s:e]
+        return a
+
+    def columns(self, idx):
+        idx = list(idx)
+        out = np.zeros((self.shape[0], len(idx)))
+        for k, j in enumerate(idx):
+            s, e = self.indptr[j], self.indptr[j + 1]
+            out[self.indices[s:e], k] = self.data[s:e]
+        return out
+
+    def take(self, rows=None, cols=None):
+        """Submatriz con las filas y/o columnas indicadas (en ese orden)."""
+        data, indices, col_of = self.data, self.indices, self._cols
+        m, n = self.shape
+        if cols is not None:
+            cols = np.asarray(cols, dtype=np.int64)
+            counts = np.diff(self.indptr)[cols]
+            pos = np.concatenate([np.arange(self.indptr[j], self.indptr[j + 1]) for j in cols]) if cols.size else np.zeros(0, dtype=np.int64)
+            data, indices = data[pos], indices[pos]
+            col_of = np.repeat(np.arange(cols.size), counts)
+            n = cols.size
+        if rows is not None:
+            rows = np.asarray(rows, dtype=np.int64)
+            new_row = np.full(m, -1, dtype=np.int64)
+            new_row[rows] = np.arange(rows.size)
+            keep = new_row[indices] >= 0
+            data, indices, col_of = data[keep], new_row[indices[keep]], col_of[keep]
+            m = rows.size
+        return MatrizCSC.from_triplets(indices, col_of, data, (m, n))
+
+
+    # ################ Productos ################
+    def matvec(self, x):
+        """A x"""
+        return np.bincount(self.indices, weights=self.data * np.asarray(x)[self._cols], minlength=self.shape[0])
+
+    def rmatvec(self, y):
+        """y^T A (vector de longitud n)"""
+        return np.bincount(self._cols, weights=self.data * np.asarray(y)[self.indices], minlength=self.shape[1])
+
+    def rmatvec_rango(self, y, lo, hi):
+        """y^T A[:, lo:hi] (costo proporcional a los no ceros del bloque)"""
+        s, e = self.indptr[lo], self.indptr[hi]
+        return np.bincount(self._cols[s:e] - lo, weights=self.data[s:e] * np.asarray(y)[self.indices[s:e]],
+                           minlength=hi - lo)
+
+    def rmatvec_cols(self, y, idx):
+        """y^T A[:, idx] para una lista corta de columnas"""
+        y = np.asarray(y)
+        return np.array([self.data[self.indptr[j]:self.indptr[j + 1]].dot(y[self.indices[self.indptr[j]:self.indptr[j + 1]]])
+                         for j in idx], dtype=float)
+
+    def rmatmat(self, Y):
+        """Y A para un bloque de filas Y (k x m)"""
+        Y = np.atleast_2d(Y)
+        out = np.zeros((Y.shape[0], self.shape[1]))
+        for i in range(Y.shape[0]):
+            out[i] = self.rmatvec(Y[i])
+        return out
@@ -0,0 +1,182 @@
+# Parametrico.py
+# Programación paramétrica: valor óptimo Z*(t) cuando un lado derecho b_k o un costo c_j recorre un
+# intervalo, sin resolver el modelo para cada valor. Se parte de la base óptima del solver y se
+# recorren los quiebres de la curva (lineal por tramos):
+#   - lado derecho: dentro del rango de factibilidad de la base (Sensibilidad.rango_rhs) Z es lineal
+#     con pendiente igual al precio sombra; al pasar el quiebre se cambia b_k (cambiar_rhs) y unos
+#     pocos pivotes duales reparan la base (SimplexSolver o SolverDualSimplex)
+#   - costo: dentro del rango de optimalidad (Sensibilidad.rango_costo) Z es lineal con pendiente
+#     x_j; al pasar el quiebre se cambia c_j (cambiar_costo) y siguen pivotes primales (SimplexSolver)
+#
+# Uso:
+#   solver.solve()
+#   curva = curva_rhs(solver, 2, 0.0, 50.0)   # tramos {"desde", "hasta", "Z_desde", "Z_hasta", "pendiente", "estado", "base"}
+#   Z = evaluar(curva, np.linspace(0.0, 50.0, 200))
+#   Z = barrido_costo(solver, "x1", valores)  # curva + evaluar en un paso
+# Al terminar el solver queda otra vez con el valor original (y una base óptima para él).
+
+import numpy as np
+
+from Sensibilidad import rango_costo, rango_rhs
+
+PASO = 1e-7          # avance relativo más allá de cada quiebre para que la base cambie
+TOL_QUIEBRE = 1e-9   # dos quiebres a menos de esto (relativo) son el mismo punto: no hay tramos más angostos
+MAX_QUIEBRES = 1000  # tramos como máximo en cada sentido del recorrido
+
+
+# ################ Recorrido de quiebres ################
+def _tramo(desde, hasta, Z_desde, pendiente, estado, base):
+    return {"desde": float(desde), "hasta": float(hasta), "Z_desde": float(Z_desde),
+            "Z_hasta": float(Z_desde + pendiente * (hasta - desde)) if estado == "optimal" else float(Z_desde),
+            "pendiente": float(pendiente), "estado": estado, "base": base}
+
+
+def _cerca(a, b):
+    return abs(a - b) <= TOL_QUIEBRE * max(1.0, abs(a), abs(b))
+
+
+def _sin_optimo(solver, estado):
+    """Z de un tramo sin óptimo: NaN si es infactible, +-inf si no es acotado."""
+    if estado == "unbounded":
+        return -np.inf if solver.modo == "Min" else np.inf
+    return np.nan
+
+
+def _recorrer(solver, rango, fijar, inicio, fin, max_quiebres):
+    """
+    Tramos de inicio a fin (en cualquier sentido, cada tramo con desde < hasta), con el solver
+    óptimo en 'inicio'. rango() -> (desde, hasta, pendiente, valor actual del parámetro) de la base
+    actual; fijar(valor) cambia el parámetro y devuelve el estado de solve().
+    """
+    sentido = 1.0 if fin >= inicio else -1.0
+    tramos = []
+    t = inicio
+    for _ in range(max_quiebres):
+        desde, hasta, pendiente, actual = rango()
+        Z = solver.get_solution()["Z"] + pendiente * (t - actual)  # Z es lineal dentro del rango
+        borde = min(hasta, fin) if sentido > 0 else max(desde, fin)
+        if _cerca(borde, fin):
+            borde = fin  # el redondeo del rango no deja un tramo infactible de ancho ~1e-14 al final
+        if (borde - t) * sentido > 0 and not _cerca(borde, t):
+            base = [solver.var_names[j] for j in solver.basis]
+            a, b = sorted((t, borde))
+            tramos.append(_tramo(a, b, Z + pendiente * (a - t), pendiente, "optimal", base))
+            t = borde
+        if (fin - t) * sentido <= 0 or _cerca(fin, t):
+            return tramos
+        # quiebre: se pasa apenas del borde y unos pocos pivotes dejan la base del tramo siguiente
+        estado = fijar(t + sentido * PASO * max(1.0, abs(t)))
+        if estado != "optimal":
+            a, b = sorted((t, fin))
+            tramos.append(_tramo(a, b, _sin_optimo(solver, estado), 0.0, estado, None))
+            return tramos
+    raise RuntimeError(f"Más de {max_quiebres} quiebres entre {inicio} y {fin}.")
+
+
+def _curva(solver, rango, fijar, original, desde, hasta, max_quiebres):
+    """Recorre desde el valor original hacia abajo y hacia arriba, recorta a [desde, hasta] y
+    deja el solver otra vez en el valor original."""
+    if solver.status() != "optimal":
+        raise ValueError(f"La curva paramétrica necesita una base óptima (estado: {solver.status()}).")
+    if desde > hasta:
+        raise ValueError("desde tiene que ser menor o igual que hasta.")
+    try:
+        abajo = _recorrer(solver, rango, fijar, original, min(desde, original), max_quiebres)
+        fijar(original)
+        arriba = _recorrer(solver, rango, fijar, original, max(hasta, original), max_quiebres)
+    finally:
+        fijar(original)
+    recortada = []
+    for tramo in abajo[::-1] + arriba:  # los de abajo se recorrieron de mayor a menor
+        a, b = max(tramo["desde"], desde), min(tramo["hasta"], hasta)
+        if b < a or (_cerca(a, b) and recortada):
+            continue
+        if recortada and (recortada[-1]["estado"], recortada[-1]["base"]) == (tramo["estado"], tramo["base"]):
+            recortada[-1] = _tramo(recortada[-1]["desde"], b, recortada[-1]["Z_desde"], recortada[-1]["pendiente"],
+                                   tramo["estado"], tramo["base"])  # misma base a los dos lados del valor original
+            continue
+        optimo = tramo["estado"] == "optimal"
+        Z_a = tramo["Z_desde"] + tramo["pendiente"] * (a - tramo["desde"]) if optimo else tramo["Z_desde"]
+        recortada.append(_tramo(a, b, Z_a, tramo["pendiente"], tramo["estado"], tramo["base"]))
+    return recortada
+
+
+# ################ Curvas ################
+def curva_rhs(solver, fila: int, desde: float, hasta: float, max_quiebres: int = MAX_QUIEBRES,
+              max_iter: int = 1000) -> list[dict]:
+    """
+    Z* en función del lado derecho de la fila construida 'fila' (mismo índice que get_duals()) en
+    [desde, hasta], para un SimplexSolver o SolverDualSimplex ya resuelto. Devuelve los tramos
+    ordenados {"desde", "hasta", "Z_desde", "Z_hasta", "pendiente", "estado", "base"}: en cada tramo
+    "optimal" Z es lineal (pendiente = precio sombra) y "base" es la base óptima; fuera de la región
+    factible hay un tramo "infeasible" con Z NaN.
+    """
+    original = rango_rhs(solver, fila)["rhs"]
+
+    def rango():
+        r = rango_rhs(solver, fila)
+        return r["desde"], r["hasta"], r["dual"], r["rhs"]
+
+    def fijar(valor):
+        solver.cambiar_rhs(fila, valor)
+        return solver.solve(max_iter)["status"]
+
+    return _curva(solver, rango, fijar, original, desde, hasta, max_quiebres)
+
+
+def curva_costo(solver, variable: str, desde: float, hasta: float, max_quiebres: int = MAX_QUIEBRES,
+                max_iter: int = 1000) -> list[dict]:
+    """
+    Z* en función del coeficiente de 'variable' en la FO en [desde, hasta] (sólo SimplexSolver: el
+    cambio de costo se repara con pivotes primales). En cada tramo "optimal" la pendiente es el valor
+    de la variable; donde el modelo deja de ser acotado hay un tramo "unbounded" con Z = +-inf.
+    """
+    if not hasattr(solver, "cambiar_costo"):
+        raise ValueError("La curva de un costo necesita SimplexSolver (pivotes primales).")
+    original = rango_costo(solver, variable)["costo"]
+
+    def rango():
+        r = rango_costo(solver, variable)
+        return r["desde"], r["hasta"], r["valor"], r["costo"]
+
+    def fijar(valor):
+        solver.cambiar_costo(variable, valor)
+        return solver.solve(max_iter)["status"]
+
+    return _curva(solver, rango, fijar, original, desde, hasta, max_quiebres)
+
+
+# ################ Evaluación ################
+def evaluar(curva: list[dict], valores) -> np.ndarray:
+    """
+    Z* en cada valor a partir de los tramos (NaN fuera de la curva o en tramos infactibles).
+    Los tramos óptimos son intervalos cerrados (con tolerancia TOL_QUIEBRE): en un extremo compartido
+    con un tramo infactible o no acotado se usa el óptimo.
+    """
+    valores = np.asarray(valores, dtype=float)
+    Z = np.full(valores.shape, np.nan)
+    tol = TOL_QUIEBRE * np.maximum(1.0, np.abs(valores))
+    for optimo in (False, True):  # los óptimos al final: pisan a sus vecinos en los extremos
+        tramos = [t for t in curva if (t["estado"] == "optimal") == optimo]
+        if not tramos:
+            continue
+        desde = np.array([t["desde"] for t in tramos])
+        hasta = np.array([t["hasta"] for t in tramos])
+        Z_desde = np.array([t["Z_desde"] for t in tramos])
+        pendiente = np.array([t["pendiente"] for t in tramos])
+        k = np.clip(np.searchsorted(desde, valores + tol, side="right") - 1, 0, len(tramos) - 1)
+        dentro = (valores >= desde[k] - tol) & (valores <= hasta[k] + tol)
+        Z[dentro] = (Z_desde[k] + pendiente[k] * (valores - desde[k]) if optimo else Z_desde[k])[dentro]
+    return Z
+
+
+def barrido_rhs(solver, fila: int, valores, **kw) -> np.ndarray:
+    """Z* para cada valor del lado derecho de 'fila' (curva_rhs + evaluar)."""
+    valores = np.asarray(valores, dtype=float)
+    return evaluar(curva_rhs(solver, fila, float(valores.min()), float(valores.max()), **kw), valores)
+
+
+def barrido_costo(solver, variable: str, valores, **kw) -> np.ndarray:
+    """Z* para cada valor del coeficiente de 'variable' en la FO (curva_costo + evaluar)."""
+    valores = np.asarray(valores, dtype=float)
+    return evaluar(curva_costo(solver, variable, float(valores.min()), float(valores.max()), **kw), valores)
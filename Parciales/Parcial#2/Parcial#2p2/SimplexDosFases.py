@@ -8,7 +8,6 @@ from rich.text import Text
 from rich import box
 
 console = Console()
-os.system("cls")
 
 def mostrar_tabla_iter(b_inv_A, x_B, reduced_full, var_names, basic_vars=None, z_val=None):
     """Imprime la tabla simplex en formato elegante usando Rich.
@@ -329,8 +328,10 @@ def construir_basis_from_A(A):
     return basic
 
 
-def simplex_por_b_inv(A, b, c, basic_vars, var_names, maximize=True, show_steps=True):
-    """Simplex mediante inversión de B en cada iteración. c corresponde a coeficientes de todas las variables."""
+def simplex_por_b_inv(A, b, c, basic_vars, var_names, maximize=True, show_steps=True, stats=None):
+    """Simplex mediante inversión de B en cada iteración. c corresponde a coeficientes de todas las variables.
+    show_steps=False no imprime nada (ni las tablas ni los avisos).
+    stats: dict opcional donde se acumula el número de pivotes en stats["pivotes"]."""
     tol = 1e-9
     m, total = A.shape
     basic = basic_vars.copy()
@@ -347,7 +348,7 @@ def simplex_por_b_inv(A, b, c, basic_vars, var_names, maximize=True, show_steps=
         x_B = B_inv @ b
         
         # Verificar factibilidad (valores no negativos)
-        if any(x_B < -tol):
+        if show_steps and any(x_B < -tol):
             console.print(f"[yellow]⚠ Advertencia: Solución básica con valores negativos en iteración {it}[/yellow]")
             console.print(f"[dim]x_B = {x_B}[/dim]")
 
@@ -386,6 +387,8 @@ def simplex_por_b_inv(A, b, c, basic_vars, var_names, maximize=True, show_steps=
             ratios = [x_B[i] / d[i] if d[i] > tol else np.inf for i in range(m)]
             leave_pos = int(np.argmin(ratios))
             basic[leave_pos] = entering
+            if stats is not None:
+                stats["pivotes"] = stats.get("pivotes", 0) + 1
         else:
             # minimize
             if all(reduced >= -tol):
@@ -401,11 +404,15 @@ def simplex_por_b_inv(A, b, c, basic_vars, var_names, maximize=True, show_steps=
             ratios = [x_B[i] / d[i] if d[i] > tol else np.inf for i in range(m)]
             leave_pos = int(np.argmin(ratios))
             basic[leave_pos] = entering
+            if stats is not None:
+                stats["pivotes"] = stats.get("pivotes", 0) + 1
     
     raise RuntimeError(f"El algoritmo no convergió después de {max_iterations} iteraciones. Posible ciclaje.")
 
 
-def metodo_dos_fases(tipo, z, restricciones, signos, rhs):
+def metodo_dos_fases(tipo, z, restricciones, signos, rhs, show_steps=True, stats=None):
+    """show_steps=False no imprime nada por consola (tablas, avisos ni resultado final);
+    stats acumula los pivotes (ver simplex_por_b_inv)."""
     Acoef = np.array(restricciones, dtype=float)
     b = np.array(rhs, dtype=float)
     m, n = Acoef.shape
@@ -416,7 +423,8 @@ def metodo_dos_fases(tipo, z, restricciones, signos, rhs):
     # Verificar y corregir RHS negativos
     for i in range(m):
         if b[i] < 0:
-            console.print(f"[yellow]⚠ Normalizando restricción {i+1}: RHS negativo detectado ({b[i]:.4f})[/yellow]")
+            if show_steps:
+                console.print(f"[yellow]⚠ Normalizando restricción {i+1}: RHS negativo detectado ({b[i]:.4f})[/yellow]")
             b[i] = -b[i]
             Acoef[i, :] = -Acoef[i, :]
             # Invertir el signo de la restricción
@@ -425,7 +433,8 @@ def metodo_dos_fases(tipo, z, restricciones, signos, rhs):
             elif signos[i] == ">=":
                 signos[i] = "<="
             # "=" permanece igual
-            console.print(f"[green]  ✓ Nueva restricción {i+1}: signo {signos[i]}, RHS {b[i]:.4f}[/green]")
+            if show_steps:
+                console.print(f"[green]  ✓ Nueva restricción {i+1}: signo {signos[i]}, RHS {b[i]:.4f}[/green]")
 
     # Estandarizar
     A = Acoef.copy()
@@ -449,18 +458,19 @@ def metodo_dos_fases(tipo, z, restricciones, signos, rhs):
         else:
             raise ValueError("Signo no reconocido")
 
-    console.print("\n[bold cyan]═══ MATRIZ ESTANDARIZADA ═══[/bold cyan]\n")
-    # mostrar la matriz estandarizada (sin asignar todavía una base explícita)
-    try:
-        # mostrar B^{-1}*A usando identidad (muestra A tal cual) y sin etiquetas de base
-        mostrar_tabla_iter(np.eye(m) @ A, b, np.zeros(A.shape[1]), nombres, basic_vars=None, z_val=None)
-    except Exception as e:
-        # fallback simple si falla Rich
-        console.print(f"[yellow]Error al mostrar tabla con Rich: {e}[/yellow]")
-        console.print("Matriz A:")
-        console.print(A)
-        console.print("Vector b:")
-        console.print(b)
+    if show_steps:
+        console.print("\n[bold cyan]═══ MATRIZ ESTANDARIZADA ═══[/bold cyan]\n")
+        # mostrar la matriz estandarizada (sin asignar todavía una base explícita)
+        try:
+            # mostrar B^{-1}*A usando identidad (muestra A tal cual) y sin etiquetas de base
+            mostrar_tabla_iter(np.eye(m) @ A, b, np.zeros(A.shape[1]), nombres, basic_vars=None, z_val=None)
+        except Exception as e:
+            # fallback simple si falla Rich
+            console.print(f"[yellow]Error al mostrar tabla con Rich: {e}[/yellow]")
+            console.print("Matriz A:")
+            console.print(A)
+            console.print("Vector b:")
+            console.print(b)
 
     # Base inicial
     basic = construir_basis_inicial(nombres, artificials, A)
@@ -469,7 +479,8 @@ def metodo_dos_fases(tipo, z, restricciones, signos, rhs):
     B_test = A[:, basic]
     if np.linalg.matrix_rank(B_test) < m:
         raise RuntimeError("La base inicial construida no es linealmente independiente.")
-    console.print(f"\n[green]✓ Base inicial construida:[/green] [cyan]{[nombres[i] for i in basic]}[/cyan]")
+    if show_steps:
+        console.print(f"\n[green]✓ Base inicial construida:[/green] [cyan]{[nombres[i] for i in basic]}[/cyan]")
 
     # FASE I: minimizar suma de artificiales
     c1 = np.zeros(A.shape[1])
@@ -477,17 +488,21 @@ def metodo_dos_fases(tipo, z, restricciones, signos, rhs):
         c1[idx] = 1.0
 
     if len(artificials) > 0:
-        console.print("\n[bold magenta]═══ FASE I: minimizando suma de variables artificiales ═══[/bold magenta]\n")
-        # imprimir la tabla inicial de Fase I con la base encontrada
-        try:
-            mostrar_tabla_iter(np.eye(m) @ A, b, np.zeros(A.shape[1]), nombres, basic, z_val=None)
-        except Exception:
-            pass
-        basic1, xB1, z1 = simplex_por_b_inv(A, b, c1, basic.copy(), nombres, maximize=False, show_steps=True)
-        console.print(f"\n[bold green]✓ Valor óptimo Fase I (suma artificiales) = {z1:.6f}[/bold green]")
+        if show_steps:
+            console.print("\n[bold magenta]═══ FASE I: minimizando suma de variables artificiales ═══[/bold magenta]\n")
+            # imprimir la tabla inicial de Fase I con la base encontrada
+            try:
+                mostrar_tabla_iter(np.eye(m) @ A, b, np.zeros(A.shape[1]), nombres, basic, z_val=None)
+            except Exception:
+                pass
+        basic1, xB1, z1 = simplex_por_b_inv(A, b, c1, basic.copy(), nombres, maximize=False,
+                                            show_steps=show_steps, stats=stats)
+        if show_steps:
+            console.print(f"\n[bold green]✓ Valor óptimo Fase I (suma artificiales) = {z1:.6f}[/bold green]")
         if abs(z1) > 1e-6:
-            console.print("[bold red]✗ Problema infactible (Fase I óptimo distinto de 0).[/bold red]")
-            return
+            if show_steps:
+                console.print("[bold red]✗ Problema infactible (Fase I óptimo distinto de 0).[/bold red]")
+            return None
         # Eliminar columnas artificiales de A y nombres
         keep = [i for i in range(A.shape[1]) if i not in artificials]
         A2 = A[:, keep]
@@ -502,13 +517,15 @@ def metodo_dos_fases(tipo, z, restricciones, signos, rhs):
                 new_idx = keep.index(var_idx)
                 basic2.append(new_idx)
         
-        console.print(f"\n[cyan]Variables básicas después de Fase I (sin artificiales):[/cyan] [yellow]{[nombres2[i] for i in basic2]}[/yellow]")
+        if show_steps:
+            console.print(f"\n[cyan]Variables básicas después de Fase I (sin artificiales):[/cyan] [yellow]{[nombres2[i] for i in basic2]}[/yellow]")
         
         # Si faltan variables básicas (porque había artificiales en la base),
         # completar con columnas de identidad
         if len(basic2) < m:
-            console.print(f"[yellow]⚠ Advertencia: La base óptima de Fase I contenía {m - len(basic2)} variable(s) artificial(es).[/yellow]")
-            console.print("[yellow]  Completando la base con columnas de identidad disponibles...[/yellow]")
+            if show_steps:
+                console.print(f"[yellow]⚠ Advertencia: La base óptima de Fase I contenía {m - len(basic2)} variable(s) artificial(es).[/yellow]")
+                console.print("[yellow]  Completando la base con columnas de identidad disponibles...[/yellow]")
             used = set(basic2)
             for row in range(m):
                 if len(basic2) == m:
@@ -529,23 +546,27 @@ def metodo_dos_fases(tipo, z, restricciones, signos, rhs):
                     if np.count_nonzero(colvec) == 1 and abs(colvec[row] - 1.0) < 1e-9:
                         basic2.append(col)
                         used.add(col)
-                        console.print(f"[green]  ✓ Añadida variable {nombres2[col]} para fila {row + 1}[/green]")
+                        if show_steps:
+                            console.print(f"[green]  ✓ Añadida variable {nombres2[col]} para fila {row + 1}[/green]")
                         break
             
             # Si aún faltan, usar construir_basis_from_A como último recurso
             if len(basic2) < m:
-                console.print("[yellow]  No se encontraron suficientes columnas de identidad. Construyendo base de forma codiciosa...[/yellow]")
+                if show_steps:
+                    console.print("[yellow]  No se encontraron suficientes columnas de identidad. Construyendo base de forma codiciosa...[/yellow]")
                 basic2 = construir_basis_from_A(A2)
         
         # Verificar que la base para Fase II es válida
         B2_test = A2[:, basic2]
         if np.linalg.matrix_rank(B2_test) < m:
-            console.print("[yellow]⚠ Advertencia: La base construida para Fase II no es linealmente independiente.[/yellow]")
-            console.print("[yellow]  Reconstruyendo base usando algoritmo codicioso...[/yellow]")
+            if show_steps:
+                console.print("[yellow]⚠ Advertencia: La base construida para Fase II no es linealmente independiente.[/yellow]")
+                console.print("[yellow]  Reconstruyendo base usando algoritmo codicioso...[/yellow]")
             basic2 = construir_basis_from_A(A2)
         
-        console.print(f"\n[green]✓ Base inicial para Fase II:[/green] [cyan]{[nombres2[i] for i in basic2]}[/cyan]")
-        console.print(f"[dim]Se eliminaron las columnas artificiales. Columnas restantes: {len(nombres2)}[/dim]")
+        if show_steps:
+            console.print(f"\n[green]✓ Base inicial para Fase II:[/green] [cyan]{[nombres2[i] for i in basic2]}[/cyan]")
+            console.print(f"[dim]Se eliminaron las columnas artificiales. Columnas restantes: {len(nombres2)}[/dim]")
     else:
         # no hay artificiales
         A2 = A.copy(); nombres2 = nombres.copy(); basic2 = basic.copy()
@@ -557,15 +578,10 @@ def metodo_dos_fases(tipo, z, restricciones, signos, rhs):
     # si es MAX convertimos a forma de maximización directamente (nuestro simplex maximiza por defecto)
     maximize = True if tipo == "MAX" else False
 
-    console.print("\n[bold magenta]═══ FASE II: optimizando función objetivo original ═══[/bold magenta]\n")
-    basic_final, xB_final, z_final = simplex_por_b_inv(A2, b, c_orig, basic2.copy(), nombres2, maximize=maximize, show_steps=True)
-    
-    # Mostrar resultado final
-    console.print("\n")
-    console.print(Panel.fit(
-        "[bold green]*** RESULTADO FINAL ***[/bold green]",
-        border_style="green"
-    ))
+    if show_steps:
+        console.print("\n[bold magenta]═══ FASE II: optimizando función objetivo original ═══[/bold magenta]\n")
+    basic_final, xB_final, z_final = simplex_por_b_inv(A2, b, c_orig, basic2.copy(), nombres2, maximize=maximize,
+                                                       show_steps=show_steps, stats=stats)
     
     # construir vector solución completo
     solution = np.zeros(len(nombres2))
@@ -574,7 +590,22 @@ def metodo_dos_fases(tipo, z, restricciones, signos, rhs):
     x_B = B_inv @ b
     for i, bi in enumerate(basic_final):
         solution[bi] = x_B[i]
-    
+
+    if show_steps:
+        mostrar_resultado(nombres2, solution, z_final)
+
+    # Devolver la solución para uso programático (p.ej. ejecución por lotes)
+    return {name: float(val) for name, val in zip(nombres2, solution)}, float(z_final)
+
+
+def mostrar_resultado(nombres, solution, z_final):
+    """Panel final con la tabla de la solución óptima y el Z."""
+    console.print("\n")
+    console.print(Panel.fit(
+        "[bold green]*** RESULTADO FINAL ***[/bold green]",
+        border_style="green"
+    ))
+
     # Crear tabla de resultados
     result_table = Table(
         title="Solución Óptima",
@@ -584,7 +615,7 @@ def metodo_dos_fases(tipo, z, restricciones, signos, rhs):
     result_table.add_column("Variable", style="cyan", justify="center")
     result_table.add_column("Valor", style="yellow", justify="right")
     
-    for name, val in zip(nombres2, solution):
+    for name, val in zip(nombres, solution):
         if abs(val) < 1e-10:
             result_table.add_row(name, "0")
         else:
@@ -600,5 +631,6 @@ def metodo_dos_fases(tipo, z, restricciones, signos, rhs):
 
 
 if __name__ == "__main__":
+    os.system("cls")
     tipo, z, restricciones, signos, rhs = leer_entrada()
     metodo_dos_fases(tipo, z, restricciones, signos, rhs)
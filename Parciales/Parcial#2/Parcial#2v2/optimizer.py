@@ -23,6 +23,7 @@ class Optimizer:
         self.objetivo = objetivo.lower()
         self.verbose = verbose
         self.var_names = None
+        self.pivots = 0  # pivotes realizados (primal + dual), útil para medir rendimiento
 
     def _parse_problem(self):
         # Obtener todas las variables presentes en el problema
@@ -324,6 +325,7 @@ class Optimizer:
 
             # Actualizar variable básica
             basic_vars[i] = entering
+            self.pivots += 1
 
             if iter_count >= max_iters:
                 console.print("[yellow]! Se alcanzó el máximo de iteraciones (Simplex primal).[/yellow]")
@@ -431,6 +433,7 @@ class Optimizer:
 
             # Actualizar variables básicas
             basic_vars[row_pivot] = entering
+            self.pivots += 1
 
             if iteracion >= max_iters:
                 console.print("[yellow]! Se alcanzó el máximo de iteraciones (Dual Simplex).[/yellow]")
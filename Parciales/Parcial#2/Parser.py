@@ -1,66 +1,115 @@
-# Parser.py 
+# Parser.py
 # Módulo para parsear y validar restricciones y funciones objetivo
+# Los patrones están precompilados y el resultado de cada expresión (normalizada) se guarda en
+# una caché LRU; parse_many() vuelca muchas restricciones en arreglos NumPy preasignados.
+# No hay límite de variables: cada término se devuelve como par disperso (índice, valor) y una
+# TablaVariables opcional asigna los índices de columna: en orden de índice (x1, x2, ..., x10) con
+# TablaVariables.ordenada(), o en el orden en que aparecen (nombres de archivos MPS / LP).
 import re
+from functools import lru_cache
 
-def Parsear(expresion: str) -> dict:
+import numpy as np
+
+LARGO_COEF = 10      # largo mínimo de la lista densa "coef" (compatibilidad con el formato x1..x10)
+TAM_CACHE = 65536    # expresiones normalizadas recordadas por la caché LRU
+
+OPERADOR = re.compile(r"(<=|>=|=)")
+TERMINO = re.compile(r"([+-]?)\s*(\d*\.?\d*)\s*\*?\s*([a-z])(\d*)")  # signo, número, letra, índice
+MAPA_VARS = {"x": 0, "y": 1, "z": 2}
+
+
+# ################ Tabla de símbolos ################
+class TablaVariables:
     """
-    Parsea una restricción o función objetivo con hasta 10 variables.
-    Soporta:
-      - Coeficientes con o sin asterisco (3x1, 3*x1)
-      - Variables con o sin índice (x, y, z, x1, x2, etc.)
-      - Letras mayúsculas o minúsculas
+    Asigna un índice de columna a cada variable la primera vez que aparece.
+    Sólo se crean las columnas de las variables usadas ("x1 + x7" -> 2 columnas, no 7).
+    Uso:
+        <p>tabla = TablaVariables()<br/>
+        fo = Parsear("5x7 + 3x2", tabla)          # fo["terminos"] = [(0, 5.0), (1, 3.0)]<br/>
+        p = parse_many(restricciones, tabla)      # tripletas con las columnas de la tabla<br/>
+        tabla.nombres                             # ['x7', 'x2', ...] (orden de aparición)<br/>
+        tabla = TablaVariables.ordenada([fo] + restricciones)  # ['x2', 'x7', ...] (orden de índice)<p/>
     """
-    if not expresion or not expresion.strip():
-        raise ValueError("La expresión está vacía.")
-
-    expresion = expresion.strip()
 
+    def __init__(self):
+        self.indices = {}   # nombre -> columna
+        self.nombres = []   # columna -> nombre
+
+    @classmethod
+    def ordenada(cls, expresiones: list[str]):
+        """
+        Tabla con las variables de las expresiones ya registradas en orden de índice (x2 antes que x7),
+        como las columnas x1..xn de siempre: el tableau y los desempates de Bland / Dantzig no
+        dependen del orden en que se escriben los términos. Las expresiones quedan en la caché.
+        """
+        tabla = cls()
+        naturales = {}
+        for expresion in expresiones:
+            if expresion and expresion.strip():
+                terminos, _, _ = _parsear_normalizada(_normalizar(expresion))
+                naturales.update((nombre, idx) for nombre, idx, _ in terminos)
+        for nombre in sorted(naturales, key=naturales.get):
+            tabla.indice(nombre)
+        return tabla
+
+    def indice(self, nombre: str) -> int:
+        idx = self.indices.get(nombre)
+        if idx is None:
+            idx = self.indices[nombre] = len(self.nombres)
+            self.nombres.append(nombre)
+        return idx
+
+    def __len__(self):
+        return len(self.nombres)
+
+
+# ################ Parseo de una expresión ################
+def _normalizar(expresion: str) -> str:
+    """Forma canónica usada como clave de la caché: minúsculas y espacios simples."""
+    return " ".join(expresion.split()).lower()
+
+@lru_cache(maxsize=TAM_CACHE)
+def _parsear_normalizada(expresion: str) -> tuple:
+    """
+    Parsea una expresión ya normalizada. Devuelve (terminos, operador, constante) inmutable, con
+    terminos = ((nombre, indice_natural, valor), ...) en orden de aparición y sin nombres repetidos.
+    """
     # 1️⃣ Buscar operador de restricción (<=, >= o =)
-    match = re.search(r"(<=|>=|=)", expresion)
+    match = OPERADOR.search(expresion)
     if not match:
         # Si no hay operador, asumimos <= 0 (para funciones objetivo)
         expresion += " <= 0"
-        match = re.search(r"(<=|>=|=)", expresion)
+        match = OPERADOR.search(expresion)
 
     operador = match.group(1)
     izquierda, derecha = expresion.split(operador)
     izquierda = izquierda.strip()
     derecha = derecha.strip()
 
-    # 2️⃣ Inicializar coeficientes
-    coef = [0.0] * 10
-
-    # 3️⃣ Buscar términos (ahora también soporta "*", mayúsculas y espacios)
-    terminos = re.finditer(r"([+-]?\s*\d*\.?\d*)\s*\*?\s*([a-zA-Z]\d*)", izquierda)
-
-    mapa_vars = {"x": 0, "y": 1, "z": 2}
+    # 2️⃣ Coeficientes por nombre canónico (x, y, z -> x1, x2, x3; yN, zN -> xN)
+    coef = {}
+    natural = {}
 
+    # 3️⃣ Buscar términos (también soporta "*", mayúsculas y espacios)
     variables_encontradas = 0
 
-    for t in terminos:
-        coef_str = t.group(1).replace(" ", "")
-        var_str = t.group(2).lower()
-
+    for signo, numero, letra, indice in TERMINO.findall(izquierda):
         # Determinar índice
-        if var_str in mapa_vars:
-            idx = mapa_vars[var_str]
-        elif (var_str.startswith("x") or var_str.startswith("y") or var_str.startswith("z")) and var_str[1:].isdigit():
-            idx = int(var_str[1:]) - 1
+        if not indice and letra in MAPA_VARS:
+            idx = MAPA_VARS[letra]
+        elif indice and letra in "xyz":
+            idx = int(indice) - 1
         else:
-            raise ValueError(f"Variable no reconocida: {var_str}")
+            raise ValueError(f"Variable no reconocida: {letra + indice}")
 
-        if idx < 0 or idx >= 10:
-            raise ValueError(f"Variable fuera de rango: {var_str}")
+        if idx < 0:
+            raise ValueError(f"Variable fuera de rango: {letra + indice}")
 
         # Determinar coeficiente
-        if coef_str in ["", "+"]:
-            valor = 1.0
-        elif coef_str == "-":
-            valor = -1.0
-        else:
-            valor = float(coef_str)
-
-        coef[idx] += valor
+        valor = float(numero) if numero else 1.0
+        nombre = f"x{idx + 1}"
+        coef[nombre] = coef.get(nombre, 0.0) + (-valor if signo == "-" else valor)
+        natural[nombre] = idx
         variables_encontradas += 1
 
     # 🚨 Verificar que haya al menos una variable
@@ -73,9 +122,89 @@ def Parsear(expresion: str) -> dict:
     except ValueError:
         raise ValueError(f"Constante inválida: {derecha}")
 
+    return tuple((nombre, natural[nombre], valor) for nombre, valor in coef.items()), operador, constante
+
+def _columnas(terminos: tuple, tabla: TablaVariables = None) -> list:
+    """Pares (columna, valor): índice natural (x1 -> 0) o el asignado por la tabla."""
+    if tabla is None:
+        return [(idx, valor) for _, idx, valor in terminos]
+    return [(tabla.indice(nombre), valor) for nombre, _, valor in terminos]
+
+
+def Parsear(expresion: str, tabla: TablaVariables = None) -> dict:
+    """
+    Parsea una restricción o función objetivo con cualquier número de variables.
+    Soporta:
+      - Coeficientes con o sin asterisco (3x1, 3*x1)
+      - Variables con o sin índice (x, y, z, x1, x2, ..., x500, etc.)
+      - Letras mayúsculas o minúsculas
+    Devuelve "terminos" (pares dispersos (columna, valor)) y también "coef" como lista densa
+    (al menos LARGO_COEF posiciones). Sin tabla, la columna de xN es N-1.
+    """
+    if not expresion or not expresion.strip():
+        raise ValueError("La expresión está vacía.")
+
+    terminos, operador, constante = _parsear_normalizada(_normalizar(expresion))
+    pares = _columnas(terminos, tabla)
+    coef = [0.0] * max(LARGO_COEF, max(i for i, _ in pares) + 1)
+    for i, valor in pares:
+        coef[i] = valor
     return {
         "coef": coef,
+        "terminos": pares,
         "operador": operador,
         "constante": constante,
-        "max_var": max(i for i, c in enumerate(coef) if c != 0) if variables_encontradas > 0 else 0
+        "max_var": max((i for i, valor in pares if valor != 0), default=0)
+    }
+
+
+# ################ Parseo por lotes ################
+def parse_many(expresiones: list[str], tabla: TablaVariables = None, densa: bool = False) -> dict:
+    """
+    Parsea muchas restricciones de una vez.
+    Devuelve:
+      - "filas", "columnas", "valores" : tripletas NumPy preasignadas con los no ceros
+      - "operadores" : lista de operadores
+      - "constantes" : vector NumPy con los lados derechos
+      - "max_var"    : mayor columna con coeficiente no nulo (-1 si no hay restricciones)
+      - "coef"       : (sólo con densa=True) matriz k x (max_var + 1), fila i = restricción i
+    """
+    k = len(expresiones)
+    parseadas = [None] * k
+    constantes = np.empty(k)
+    operadores = [None] * k
+    total = 0
+    for i, expresion in enumerate(expresiones):
+        if not expresion or not expresion.strip():
+            raise ValueError("La expresión está vacía.")
+        terminos, operadores[i], constantes[i] = _parsear_normalizada(_normalizar(expresion))
+        parseadas[i] = _columnas(terminos, tabla)
+        total += len(terminos)
+
+    filas = np.empty(total, dtype=np.int64)
+    columnas = np.empty(total, dtype=np.int64)
+    valores = np.empty(total)
+    pos = 0
+    for i, pares in enumerate(parseadas):
+        fin = pos + len(pares)
+        filas[pos:fin] = i
+        if pares:
+            columnas[pos:fin], valores[pos:fin] = zip(*pares)
+        pos = fin
+
+    no_cero = valores != 0.0
+    filas, columnas, valores = filas[no_cero], columnas[no_cero], valores[no_cero]
+    max_var = int(columnas.max()) if columnas.size > 0 else -1
+    resultado = {
+        "filas": filas,
+        "columnas": columnas,
+        "valores": valores,
+        "operadores": operadores,
+        "constantes": constantes,
+        "max_var": max_var
     }
+    if densa:
+        coef = np.zeros((k, max_var + 1))
+        coef[filas, columnas] = valores
+        resultado["coef"] = coef
+    return resultado
@@ -0,0 +1,202 @@
+# Precios.py
+# Motor de precios (pricing) compartido por los solvers Simplex y Dual Simplex.
+# Mantiene una máscara booleana de variables no básicas y calcula todos los costos reducidos
+# con un único producto matriz-vector r = c - y^T A.
+# Elige la variable entrante con la regla configurada (Bland, Dantzig, Devex o steepest-edge),
+# volviendo a Bland tras una racha de pivotes degenerados (anti-ciclado).
+# Con precios parciales sólo se evalúa un bloque rotativo de columnas por iteración y con
+# precios múltiples se guarda una lista corta de candidatas para los pivotes siguientes.
+
+import numpy as np
+from MatrizDispersa import MatrizCSC
+
+EPS = 1e-9
+REGLAS = ("bland", "dantzig", "devex", "steepest")
+EPS_DEGENERADO = 1e-9
+MAX_DEGENERADOS = 20   # pivotes degenerados seguidos antes de pasar a Bland
+DEVEX_REINICIO = 1e6   # peso Devex a partir del cual se reinicia el marco de referencia
+
+class MotorPrecios:
+    """
+    Costos reducidos vectorizados sobre una máscara de no básicas.
+    Uso:
+        <p>precios = MotorPrecios()<br/>
+        precios.sync(basis, n)             # reconstruye la máscara si la base cambió<br/>
+        r = precios.reduced_costs(A, c, y)  # r_j = c_j - y^T a_j (0 en las básicas)<br/>
+        precios.pivot(row, entering, leaving)  # actualiza la máscara en O(1)<br/>
+        q = precios.elegir(mask & (r > eps), r) # entrante según la regla (None si no hay)<br/>
+        q = precios.entrante(A, c, y, signo)   # igual, con precios parciales / múltiples si se configuraron<p/>
+    Reglas: "bland" (menor índice), "dantzig" (mayor |r_j|), "devex" y "steepest"
+    (mayor r_j^2 / w_j con pesos de referencia actualizados en cada pivote).
+    bloque: columnas evaluadas por iteración (precios parciales); candidatos: tamaño de la
+    lista que se conserva entre iteraciones (precios múltiples). None = desactivado.
+    """
+
+    def __init__(self, regla: str = "bland", bloque: int = None, candidatos: int = None):
+        if regla not in REGLAS:
+            raise ValueError(f"Regla de precios no soportada: {regla} (opciones: {', '.join(REGLAS)})")
+        if (bloque is not None and bloque < 1) or (candidatos is not None and candidatos < 1):
+            raise ValueError("El bloque y la lista de candidatos deben ser positivos.")
+        self.regla = regla
+        self.bloque = bloque
+        self.candidatos = candidatos
+        self._cursor = 0    # primera columna del próximo bloque de precios parciales
+        self._lista = np.zeros(0, dtype=np.int64)  # candidatas de precios múltiples
+        self._superior = self._fijas = None  # máscaras de variables acotadas de la llamada en curso
+        self.nonbasic = np.zeros(0, dtype=bool)
+        self._basis = None  # copia de la base con la que se construyó la máscara
+        self.pesos = None   # w_j de Devex / steepest-edge (None: hay que inicializarlos)
+        self.degenerados = 0  # pivotes degenerados consecutivos
+
+    @property
+    def usa_pesos(self):
+        return self.regla in ("devex", "steepest")
+
+    @property
+    def bland_activo(self):
+        """True si se usa Bland: por configuración o por una racha de pivotes degenerados."""
+        return self.regla == "bland" or self.degenerados >= MAX_DEGENERADOS
+
+    def sync(self, basis, n):
+        """Reconstruye la máscara sólo si la base o el número de columnas cambiaron."""
+        if self._basis != basis or self.nonbasic.size != n:
+            if self.nonbasic.size != n:
+                # cambiaron las columnas (p.ej. al eliminar artificiales)
+                self.pesos = None
+                self._cursor = 0
+                self._lista = np.zeros(0, dtype=np.int64)
+            self.nonbasic = np.ones(n, dtype=bool)
+            if len(basis) > 0:
+                self.nonbasic[basis] = False
+            self._basis = list(basis)
+        return self.nonbasic
+
+    def pivot(self, row, entering, leaving):
+        """Registra el cambio de base en la fila row: entering pasa a básica y leaving a no básica."""
+        self.nonbasic[leaving] = True
+        self.nonbasic[entering] = False
+        if self._basis is not None:
+            self._basis[row] = entering
+
+    def reduced_costs(self, A, c, y):
+        """r = c - y^T A, con r = 0 en las columnas básicas."""
+        yA = A.rmatvec(y) if isinstance(A, MatrizCSC) else A.T.dot(y)
+        r = np.asarray(c, dtype=float) - yA
+        r[~self.nonbasic] = 0.0
+        return r
+
+    def first(self, candidates):
+        """Menor índice que cumple la condición (regla de Bland) o None."""
+        idx = np.flatnonzero(candidates)
+        return int(idx[0]) if idx.size > 0 else None
+
+    def elegir(self, candidates, r):
+        """Variable entrante entre los candidatos según la regla vigente, o None."""
+        idx = np.flatnonzero(candidates)
+        if idx.size == 0:
+            return None
+        return int(idx[np.argmax(self._puntaje(idx, r[idx]))])
+
+    def _puntaje(self, idx, r):
+        """Mayor es mejor: -j (Bland), |r_j| (Dantzig) o r_j^2 / w_j (Devex / steepest-edge)."""
+        if self.bland_activo:
+            return -idx.astype(float)
+        if self.regla == "dantzig" or self.pesos is None:
+            return np.abs(r)
+        return r ** 2 / self.pesos[idx]
+
+    # ################ Precios parciales y múltiples ################
+    def entrante(self, A, c, y, signo=1, superior=None, fijas=None):
+        """
+        Variable entrante con r_j = c_j - y^T a_j de signo `signo` (+1: r_j > 0, -1: r_j < 0), o None
+        si ninguna columna mejora (óptimo). Sin bloque ni candidatos evalúa todas las columnas.
+        Con bloque, recorre bloques rotativos y se detiene en el primero con candidatas; con
+        candidatos, primero reevalúa la lista guardada y sólo si se agotó vuelve a recorrer.
+        Variables acotadas: en las no básicas con superior[j] (en su cota superior) se pide el signo
+        contrario, y las fijas[j] (cota superior = inferior) nunca entran.
+        """
+        self._superior, self._fijas = superior, fijas
+        if (self.bloque is None and self.candidatos is None) or self.degenerados >= MAX_DEGENERADOS:
+            r = self.reduced_costs(A, c, y)
+            return self.elegir(self.nonbasic & self._elegibles(r, slice(None), signo), r)
+
+        if self._lista.size > 0:
+            lista = self._lista[self.nonbasic[self._lista]]
+            if lista.size > 0:
+                yA = A.rmatvec_cols(y, lista) if isinstance(A, MatrizCSC) else y.dot(A[:, lista])
+                r = np.asarray(c, dtype=float)[lista] - yA
+                ok = self._elegibles(r, lista, signo)
+                if np.any(ok):
+                    return self._tomar(lista[ok], r[ok])
+            self._lista = np.zeros(0, dtype=np.int64)
+
+        n = A.shape[1]
+        bloque = min(self.bloque or n, n)
+        for _ in range(-(-n // bloque)):
+            lo = self._cursor
+            hi = min(lo + bloque, n)
+            self._cursor = hi % n
+            yA = A.rmatvec_rango(y, lo, hi) if isinstance(A, MatrizCSC) else y.dot(A[:, lo:hi])
+            r = np.asarray(c[lo:hi], dtype=float) - yA
+            ok = self.nonbasic[lo:hi] & self._elegibles(r, slice(lo, hi), signo)
+            if np.any(ok):
+                return self._tomar(np.flatnonzero(ok) + lo, r[ok])
+        return None
+
+    def _elegibles(self, r, cols, signo):
+        """Máscara de columnas que mejoran la FO (r en las columnas cols; ver entrante)."""
+        mejora = signo * r
+        if self._superior is not None:
+            mejora = np.where(self._superior[cols], -mejora, mejora)
+        ok = mejora > EPS
+        if self._fijas is not None:
+            ok &= ~self._fijas[cols]
+        return ok
+
+    def _tomar(self, idx, r):
+        """Elige la mejor candidata y, con precios múltiples, guarda las siguientes mejores."""
+        orden = np.argsort(-self._puntaje(idx, r), kind="stable")
+        if self.candidatos is not None:
+            self._lista = idx[orden[1:self.candidatos + 1]]
+        return int(idx[orden[0]])
+
+    def registrar_pivote(self, ratio):
+        """Cuenta pivotes degenerados seguidos; uno no degenerado vuelve a la regla configurada."""
+        self.degenerados = self.degenerados + 1 if abs(ratio) <= EPS_DEGENERADO else 0
+
+    # ################ Pesos de referencia ################
+    def iniciar_pesos(self, normas=None, n=None):
+        """
+        Devex: todos los pesos en 1 (marco de referencia = no básicas actuales).
+        Steepest-edge: normas[j] = ||B^{-1} a_j||^2 de la base actual (w_j = 1 + normas[j]).
+        """
+        if self.regla == "steepest" and normas is not None:
+            self.pesos = 1.0 + np.asarray(normas, dtype=float)
+        else:
+            self.pesos = np.ones(n if n is not None else self.nonbasic.size)
+
+    def actualizar_pesos(self, alpha, row, entering, leaving, d, tau=None):
+        """
+        Actualiza los pesos tras el pivote (antes de cambiar la base).
+        alpha = fila 'row' del tableau (e_r^T B^{-1} A), d = B^{-1} a_entrante,
+        tau = A^T B^{-T} d (sólo steepest-edge).
+        """
+        w = self.pesos
+        if w is None:
+            return
+        alpha_q = alpha[entering]
+        ratio = alpha / alpha_q
+        w_q = w[entering]
+        if self.regla == "devex":
+            w_q = max(w_q, 1.0)
+            np.maximum(w, ratio ** 2 * w_q, out=w)
+            w[leaving] = max(w_q / alpha_q ** 2, 1.0)
+            if w.max() > DEVEX_REINICIO:
+                w[:] = 1.0
+        else:
+            gamma_q = 1.0 + float(d.dot(d))  # peso exacto de la entrante
+            w -= 2.0 * ratio * tau
+            w += ratio ** 2 * gamma_q
+            np.maximum(w, 1.0 + ratio ** 2, out=w)
+            w[leaving] = max(gamma_q / alpha_q ** 2, 1.0)
+        w[entering] = 1.0  # pasa a básica: su peso no se usa
@@ -0,0 +1,236 @@
+# Presolve.py
+# Reducción del modelo antes de resolverlo (presolve) y reconstrucción de la solución (postsolve).
+# Trabaja sobre un ModeloLP (ArchivosModelo.py) y repite hasta que no haya cambios:
+#   - filas vacías (se verifican y se eliminan)
+#   - filas de una sola variable (pasan a ser cotas de esa variable)
+#   - variables fijas (lo == up: se sustituyen en b y en la constante de la FO)
+#   - filas duplicadas (proporcionales: se conserva la más ajustada)
+#   - columnas dominadas (el signo de c_j y de su columna fija la variable en una cota)
+#
+# Uso:
+#   reducido, post = presolve(ModeloLP.desde_texto(modo, fo, restricciones))
+#   solver = reducido.cargar_en(SimplexSolver())
+#   res = solver.solve()
+#   sol = post.solucion(res["solution"])           # valores con los nombres originales y Z
+#   duales = post.duales(solver.get_duals(), sol)  # {nombre de fila: precio sombra}
+
+import numpy as np
+
+from ArchivosModelo import ModeloLP
+from MatrizDispersa import MatrizCSC
+
+TOL = 1e-9
+MAX_PASADAS = 20
+INVERTIR = {"<=": ">=", ">=": "<=", "=": "="}
+
+
+class Postsolve:
+    """
+    Datos para llevar la solución del modelo reducido al original.
+    - estado: "ok", o "infeasible" si el presolve ya probó que el modelo no tiene solución
+    - filas / columnas: índices originales de las filas y columnas que quedaron
+    - fijas: {columna original: valor} de las variables eliminadas
+    - singletons: [(fila, columna, coeficiente)] de las filas convertidas en cotas, en orden
+    - offset: constante que el presolve sumó a la FO (variables fijadas); va incluida en el offset
+      del modelo reducido, así que el Z del solver (cargar_en) ya la tiene
+    """
+
+    def __init__(self, original: ModeloLP):
+        self.original = original
+        self.estado = "ok"
+        self.filas = np.arange(original.shape[0])
+        self.columnas = np.arange(original.shape[1])
+        self.fijas = {}
+        self.singletons = []
+        self.offset = 0.0
+        self.eliminadas = {"filas_vacias": 0, "singletons": 0, "fijas": 0, "duplicadas": 0, "dominadas": 0}
+
+    def solucion(self, sol: dict) -> dict:
+        """Valores de todas las variables originales (y Z, que ya trae el offset del modelo reducido)."""
+        if sol is None:
+            return None
+        nombres = self.original.var_names
+        x = {}
+        for j, nombre in enumerate(nombres):
+            x[nombre] = float(self.fijas[j]) if j in self.fijas else float(sol.get(nombre, 0.0))
+        x["Z"] = float(sol["Z"])
+        return x
+
+    def duales(self, y, sol: dict) -> dict:
+        """
+        Precio sombra de cada fila original. y = duales del modelo reducido (get_duals(); las filas
+        extra que agrega SolverDualSimplex por las cotas se ignoran). Las filas eliminadas valen 0,
+        salvo las convertidas en cota que están activas: reciben el costo reducido de su variable.
+        """
+        orig = self.original
+        m = orig.shape[0]
+        y_full = np.zeros(m)
+        y_full[self.filas] = np.asarray(y, dtype=float)[:self.filas.size]
+        A = orig.A
+        usadas = set()
+        for i, j, a in reversed(self.singletons):
+            if j in usadas:
+                continue
+            v = orig.b[i] / a
+            if abs(sol[orig.var_names[j]] - v) > 1e-7 * max(1.0, abs(v)):
+                continue  # la cota de esta fila no está activa
+            s, e = A.indptr[j], A.indptr[j + 1]
+            r_j = orig.c[j] - float(y_full[A.indices[s:e]].dot(A.data[s:e]))
+            y_full[i] = r_j / a
+            usadas.add(j)
+        return {nombre: float(y_full[i]) for i, nombre in enumerate(orig.row_names)}
+
+
+def _normalizar(cols, vals, tipo, rhs):
+    """Clave de fila proporcional: se divide por el primer coeficiente (invirtiendo si es negativo)."""
+    escala = vals[0]
+    if escala < 0:
+        tipo = INVERTIR[tipo]
+    clave = (tuple(cols.tolist()), tuple(np.round(vals / escala, 12).tolist()))
+    return clave, tipo, rhs / escala
+
+
+def presolve(modelo: ModeloLP, max_pasadas: int = MAX_PASADAS):
+    """
+    Reduce el modelo. Devuelve (ModeloLP reducido, Postsolve). Si post.estado == "infeasible"
+    el modelo reducido no debe resolverse (la infactibilidad ya quedó probada).
+    """
+    post = Postsolve(modelo)
+    m, n = modelo.shape
+    A = modelo.A if isinstance(modelo.A, MatrizCSC) else MatrizCSC.from_dense(modelo.A)
+    rows, cols, vals = A.triplets()
+    b = modelo.b.astype(float).copy()
+    tipos = list(modelo.tipos)
+    lo, up = modelo.lo.astype(float).copy(), modelo.up.astype(float).copy()
+    sentido = 1.0 if modelo.modo == "Max" else -1.0  # c' = sentido * c se maximiza
+    fila_activa = np.ones(m, dtype=bool)
+    col_activa = np.ones(n, dtype=bool)
+
+    def fijar(j, valor):
+        valor = float(valor)
+        act = (cols == j) & fila_activa[rows]
+        b[rows[act]] -= vals[act] * valor
+        post.offset += float(modelo.c[j]) * valor
+        post.fijas[j] = float(valor)
+        col_activa[j] = False
+
+    for _ in range(max_pasadas):
+        cambios = 0
+        act = fila_activa[rows] & col_activa[cols]
+        por_fila = np.bincount(rows[act], minlength=m)
+
+        # 1) filas vacías: 0 (tipo) b
+        for i in np.flatnonzero(fila_activa & (por_fila == 0)):
+            t, v = tipos[i], b[i]
+            if (t == "<=" and v < -TOL) or (t == ">=" and v > TOL) or (t == "=" and abs(v) > TOL):
+                post.estado = "infeasible"
+                break
+            fila_activa[i] = False
+            post.eliminadas["filas_vacias"] += 1
+            cambios += 1
+        if post.estado != "ok":
+            break
+
+        # 2) filas de una sola variable -> cotas
+        for k in np.flatnonzero(act & (por_fila[rows] == 1)):
+            i, j, a = int(rows[k]), int(cols[k]), float(vals[k])
+            if not fila_activa[i] or not col_activa[j]:
+                continue
+            t = tipos[i] if a > 0 else INVERTIR[tipos[i]]
+            v = b[i] / a
+            if t in (">=", "="):
+                lo[j] = max(lo[j], v)
+            if t in ("<=", "="):
+                up[j] = min(up[j], v)
+            if lo[j] > up[j] + TOL:
+                post.estado = "infeasible"
+                break
+            post.singletons.append((i, j, a))
+            fila_activa[i] = False
+            post.eliminadas["singletons"] += 1
+            cambios += 1
+        if post.estado != "ok":
+            break
+
+        # 3) variables fijas
+        for j in np.flatnonzero(col_activa & (up - lo <= TOL)):
+            fijar(j, lo[j])
+            post.eliminadas["fijas"] += 1
+            cambios += 1
+
+        # 4) filas duplicadas (proporcionales)
+        act = fila_activa[rows] & col_activa[cols]
+        orden = np.lexsort((cols[act], rows[act]))
+        r_act, c_act, v_act = rows[act][orden], cols[act][orden], vals[act][orden]
+        cortes = np.flatnonzero(np.diff(r_act)) + 1
+        vistas = {}
+        for rr, cc, vv in zip(np.split(r_act, cortes), np.split(c_act, cortes), np.split(v_act, cortes)):
+            if rr.size < 2:
+                continue
+            i = int(rr[0])
+            clave, t, v = _normalizar(cc, vv, tipos[i], b[i])
+            if clave not in vistas:
+                vistas[clave] = (i, t, v)
+                continue
+            k, tk, vk = vistas[clave]
+            quitar = None
+            if t == tk == "=":
+                if abs(v - vk) > TOL * max(1.0, abs(v)):
+                    post.estado = "infeasible"
+                    break
+                quitar = i
+            elif t == tk:
+                # mismo sentido: se queda la más ajustada
+                ajustada_nueva = v < vk if t == "<=" else v > vk
+                quitar = k if ajustada_nueva else i
+            elif "=" in (t, tk):
+                ve, ti, vi = (v, tk, vk) if t == "=" else (vk, t, v)
+                if (ti == "<=" and ve > vi + TOL) or (ti == ">=" and ve < vi - TOL):
+                    post.estado = "infeasible"
+                    break
+                quitar = k if t == "=" else i  # la igualdad implica la desigualdad
+            if quitar is None:
+                continue
+            fila_activa[quitar] = False
+            if quitar == k:
+                vistas[clave] = (i, t, v)
+            post.eliminadas["duplicadas"] += 1
+            cambios += 1
+        if post.estado != "ok":
+            break
+
+        # 5) columnas dominadas: subir x_j sólo ajusta (o sólo afloja) todas sus filas
+        act = fila_activa[rows] & col_activa[cols]
+        efecto = np.zeros(vals.size)  # +1 ajusta la fila, -1 la afloja, 0 ambos (igualdad)
+        tipo_fila = np.array([{"<=": 1.0, ">=": -1.0}.get(t, 0.0) for t in tipos]) if m else np.zeros(0)
+        efecto[act] = np.sign(vals[act]) * tipo_fila[rows[act]]
+        cuenta = np.bincount(cols[act], minlength=n)
+        ajusta = np.bincount(cols[act], weights=(efecto[act] > 0), minlength=n)
+        afloja = np.bincount(cols[act], weights=(efecto[act] < 0), minlength=n)
+        cp = sentido * modelo.c
+        for j in np.flatnonzero(col_activa):
+            if cp[j] <= 0 and ajusta[j] == cuenta[j]:
+                fijar(j, lo[j])
+            elif cp[j] >= 0 and afloja[j] == cuenta[j] and np.isfinite(up[j]):
+                fijar(j, up[j])
+            else:
+                continue
+            post.eliminadas["dominadas"] += 1
+            cambios += 1
+
+        if cambios == 0:
+            break
+
+    # Modelo reducido
+    post.filas = np.flatnonzero(fila_activa)
+    post.columnas = np.flatnonzero(col_activa)
+    nueva_fila = np.cumsum(fila_activa) - 1
+    nueva_col = np.cumsum(col_activa) - 1
+    act = fila_activa[rows] & col_activa[cols]
+    A_red = MatrizCSC.from_triplets(nueva_fila[rows[act]], nueva_col[cols[act]], vals[act],
+                                    (post.filas.size, post.columnas.size))
+    reducido = ModeloLP(modelo.nombre, modelo.modo, [modelo.var_names[j] for j in post.columnas],
+                        modelo.c[post.columnas], A_red, [tipos[i] for i in post.filas], b[post.filas],
+                        [modelo.row_names[i] for i in post.filas], lo[post.columnas], up[post.columnas],
+                        modelo.offset + post.offset)
+    return reducido, post
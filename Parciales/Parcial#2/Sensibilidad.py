@@ -0,0 +1,217 @@
+# Sensibilidad.py
+# Análisis post-óptimo (sensibilidad) a partir de la base óptima de SimplexSolver o SolverDualSimplex:
+#   - precios sombra de cada restricción y costos reducidos de cada variable
+#   - rango de cada coeficiente de la FO en el que la base sigue siendo óptima
+#   - rango de cada lado derecho en el que la base sigue siendo factible (los duales no cambian)
+# Todo sale de una sola factorización: B^{-1}, los precios y el bloque B^{-1} A se calculan una vez
+# y los rangos son razones mínimas vectorizadas sobre todas las filas y columnas a la vez.
+#
+# Se trabaja en la forma interna del solver (Max, filas con signo invertido, escalado, x' = x - lo
+# en [0, u]) y los rangos se devuelven en las unidades del modelo original.
+#
+# Uso:
+#   solver.solve()
+#   sens = sensibilidad(solver)
+#   sens["variables"]["x1"]   # {"valor", "costo", "costo_reducido", "desde", "hasta"}
+#   sens["filas"][2]          # {"rhs", "dual", "desde", "hasta"} de la tercera restricción
+
+import numpy as np
+
+from MatrizDispersa import MatrizCSC
+
+EPS = 1e-9
+
+
+# ################ Forma interna del solver ################
+def _forma_interna(solver) -> dict:
+    """
+    Datos de la base óptima en la forma interna del solver:
+    - A, c (Max), basis, xB, upper / at_upper (cotas de x' en [0, u])
+    - ftran / btran: B^{-1} v y v^T B^{-1} con la factorización del solver; B_inv: B^{-1} explícita
+      si ya está disponible (SolverDualSimplex) o None
+    - originales: columnas de las variables del modelo; f_c: c'_j = f_c * c_j en esas columnas
+    - f_b: b'_k = f_b * b_k + constante en cada fila construida; pos: fila actual de cada fila
+      construida (-1 si se eliminó por redundante); rhs: lado derecho original
+    """
+    if solver.status() != "optimal":
+        raise ValueError(f"El análisis de sensibilidad necesita una base óptima (estado: {solver.status()}).")
+    A = solver.A
+    n = A.shape[1]
+    sentido = -1.0 if solver.modo == "Min" else 1.0
+    originales = np.ones(n, dtype=bool)
+    if hasattr(solver, "row_ids"):
+        # SimplexSolver: holguras / artificiales son las lógicas; puede haber escalado y cotas
+        originales[solver.logicas[solver.logicas >= 0]] = False
+        originales[list(solver.artificials)] = False
+        originales = np.flatnonzero(originales)
+        xB, _, factor = solver._compute_current_solution()
+        ftran, btran, B_inv = factor.ftran, factor.btran, None
+        upper, at_upper = solver.upper, solver.at_upper
+        f_c = sentido * solver.col_scale[originales]
+        f_b = solver.row_sign * solver.row_scale
+        pos = np.full(f_b.size, -1, dtype=np.int64)
+        pos[solver.row_ids] = np.arange(solver.row_ids.size)
+        rhs = solver.rhs
+    else:
+        # SolverDualSimplex: una holgura por fila, filas >= multiplicadas por -1, sin cotas
+        if solver.fila_cota is not None:
+            raise ValueError("La base óptima todavía depende de la cota artificial.")
+        originales[solver.holguras] = False
+        originales = np.flatnonzero(originales)
+        xB, _, B_inv = solver._compute_current_solution()
+        ftran, btran = B_inv.dot, lambda v: np.asarray(v).dot(B_inv)
+        upper, at_upper = np.full(n, np.inf), np.zeros(n, dtype=bool)
+        f_c = np.full(originales.size, sentido)
+        f_b = solver.signos
+        pos = np.arange(f_b.size)
+        rhs = solver.b * solver.signos
+    return {"A": A, "c": solver.c, "basis": list(solver.basis), "xB": np.asarray(xB, dtype=float),
+            "ftran": ftran, "btran": btran, "B_inv": B_inv, "upper": upper, "at_upper": at_upper,
+            "originales": originales, "f_c": f_c, "f_b": f_b, "pos": pos, "rhs": np.asarray(rhs, dtype=float)}
+
+
+def _precios(forma: dict):
+    """y^T = c_B^T B^{-1} y costos reducidos r = c - y^T A (forma interna)."""
+    A, c, basis = forma["A"], forma["c"], forma["basis"]
+    y = forma["btran"](c[basis]) if basis else np.zeros(A.shape[0])
+    return y, c - (A.rmatvec(y) if isinstance(A, MatrizCSC) else y.dot(A))
+
+
+def _filas_tableau(forma: dict, filas):
+    """Filas 'filas' de B^{-1} A (de B^{-1} explícita o con una btran por fila)."""
+    B_inv, A = forma["B_inv"], forma["A"]
+    if B_inv is not None:
+        rho = B_inv[filas]
+    else:
+        identidad = np.eye(len(forma["basis"]))
+        rho = np.array([forma["btran"](identidad[i]) for i in filas])
+    return A.rmatmat(rho) if isinstance(A, MatrizCSC) else rho.dot(A)
+
+
+# ################ Rangos ################
+def _rangos_costos(forma: dict, r, columnas):
+    """
+    Intervalo [lo, hi] de variación de c'_j (forma interna) para las columnas indicadas.
+    No básica en 0: r_j + d <= 0; en su cota superior: r_j + d >= 0.
+    Básica en la fila i: los costos reducidos de las no básicas k pasan a r_k - d * t_ik (t = B^{-1} A)
+    y tienen que conservar su signo.
+    """
+    A, basis, upper, at_upper = forma["A"], forma["basis"], forma["upper"], forma["at_upper"]
+    n = A.shape[1]
+    columnas = np.asarray(columnas, dtype=np.int64)
+    lo, hi = np.full(columnas.size, -np.inf), np.full(columnas.size, np.inf)
+    no_basicas = np.ones(n, dtype=bool)
+    no_basicas[basis] = False
+    libres = no_basicas & (upper > EPS)  # las no básicas fijas (u = 0) no restringen nada
+    abajo, arriba = (libres & ~at_upper)[columnas], (libres & at_upper)[columnas]
+    hi[abajo] = -r[columnas[abajo]]
+    lo[arriba] = -r[columnas[arriba]]
+    fila_de = np.full(n, -1, dtype=np.int64)
+    fila_de[basis] = np.arange(len(basis))
+    basicas = np.flatnonzero(fila_de[columnas] >= 0)
+    if basicas.size == 0 or not libres.any():
+        return lo, hi
+
+    T = _filas_tableau(forma, fila_de[columnas[basicas]])
+    s = np.where(at_upper[libres], -1.0, 1.0)
+    Q = T[:, libres] * s  # con d: s_k (r_k - d t_ik) <= 0  <=>  d * Q_ik >= P_k
+    P = np.minimum(r[libres] * s, 0.0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        razon = P / Q
+    lo[basicas] = np.where(Q > EPS, razon, -np.inf).max(axis=1)
+    hi[basicas] = np.where(Q < -EPS, razon, np.inf).min(axis=1)
+    return lo, hi
+
+
+def _rangos_rhs(forma: dict, filas):
+    """
+    Intervalo [lo, hi] de variación de b'_p para las filas actuales p indicadas (forma interna)
+    en el que xB + d * B^{-1} e_p sigue entre 0 y la cota superior de cada básica.
+    """
+    basis = forma["basis"]
+    filas = np.asarray(filas, dtype=np.int64)
+    if not basis:
+        return np.full(filas.size, -np.inf), np.full(filas.size, np.inf)
+    B_inv = forma["B_inv"]
+    beta = B_inv[:, filas] if B_inv is not None else forma["ftran"](np.eye(len(basis))[:, filas])
+    xB = np.maximum(forma["xB"], 0.0)[:, None]
+    holgura = np.maximum(forma["upper"][basis][:, None] - xB, 0.0)  # inf si la básica no tiene cota superior
+    with np.errstate(divide="ignore", invalid="ignore"):
+        baja, sube = -xB / beta, holgura / beta
+    lo = np.where(beta > EPS, baja, np.where(beta < -EPS, sube, -np.inf)).max(axis=0)
+    hi = np.where(beta > EPS, sube, np.where(beta < -EPS, baja, np.inf)).min(axis=0)
+    return lo, hi
+
+
+def _a_original(lo, hi, factor):
+    """Lleva el intervalo [lo, hi] de x' = factor * x a x (se da vuelta si factor < 0)."""
+    lo, hi = lo / factor, hi / factor
+    return np.where(factor > 0, lo, hi), np.where(factor > 0, hi, lo)
+
+
+def _variables(forma: dict, r, sol: dict, cols) -> dict:
+    """Entradas de "variables" para las posiciones cols de forma["originales"]."""
+    originales, f_c = forma["originales"][cols], forma["f_c"][cols]
+    lo, hi = _rangos_costos(forma, r, originales)
+    lo, hi = _a_original(lo, hi, f_c)
+    costos = forma["c"][originales] / f_c
+    reducidos = r[originales] / f_c
+    return {nombre: {"valor": sol[nombre], "costo": float(costos[k]), "costo_reducido": float(reducidos[k]),
+                     "desde": float(costos[k] + lo[k]), "hasta": float(costos[k] + hi[k])}
+            for k, nombre in enumerate(forma["nombres"][cols])}
+
+
+def _filas(forma: dict, duales, filas) -> list[dict]:
+    """Entradas de "filas" para las filas construidas indicadas (rango NaN si se eliminaron)."""
+    filas = np.asarray(filas, dtype=np.int64)
+    pos, rhs, f_b = forma["pos"][filas], forma["rhs"][filas], forma["f_b"][filas]
+    activas = pos >= 0
+    lo, hi = np.full(filas.size, np.nan), np.full(filas.size, np.nan)
+    if activas.any():
+        lo_p, hi_p = _rangos_rhs(forma, pos[activas])
+        lo[activas], hi[activas] = _a_original(lo_p, hi_p, f_b[activas])
+    return [{"rhs": float(rhs[k]), "dual": float(duales[i]), "desde": float(rhs[k] + lo[k]),
+             "hasta": float(rhs[k] + hi[k])} for k, i in enumerate(filas)]
+
+
+# ################ Análisis ################
+def sensibilidad(solver) -> dict:
+    """
+    Análisis de sensibilidad desde la base óptima (solver ya resuelto con estado "optimal").
+    Devuelve:
+    - "variables": {nombre: {"valor", "costo", "costo_reducido", "desde", "hasta"}}: desde / hasta es el
+      rango del coeficiente de la FO en el que la base actual sigue siendo óptima
+    - "filas": [{"rhs", "dual", "desde", "hasta"}] por restricción construida (mismo orden que get_duals()):
+      rango del lado derecho en el que la base sigue siendo factible y los precios sombra valen
+    - "Z": valor óptimo
+    Con cotas_nativas las filas de una sola variable son cotas y no aparecen; las filas eliminadas
+    por redundantes tienen rango NaN.
+    """
+    forma = _forma_interna(solver)
+    if forma["B_inv"] is None:
+        forma["B_inv"] = forma["ftran"](np.eye(len(forma["basis"])))  # una sola vez para todas las filas
+    forma["nombres"] = np.array(solver.var_names, dtype=object)[forma["originales"]]
+    _, r = _precios(forma)
+    sol = solver.get_solution()
+    duales = solver.get_duals()
+    return {"variables": _variables(forma, r, sol, np.arange(forma["originales"].size)),
+            "filas": _filas(forma, duales, np.arange(forma["pos"].size)), "Z": sol["Z"]}
+
+
+def rango_costo(solver, variable: str) -> dict:
+    """Entrada de sensibilidad(solver)["variables"][variable] sin analizar el resto del modelo."""
+    forma = _forma_interna(solver)
+    forma["nombres"] = np.array(solver.var_names, dtype=object)[forma["originales"]]
+    cols = np.flatnonzero(forma["nombres"] == variable)
+    if cols.size == 0:
+        raise ValueError(f"Variable desconocida: {variable}")
+    _, r = _precios(forma)
+    return _variables(forma, r, solver.get_solution(), cols)[variable]
+
+
+def rango_rhs(solver, fila: int) -> dict:
+    """Entrada de sensibilidad(solver)["filas"][fila] sin analizar el resto del modelo."""
+    forma = _forma_interna(solver)
+    if not 0 <= fila < forma["pos"].size:
+        raise ValueError(f"Fila fuera de rango: {fila}")
+    return _filas(forma, solver.get_duals(), [fila])[0]
@@ -3,9 +3,48 @@
 # Usa Parser.Parsear para leer la FO y restricciones.
 
 import numpy as np
-from Parser import Parsear
+from Parser import Parsear, parse_many, TablaVariables
+from Factorizacion import FactorizacionLU
+from Precios import MotorPrecios
+from MatrizDispersa import MatrizCSC
+from Historial import VistaTableau, HistorialIteraciones
+from Escalado import factores_escala
 
 EPS = 1e-9
+BLOQUE_PESOS = 256  # columnas por ftran al calcular los pesos steepest-edge iniciales con A en CSC
+
+
+def _filas_a_cotas(filas, columnas, valores, operadores, constantes, n):
+    """
+    Convierte las restricciones de una sola variable (a x_j <= b, >= b o = b) en cotas lo/up de x_j.
+    Las que dejarían lo > up se conservan como filas (la fase I informa la infactibilidad).
+    Devuelve (filas, columnas, valores, operadores, constantes) sin esas filas, lo y up.
+    """
+    filas = np.asarray(filas, dtype=np.int64)
+    m = len(operadores)
+    lo, up = np.zeros(n), np.full(n, np.inf)
+    por_fila = np.bincount(filas, minlength=m)
+    quitar = np.zeros(m, dtype=bool)
+    for k in np.flatnonzero(por_fila[filas] == 1):
+        i, j, a = int(filas[k]), int(columnas[k]), float(valores[k])
+        if a == 0.0:
+            continue
+        oper, v = operadores[i], float(constantes[i]) / a
+        if a < 0 and oper in ("<=", ">="):
+            oper = "<=" if oper == ">=" else ">="
+        nuevo_lo = max(lo[j], v) if oper in (">=", "=") else lo[j]
+        nuevo_up = min(up[j], v) if oper in ("<=", "=") else up[j]
+        if nuevo_lo <= nuevo_up:
+            lo[j], up[j] = nuevo_lo, nuevo_up
+            quitar[i] = True
+    if not quitar.any():
+        return filas, columnas, valores, operadores, constantes, lo, up
+    nueva = np.cumsum(~quitar) - 1  # índice de cada fila que queda
+    keep = ~quitar[filas]
+    return (nueva[filas[keep]], np.asarray(columnas)[keep], np.asarray(valores)[keep],
+            [op for i, op in enumerate(operadores) if not quitar[i]],
+            np.asarray(constantes, dtype=float)[~quitar], lo, up)
+
 
 class SimplexSolver:
     """
@@ -15,16 +54,27 @@ class SimplexSolver:
         solver.initialize(modo, funcion_objetivo_str, restricciones_list)<br/>
         while not solver.is_optimal():<br/>
             info = solver.iterate_one()<br/>
-            # info contiene meta de la iteración y snapshot para mostrar<p/>
+            # info contiene meta de la iteración y snapshot para mostrar<br/>
+        res = solver.run_to_completion()   # sin interfaz: hasta el estado final<p/>
     """
 
-    def __init__(self):
+    def __init__(self, sparse: bool = False, historial_max: int = None, historial_archivo: str = None,
+                 regla_precios: str = "bland", bloque_precios: int = None, candidatos_precios: int = None,
+                 cotas_nativas: bool = False, escalar: bool = False):
+        self.sparse = sparse    # True: A se guarda en CSC (MatrizDispersa) en lugar de densa
+        self.escalar = escalar  # True: A, b y c se equilibran antes de resolver (ver Escalado.py)
+        self.cotas_nativas = cotas_nativas  # True: filas de una sola variable (x1 <= 40) pasan a ser cotas
+        self.regla_precios = regla_precios  # "bland", "dantzig", "devex" o "steepest" (ver Precios.py)
+        self.bloque_precios = bloque_precios          # precios parciales: columnas evaluadas por iteración
+        self.candidatos_precios = candidatos_precios  # precios múltiples: candidatas guardadas entre iteraciones
+        self.historial_max = historial_max          # None: historial sin límite; n: sólo los últimos n pivotes
+        self.historial_archivo = historial_archivo  # archivo binario donde se derraman los pivotes desalojados
         self.reset()
 
     def reset(self):
         self.modo = "Max"
         self.var_names = []     # nombres de variables (x1,x2, s1, a1, ...)
-        self.A = None           # matriz m x n_total
+        self.A = None           # matriz m x n_total (np.ndarray o MatrizCSC)
         self.b = None           # vector m
         self.c = None           # vector n_total (para FO original, ceros para slacks/artifs)
         self.tipos = []         # operadores originales de restricciones
@@ -33,106 +83,203 @@ class SimplexSolver:
         self.phase = 2          # 1 si en fase I, 2 en fase II
         self.artificials = []   # índices de variables artificiales
         self.status_flag = "initialized"  # "ok","optimal","unbounded","infeasible"
-        self.history = []       # lista de dicts con cada iteración
+        self.history = HistorialIteraciones(self.historial_max, self.historial_archivo)  # pivotes en arreglos NumPy
+        self.factor = None      # factorización LU + etas de la base actual
+        self._factor_basis = None  # base para la que se construyó self.factor
+        self._estado = None     # (factor, xB, y, b, c de la fase) que se actualiza con el paso theta en cada pivote
+        self.pricing = MotorPrecios(self.regla_precios, self.bloque_precios, self.candidatos_precios)  # regla de entrada
+        self.dual_mode = False  # True mientras se recupera factibilidad primal con pivotes duales (arranque en caliente)
+        self.warm_start = None  # "primal", "dual" o None según cómo se aceptó la base previa
+        # Variables acotadas: x_j = lower_j + x'_j con 0 <= x'_j <= upper_j (upper = ancho de la cota)
+        self.lower = None       # cota inferior original de cada columna (se suma en get_solution)
+        self.upper = None       # cota superior desplazada (inf si no tiene)
+        self.at_upper = None    # máscara de no básicas en su cota superior
+        self.z0 = 0.0           # c^T lower + offset de la FO (parte constante de Z)
+        self.row_ids = None     # fila del modelo construido que ocupa cada fila actual (cambia si se eliminan redundantes)
+        self.row_sign = None    # -1 en las filas que se multiplicaron por -1 por tener RHS negativo
+        self.row_scale = None   # escala R de cada fila construida (1 sin escalar): b' = R b
+        self.rhs = None         # lado derecho original de cada fila construida (sin escalar ni desplazar)
+        self.col_scale = None   # escala de cada columna: x = col_scale * x' (holguras: 1 / R de su fila)
+        self.logicas = None     # columna lógica de cada fila (holgura +1, exceso -1 o artificial; -1 si no tiene)
 
 
     # ################ Inicialización y construcción del modelo ################
-    def initialize(self, modo: str, funcion_objetivo: str, restricciones: list[str]):
+    def initialize(self, modo: str, funcion_objetivo: str, restricciones: list[str], basis: list[str] = None):
         """
         Recibe: modo ("Max" o "Min"), funcion_objetivo como string, lista de restricciones string.
         Construye la forma estándar añadiendo slack/surplus/artificials y prepara Phase I si es necesario.
+        basis: nombres de variables básicas de una resolución anterior (ver basis_names()) para arrancar en caliente.
         """
         self.reset()
         self.modo = modo if modo in ("Max", "Min") else "Max"
 
+        # Tabla de símbolos: columnas en orden de índice (x1, x2, ...) de las variables usadas
+        tabla = TablaVariables.ordenada([funcion_objetivo] + list(restricciones))
         # permitir función objetivo sin operador (p.ej. "3x1 + 5x2")
         if not any(op in funcion_objetivo for op in ("<=", ">=", "=")):
-            parsed_fo = Parsear(funcion_objetivo + " <= 0")
+            parsed_fo = Parsear(funcion_objetivo + " <= 0", tabla)
         else:
-            parsed_fo = Parsear(funcion_objetivo)
-        # Parsear restricciones
-        parsed_constraints = [Parsear(r) for r in restricciones]
-
-        # Determinar n_vars original (máximo índice)
-        max_idx = parsed_fo.get("max_var", -1)
-        for p in parsed_constraints:
-            if p.get("max_var", -1) > max_idx:
-                max_idx = p["max_var"]
-        if max_idx < 0:
+            parsed_fo = Parsear(funcion_objetivo, tabla)
+        # Parsear restricciones (tripletas dispersas en un solo paso)
+        parsed = parse_many(restricciones, tabla)
+
+        n_orig = len(tabla)
+        if n_orig == 0:
             raise ValueError("No se detectaron variables en la entrada.")
+        c_orig = [0.0] * n_orig
+        for j, v in parsed_fo["terminos"]:
+            c_orig[j] = v
 
-        n_orig = max_idx + 1
-        c_orig = parsed_fo["coef"][:n_orig]
+        filas, columnas, valores = parsed["filas"], parsed["columnas"], parsed["valores"]
+        operadores, constantes = parsed["operadores"], parsed["constantes"]
+        lo = up = None
+        if self.cotas_nativas:
+            filas, columnas, valores, operadores, constantes, lo, up = _filas_a_cotas(
+                filas, columnas, valores, operadores, constantes, n_orig)
+        self._build(c_orig, list(tabla.nombres), filas, columnas, valores, operadores, constantes, lo, up)
+        if basis:
+            self.warm_start = self._warm_start(basis)
 
-        # Construcción incremental de A, c y nombres de variables
-        A_rows = []
+    def initialize_from_arrays(self, modo: str, c, A, tipos: list[str], b, var_names: list[str] = None,
+                               basis: list[str] = None, lo=None, up=None, offset: float = 0.0):
+        """
+        Igual que initialize pero con el modelo ya en arreglos (sin parsear texto):
+        c (n), A (m x n densa o MatrizCSC), tipos (m operadores "<=", ">=", "=") y b (m).
+        lo / up (n): cotas de las variables, manejadas sin agregar filas (por defecto 0 e inf).
+        offset: constante de la FO (se suma a Z).
+        Usado por los lectores de archivos MPS / LP (ArchivosModelo.py).
+        """
+        self.reset()
+        self.modo = modo if modo in ("Max", "Min") else "Max"
+        c = np.asarray(c, dtype=float)
+        if isinstance(A, MatrizCSC):
+            filas, columnas, valores = A.triplets()
+        else:
+            A = np.asarray(A, dtype=float).reshape(len(tipos), c.size)
+            filas, columnas = np.nonzero(A)
+            valores = A[filas, columnas]
+        if var_names is None:
+            var_names = [f"x{j+1}" for j in range(c.size)]
+        self._build(c.tolist(), list(var_names), filas, columnas, valores, list(tipos), np.asarray(b, dtype=float),
+                    lo, up)
+        self.z0 += -offset if self.modo == "Min" else offset  # z0 está en la forma interna (Max)
+        if basis:
+            self.warm_start = self._warm_start(basis)
+
+    def _build(self, c_orig, var_names, filas, columnas, valores, operadores, constantes, lo=None, up=None):
+        """Forma estándar a partir de las tripletas de las variables originales y los operadores/RHS.
+        lo / up: cotas de las variables originales; se trabaja con x' = x - lo en [0, up - lo]."""
+        n_orig = len(c_orig)
+        lo = np.zeros(n_orig) if lo is None else np.asarray(lo, dtype=float)
+        up = np.full(n_orig, np.inf) if up is None else np.asarray(up, dtype=float)
+        if not np.all(np.isfinite(lo)):
+            raise ValueError("Variables libres (sin cota inferior) no soportadas.")
+        if np.any(lo > up):
+            malas = [var_names[j] for j in np.flatnonzero(lo > up)[:5]]
+            raise ValueError(f"Cota inferior mayor que la superior en: {', '.join(malas)}")
+        filas = np.asarray(filas, dtype=np.int64)
+        columnas = np.asarray(columnas, dtype=np.int64)
+        valores = np.asarray(valores, dtype=float)
+        constantes = np.array(constantes, dtype=float)
+        rhs_original = constantes.copy()
+        operadores = list(operadores)
+        escala_filas, escala_cols = np.ones(constantes.size), np.ones(n_orig)
+        if self.escalar and valores.size:
+            # A' = R A S, b' = R b, c' = S c y cotas / S: se resuelve en x' = x / S
+            escala_filas, escala_cols = factores_escala(filas, columnas, valores, (constantes.size, n_orig))
+            valores = valores * escala_filas[filas] * escala_cols[columnas]
+            constantes = constantes * escala_filas
+            c_orig = (np.asarray(c_orig, dtype=float) * escala_cols).tolist()
+            lo, up = lo / escala_cols, up / escala_cols
+        if np.any(lo != 0.0):
+            # desplazamiento b <- b - A lo
+            constantes -= np.bincount(filas, weights=valores * lo[columnas], minlength=constantes.size)
+        # filas con RHS negativo: se multiplican por -1 para que la base inicial sea factible
+        negativas = np.flatnonzero(constantes < 0)
+        signo = np.ones(constantes.size)
+        if negativas.size:
+            signo[negativas] = -1.0
+            valores = valores * signo[filas]
+            constantes = constantes * signo
+            invertir = {"<=": ">=", ">=": "<="}
+            for i in negativas:
+                operadores[i] = invertir.get(operadores[i], operadores[i])
+
+        # Construcción incremental de A (como tripletas fila/columna/valor), c y nombres de variables;
+        # los no ceros de las variables originales quedan en arreglos y sólo se agregan las holguras
+        rows_idx, cols_idx, vals = [], [], []
         b = []
         tipos = []
-        var_names = [f"x{i+1}" for i in range(n_orig)]
         c = list(c_orig)  # empezamos con coef de variables originales
 
         basis = []
         artificials = []
+        logicas = []  # columna lógica de cada fila, usada para reparar bases singulares
         # Contadores para slacks/surplus/artificials
         s_count = 0
         a_count = 0
 
         # Procesar cada restricción y añadir columnas según tipo
-        for ridx, p in enumerate(parsed_constraints):
-            row = p["coef"][:n_orig]  # fila base para variables originales
-            oper = p["operador"]
-            rhs = p["constante"]
+        for ridx, (oper, rhs) in enumerate(zip(operadores, np.asarray(constantes, dtype=float).tolist())):
 
             # Si es <= : añadimos slack +1 y lo ponemos en base
             if oper == "<=":
                 # slack
                 s_count += 1
-                row.extend([1.0])   # columna del slack
                 var_names.append(f"s{s_count}")
                 c.append(0.0)
+                rows_idx.append(ridx); cols_idx.append(len(c) - 1); vals.append(1.0)   # columna del slack
                 basis.append(len(c) - 1)  # slack en base
+                logicas.append(len(c) - 1)
             elif oper == ">=":
                 # surplus (-1) y artificial (+1)
                 s_count += 1
                 # columna de surplus
-                row.extend([-1.0])
                 var_names.append(f"r{s_count}")  # surplus
                 c.append(0.0)
+                rows_idx.append(ridx); cols_idx.append(len(c) - 1); vals.append(-1.0)
+                logicas.append(len(c) - 1)
                 # artificial
                 a_count += 1
-                row.extend([1.0])
                 var_names.append(f"a{a_count}")
                 c.append(0.0)
+                rows_idx.append(ridx); cols_idx.append(len(c) - 1); vals.append(1.0)
                 artificials.append(len(c) - 1)
                 basis.append(len(c) - 1)  # artificial en base
             elif oper == "=" or oper is None:
                 # igualdad -> artificial
                 a_count += 1
-                row.extend([1.0])
                 var_names.append(f"a{a_count}")
                 c.append(0.0)
+                rows_idx.append(ridx); cols_idx.append(len(c) - 1); vals.append(1.0)
                 artificials.append(len(c) - 1)
                 basis.append(len(c) - 1)
+                logicas.append(len(c) - 1)
             else:
                 raise ValueError(f"Operador no soportado en restricción: {oper}")
 
-            # Rellenar las columnas que ya existían para filas anteriores:
-            # Si la fila es más corta que otras por nuevas columnas, las extendemos
-            # (se hace después de construir todas filas)
-            A_rows.append(row)
             b.append(rhs)
             tipos.append(oper)
 
-        # Ahora normalizamos la longitud de todas las filas y c
-        n_total = len(c)
-        # A_rows pueden tener longitudes diferentes (cada fila había extendido columnas en su momento)
-        for i in range(len(A_rows)):
-            if len(A_rows[i]) < n_total:
-                A_rows[i].extend([0.0] * (n_total - len(A_rows[i])))
+        # holguras y artificiales tienen coeficiente 1 en la fila escalada: s = s' / R de su fila
+        self.col_scale = np.ones(len(c))
+        self.col_scale[:n_orig] = escala_cols
+        self.col_scale[cols_idx] = 1.0 / escala_filas[rows_idx]
+        self.row_scale = escala_filas
+
+        rows_idx = np.concatenate([np.asarray(filas, dtype=np.int64), np.array(rows_idx, dtype=np.int64)])
+        cols_idx = np.concatenate([np.asarray(columnas, dtype=np.int64), np.array(cols_idx, dtype=np.int64)])
+        vals = np.concatenate([np.asarray(valores, dtype=float), np.array(vals, dtype=float)])
 
-        # Guardar en el solver
+        # Guardar en el solver: CSC si se pidió almacenamiento disperso, densa en otro caso
+        n_total = len(c)
+        shape = (len(b), n_total)
         self.var_names = var_names
-        self.A = np.array(A_rows, dtype=float)
+        if self.sparse:
+            self.A = MatrizCSC.from_triplets(rows_idx, cols_idx, vals, shape)
+        else:
+            self.A = np.zeros(shape)
+            self.A[rows_idx, cols_idx] = vals
         self.b = np.array(b, dtype=float)
         # Para la c original: si modo == "Min" convertimos a Max internamente (c = -c)
         if self.modo == "Min":
@@ -140,7 +287,19 @@ class SimplexSolver:
         else:
             self.c = np.array(c, dtype=float)
 
+        # Cotas de todas las columnas (holguras y artificiales: [0, inf))
+        self.lower = np.zeros(n_total)
+        self.lower[:n_orig] = lo
+        self.upper = np.full(n_total, np.inf)
+        self.upper[:n_orig] = up - lo
+        self.at_upper = np.zeros(n_total, dtype=bool)
+        self.z0 = float(self.c[:n_orig].dot(lo))
+
         self.tipos = tipos
+        self.logicas = np.array(logicas, dtype=np.int64)
+        self.row_ids = np.arange(len(b))
+        self.row_sign = signo
+        self.rhs = rhs_original
         self.basis = basis.copy()
         self.artificials = artificials.copy()
         self.iteration = 0
@@ -162,87 +321,322 @@ class SimplexSolver:
         self.status_flag = "ready"
 
 
-    # ################ Cálculos internos ################
-    def _get_B_and_N(self):
-        """Retorna B (m x m), N (m x n_no_básicas), índices no básicas."""
+    # ################ Arranque en caliente ################
+    def basis_names(self):
+        """Nombres de las variables básicas actuales (para pasarlos como basis= en otro initialize)."""
+        return [self.var_names[j] for j in self.basis]
+
+    def _warm_start(self, basis_names):
+        """
+        Intenta arrancar desde una base previa dada por nombres.
+        - Si B^{-1} b >= 0 (primal factible): se saltea la fase I y sigue el simplex primal.
+        - Si no, pero los costos reducidos son óptimos (dual factible): pivotes duales hasta
+          recuperar factibilidad primal (dual_mode).
+        Devuelve "primal", "dual" o None si la base no sirve (arranque normal con fase I).
+        """
+        index = {name: j for j, name in enumerate(self.var_names)}
         m = self.A.shape[0]
-        Bcols = [ self.A[:, j] for j in self.basis ]
-        B = np.column_stack(Bcols) if len(Bcols) > 0 else np.zeros((m,0))
-        nonbas = [j for j in range(self.A.shape[1]) if j not in self.basis]
-        N = self.A[:, nonbas] if len(nonbas) > 0 else np.zeros((self.A.shape[0], 0))
-        return B, N, nonbas
+        if len(basis_names) != m or any(name not in index for name in basis_names):
+            return None
+        basis = [index[name] for name in basis_names]
+        if len(set(basis)) != m or any(j in self.artificials for j in basis):
+            return None
+        try:
+            # una base previa singular se repara con holguras en lugar de descartarla
+            factor = FactorizacionLU(self._cols(basis), logicas=self._signos_logicas(artificiales=False))
+        except np.linalg.LinAlgError:
+            return None
+        self._reparar_base(basis, factor)
 
-    def _compute_current_solution(self):
-        B, N, nonbas = self._get_B_and_N()
-        if B.size == 0:
-            xB = np.zeros(0)
-            B_inv = np.zeros((self.A.shape[0], self.A.shape[0]))
+        nonbasic = np.ones(self.A.shape[1], dtype=bool)
+        nonbasic[basis] = False
+        nonbasic[self.artificials] = False  # las artificiales se descartan, no cuentan para la optimalidad
+        r = np.asarray(self.c, dtype=float) - self._yA(factor.btran(self.c[basis]))
+        # variables acotadas: las no básicas con r_j > 0 arrancan en su cota superior (la elección dual óptima)
+        self.at_upper = nonbasic & np.isfinite(self.upper) & (r > EPS)
+        xN = self._nonbasic_values()
+        rhs = self.b if xN is None else self.b - (self.A.matvec(xN) if isinstance(self.A, MatrizCSC) else self.A.dot(xN))
+        xB = factor.ftran(rhs)
+        if not np.any(xB < -EPS) and not np.any(xB > self.upper[basis] + EPS):
+            modo = "primal"
+        elif not self._bounded() and not np.any(r[nonbasic] > EPS):
+            modo = "dual"
         else:
-            try:
-                B_inv = np.linalg.inv(B)
-            except np.linalg.LinAlgError:
-                # alternativa: usar solve por columna
-                B_inv = np.linalg.pinv(B)
-            xB = B_inv.dot(self.b)
-        # Calcular Z = c_B^T * xB
-        cB = np.array([ self.c[j] for j in self.basis ]) if len(self.basis)>0 else np.zeros(0)
+            self.at_upper[:] = False
+            return None
+
+        # Base aceptada: fuera artificiales y directo a la fase II
+        self.basis = basis
+        self.factor, self._factor_basis = factor, list(basis)
+        self._remove_artificials()
+        self.phase = 2
+        self.c_phase1 = None
+        self.dual_mode = modo == "dual"
+        return modo
+
+
+    # ################ Cambios sobre la base óptima ################
+    def cambiar_rhs(self, fila: int, valor: float):
+        """
+        Cambia el lado derecho de la fila construida 'fila' conservando la base óptima: los costos
+        reducidos no cambian, así que el próximo solve() sigue con pivotes duales (dual_mode) desde
+        esa base hasta recuperar la factibilidad primal. También vale tras un "infeasible" de esos
+        pivotes duales (la base sigue siendo dual factible).
+        """
+        self._exigir_fase2("optimal", "infeasible")
+        pos = np.flatnonzero(self.row_ids == fila)
+        if pos.size == 0:
+            raise ValueError(f"La fila {fila} se eliminó por redundante.")
+        self.b = self.b.copy()  # b nuevo (no se modifica): el historial guarda el de iteraciones anteriores
+        self.b[pos[0]] += self.row_sign[fila] * self.row_scale[fila] * (valor - self.rhs[fila])
+        self.rhs[fila] = valor
+        self.dual_mode = True
+        self.status_flag = "ready"
+
+    def cambiar_costo(self, variable: str, valor: float):
+        """
+        Cambia el coeficiente de 'variable' en la FO (en el sentido original) conservando la base
+        óptima: sigue siendo primal factible, así que el próximo solve() continúa con pivotes primales.
+        También vale tras un "unbounded" (la base sigue siendo primal factible).
+        """
+        self._exigir_fase2("optimal", "unbounded")
+        if variable not in self.var_names:
+            raise ValueError(f"Variable desconocida: {variable}")
+        j = self.var_names.index(variable)
+        nuevo = (-1.0 if self.modo == "Min" else 1.0) * self.col_scale[j] * valor
+        self.z0 += (nuevo - self.c[j]) * self.lower[j]
+        self.c = self.c.copy()
+        self.c[j] = nuevo
+        self.dual_mode = False
+        self.status_flag = "ready"
+
+    def _exigir_fase2(self, *estados):
+        """Los cambios sobre la base sólo tienen sentido tras resolver la fase II (no tras una fase I infactible)."""
+        if self.status_flag not in estados or self.phase != 2 or self.artificials:
+            raise RuntimeError(f"El modelo tiene que estar resuelto en fase II (estado: {self.status_flag}).")
+
+
+    # ################ Acceso a A (densa o CSC) ################
+    def _col(self, j):
+        """Columna a_j como vector denso."""
+        return self.A.column(j) if isinstance(self.A, MatrizCSC) else self.A[:, j]
+
+    def _cols(self, idx):
+        """Bloque denso A[:, idx]."""
+        return self.A.columns(idx) if isinstance(self.A, MatrizCSC) else self.A[:, idx]
+
+    def _yA(self, y):
+        """Producto y^T A (fila del tableau o precios)."""
+        return self.A.rmatvec(y) if isinstance(self.A, MatrizCSC) else y.dot(self.A)
+
+    def _take(self, rows=None, cols=None):
+        """Submatriz de A con las filas/columnas indicadas, en el mismo formato."""
+        if isinstance(self.A, MatrizCSC):
+            return self.A.take(rows=rows, cols=cols)
+        A = self.A
+        if rows is not None:
+            A = A[rows, :]
+        if cols is not None:
+            A = A[:, cols]
+        return A
+
+
+    # ################ Cálculos internos ################
+    def _get_factor(self):
+        """Devuelve la factorización de la base actual.
+        Sólo refactoriza si la base cambió por fuera de los pivotes (p.ej. al eliminar artificiales);
+        en los pivotes normales se actualiza con un eta en _update_factor.
+        """
+        if self.factor is None or self._factor_basis != self.basis:
+            m = self.A.shape[0]
+            B = self._cols(self.basis) if len(self.basis) > 0 else np.zeros((m, 0))
+            self.factor = FactorizacionLU(B, logicas=self._signos_logicas())
+            self._reparar_base(self.basis, self.factor)
+            self._factor_basis = list(self.basis)
+        return self.factor
+
+    def _signos_logicas(self, artificiales: bool = True):
+        """Coeficiente de la columna lógica de cada fila en A: +1 holgura o artificial, -1 exceso
+        (0 si la fila no tiene o, con artificiales=False, si su lógica es una artificial)."""
+        signos = np.zeros(self.logicas.size)
+        tiene = self.logicas >= 0
+        if not artificiales and self.artificials:
+            tiene &= ~np.isin(self.logicas, self.artificials)
+        signos[tiene] = [-1.0 if self.tipos[i] == ">=" else 1.0 for i in np.flatnonzero(tiene)]
+        return signos
+
+    def _reparar_base(self, basis, factor):
+        """Aplica a basis los reemplazos que hizo la factorización: las columnas dependientes salen
+        (quedan no básicas en su cota inferior) y entra la lógica de la fila indicada."""
+        for pos, fila in factor.reparadas:
+            basis[pos] = int(self.logicas[fila])
+            self.at_upper[basis[pos]] = False
+
+    def _update_factor(self, row, d):
+        """Actualiza la factorización tras reemplazar basis[row] (d = B^{-1} a_entrante)."""
+        if self.factor is None or self.factor.necesita_refactor():
+            self.factor = None  # se refactoriza en el próximo _get_factor
+            return
+        try:
+            self.factor.update(row, d)
+            self._factor_basis = list(self.basis)
+        except np.linalg.LinAlgError:
+            self.factor = None
+
+    def _bounded(self):
+        """True si alguna variable tiene cota superior finita (hace falta el simplex acotado)."""
+        return self.upper is not None and not np.all(np.isinf(self.upper))
+
+    def _nonbasic_values(self):
+        """x'_N: las no básicas valen 0 o su cota superior (None si todas están en 0)."""
+        if self.at_upper is None or not self.at_upper.any():
+            return None
+        return np.where(self.at_upper, self.upper, 0.0)
+
+    def _compute_current_solution(self):
+        factor = self._get_factor()
+        xN = self._nonbasic_values()
+        rhs = self.b
+        if xN is not None:
+            rhs = self.b - (self.A.matvec(xN) if isinstance(self.A, MatrizCSC) else self.A.dot(xN))
+        xB = factor.ftran(rhs) if len(self.basis) > 0 else np.zeros(0)
+        return xB, self._objective_value(xB), factor
+
+    def _objective_value(self, xB):
+        """Z = c_B^T * xB (+ c_N^T x_N + parte constante de las cotas inferiores)."""
+        xN = self._nonbasic_values()
+        cB = self.c[self.basis] if len(self.basis)>0 else np.zeros(0)
         Z = float(cB.dot(xB)) if xB.size>0 else 0.0
-        return xB, Z, B_inv
+        return Z + self.z0 + (float(self.c.dot(xN)) if xN is not None else 0.0)
+
+    def _current_state(self):
+        """
+        (xB, y, factor) de la base actual, con y los precios duales de la fase vigente.
+        Se resuelven B xB = b - N x_N y y^T B = c_B^T sólo si cambió la factorización (refactorización,
+        fin de la fase I, base reparada o pivotes duales), b o c; entre tanto _advance los mantiene
+        con el paso theta de cada pivote.
+        """
+        c_vector = self.c_phase1 if self.phase == 1 and self.c_phase1 is not None else self.c
+        estado = self._estado
+        if (estado is None or self.factor is None or estado[0] is not self.factor
+                or estado[3] is not self.b or estado[4] is not c_vector):
+            xB, _, factor = self._compute_current_solution()
+            y = factor.btran(c_vector[self.basis]) if len(self.basis) > 0 else np.zeros(0)
+            self._estado = estado = (factor, xB, y, self.b, c_vector)
+        return estado[1], estado[2], estado[0]
+
+    def _advance(self, entering, d, row, ratio, delta):
+        """
+        Paso theta sobre el estado de _current_state (antes de cambiar la base):
+            xB <- xB - delta theta d,   y <- y + (r_q / d_r) rho_r   (rho_r = fila r de B^{-1})
+        y la entrante toma el lugar de la saliente en xB. row None: cambio de cota (sólo cambia xB).
+        Devuelve rho_r (se reusa para los pesos de Devex / steepest-edge) o None.
+        """
+        factor, xB, y, _, c_vector = self._estado
+        xB -= (delta * ratio) * d
+        if row is None:
+            return None
+        xB[row] = ratio if delta > 0 else self.upper[entering] - ratio
+        e_r = np.zeros(len(self.basis))
+        e_r[row] = 1.0
+        rho = factor.btran(e_r)
+        r_q = c_vector[entering] - float(y.dot(self._col(entering)))
+        y += (r_q / d[row]) * rho
+        return rho
 
-    def _reduced_costs(self, B_inv, c_vector=None):
-        """Calcula costos reducidos r_j = c_j - c_B^T * B_inv * A[:,j]
+    def _reduced_costs(self, factor, c_vector=None):
+        """Calcula costos reducidos r = c - y^T A (y^T = c_B^T * B_inv) en un solo producto.
         c_vector: si se pasa, se usa ese vector de costes (útil para fase I).
         """
         if c_vector is None:
             c_vector = self.c
         m = self.A.shape[0]
-        n = self.A.shape[1]
-        cB = np.array([ c_vector[j] for j in self.basis ]) if len(self.basis)>0 else np.zeros(0)
-        yT = cB.dot(B_inv) if B_inv is not None and cB.size>0 else np.zeros((m,))
-        r = np.zeros(n)
-        for j in range(n):
-            if j in self.basis:
-                r[j] = 0.0
-            else:
-                a_j = self.A[:, j]
-                r[j] = c_vector[j] - yT.dot(a_j)
-        return r
+        self.pricing.sync(self.basis, self.A.shape[1])
+        cB = c_vector[self.basis] if len(self.basis)>0 else np.zeros(0)
+        yT = factor.btran(cB) if factor is not None and cB.size>0 else np.zeros((m,))
+        return self.pricing.reduced_costs(self.A, c_vector, yT)
 
 
     # ################ Decisión de variable entrante y saliente ################
-    def _choose_entering(self, r):
+    def _choose_entering(self, factor, y=None):
         """Devuelve índice de variable entrante o None si óptimo.
+           y: precios duales de la fase actual si ya se conocen (run_to_completion los actualiza
+           en cada pivote); si no, se resuelve y^T B = c_B^T.
            - Si self.phase == 1: objetivo es MINIMIZAR suma de artificiales -> elegir r_j < -EPS (para minim)
            - Si self.phase == 2: objetivo original que lo convertimos a maximización en c
+           Los costos reducidos se calculan en MotorPrecios.entrante: todos, o sólo un bloque / la lista
+           de candidatas con precios parciales o múltiples.
         """
-        n = len(r)
-        indices = [j for j in range(n) if j not in self.basis]
-        if self.phase == 1:
-            # En fase I buscamos disminuir suma de artificiales (minimización).
-            # Seleccionamos una variable con costo reducido < -EPS (indicando que al bajar la FO de fase1 mejora).
-            candidates = [j for j in indices if r[j] < -EPS]
-            if not candidates:
-                return None
-            return min(candidates)  # Regla de Bland: menor índice
+        fase1 = self.phase == 1 and self.c_phase1 is not None
+        c_vector = self.c_phase1 if fase1 else self.c
+        m = self.A.shape[0]
+        self.pricing.sync(self.basis, self.A.shape[1])
+        if self.pricing.usa_pesos and self.pricing.pesos is None:
+            self._init_weights()
+        if y is None:
+            cB = c_vector[self.basis] if len(self.basis) > 0 else np.zeros(0)
+            y = factor.btran(cB) if cB.size > 0 else np.zeros((m,))
+        # Fase I: minimización de artificiales (r_j < -EPS); fase II: maximización (r_j > EPS)
+        if self._bounded():
+            return self.pricing.entrante(self.A, c_vector, y, signo=-1 if fase1 else 1,
+                                         superior=self.at_upper, fijas=self.upper <= EPS)
+        return self.pricing.entrante(self.A, c_vector, y, signo=-1 if fase1 else 1)
+
+    def _init_weights(self):
+        """Pesos de referencia de Devex (1) o steepest-edge exactos (1 + ||B^{-1} a_j||^2) para la base actual.
+        Con una base de lógicas (B = ±I permutada, el arranque habitual) ||B^{-1} a_j|| = ||a_j||; si no,
+        con A en CSC se hace ftran por bloques de BLOQUE_PESOS columnas, sin armar B^{-1} (m x m)."""
+        m, n = self.A.shape
+        if self.pricing.regla != "steepest" or m == 0:
+            self.pricing.iniciar_pesos(n=n)
+            return
+        factor = self._get_factor()  # puede reparar la base: antes de mirar sus columnas
+        basis = np.asarray(self.basis, dtype=np.int64)
+        if isinstance(self.A, MatrizCSC):
+            _, columnas, valores = self.A.triplets()
+            normas = np.bincount(columnas, weights=valores ** 2, minlength=n)
+            unitarias = np.diff(self.A.indptr)[basis] == 1
+            filas = self.A.indices[self.A.indptr[basis]] if unitarias.all() else None
         else:
-            # Fase II: objetivo convertido a maximización (c preparado en initialize)
-            candidates = [j for j in indices if r[j] > EPS]
-            if not candidates:
-                return None
-            return min(candidates)  # Desempate de Bland
+            normas = (self.A ** 2).sum(axis=0)
+            unitarias = np.count_nonzero(self.A[:, basis], axis=0) == 1
+            filas = np.abs(self.A[:, basis]).argmax(axis=0) if unitarias.all() else None
+        if filas is not None and np.allclose(normas[basis], 1.0) and np.unique(filas).size == m:
+            self.pricing.iniciar_pesos(normas=normas)
+            return
+        if not isinstance(self.A, MatrizCSC):
+            self.pricing.iniciar_pesos(normas=(factor.ftran(self.A) ** 2).sum(axis=0))
+            return
+        for inicio in range(0, n, BLOQUE_PESOS):
+            idx = np.arange(inicio, min(n, inicio + BLOQUE_PESOS))
+            normas[idx] = (factor.ftran(self.A.columns(idx)) ** 2).sum(axis=0)
+        self.pricing.iniciar_pesos(normas=normas)
         
-    def _choose_leaving(self, B_inv, entering, xB):
-        a_j = self.A[:, entering]
-        d = B_inv.dot(a_j)
-        ratios = []
-        for i, val in enumerate(d):
-            if val > EPS:
-                ratios.append((xB[i] / val, i))
-        if not ratios:
-            return None, None
-        min_ratio, row = min(ratios, key=lambda x: (x[0], self.basis[x[1]]))
-        return row, self.basis[row]
-
+    def _choose_leaving(self, d, xB, delta=1.0, u_entering=np.inf):
+        """Prueba de razón mínima sobre la columna entrante d = B_inv * a_entrante.
+        delta = +1 si la entrante sube desde 0, -1 si baja desde su cota superior u_entering.
+        Devuelve (row, ratio, a_superior): row = None con ratio finito es un cambio de cota de la
+        entrante (ratio = u_entering); con ratio infinito el problema es no acotado.
+        a_superior indica que la saliente queda en su cota superior en lugar de en 0."""
+        alpha = delta * np.asarray(d, dtype=float)
+        ratios = np.full(alpha.size, np.inf)
+        baja = alpha > EPS
+        ratios[baja] = xB[baja] / alpha[baja]
+        a_superior = np.zeros(alpha.size, dtype=bool)
+        if self._bounded():
+            uB = self.upper[self.basis]
+            sube = (alpha < -EPS) & np.isfinite(uB)
+            ratios[sube] = (uB[sube] - xB[sube]) / -alpha[sube]
+            a_superior = sube
+        if not np.isfinite(ratios).any():
+            return None, u_entering, False
+        t = ratios.min()
+        if u_entering <= t:
+            return None, u_entering, False  # la entrante llega antes a su otra cota
+        # empates: menor índice de variable básica (Bland)
+        empates = np.flatnonzero(ratios == t)
+        row = int(empates[np.argmin(np.asarray(self.basis)[empates])])
+        return row, float(t), bool(a_superior[row])
 
     # ################ Iteración única (pivote) ################
     def iterate_one(self):
@@ -253,31 +647,27 @@ class SimplexSolver:
             'entering': idx o None,
             'leaving': idx o None,
             'status': 'optimal'|'continue'|'unbounded'|'infeasible'|'phase1_to_phase2',
-            'tableau_snapshot': snapshot (lista de filas con nombres y valores),
+            'snapshot': VistaTableau perezosa (se materializa al consultarla),
             'Z': valor,
         }
+        xB y los precios duales no se recalculan en cada paso: se actualizan con el paso theta (igual
+        que en run_to_completion) y se resuelven desde cero cuando se rehace la factorización.
         """
+        return self._iterate(snapshot=True, record=True)
+
+    def _iterate(self, snapshot: bool = True, record: bool = True):
+        """Cuerpo de iterate_one. snapshot=False evita construir el tableau y record=False no guarda historial."""
         if self.status_flag in ("optimal","unbounded","infeasible"):
             return {"status": self.status_flag}
+        if self.dual_mode:
+            return self._iterate_dual(snapshot, record)
 
-        m = self.A.shape[0]
-        # 1) Calcular B_inv y solución actual
-        B, N, nonbas = self._get_B_and_N()
-        if B.size == 0:
-            B_inv = np.zeros((m, m))
-        else:
-            try:
-                B_inv = np.linalg.inv(B)
-            except np.linalg.LinAlgError:
-                B_inv = np.linalg.pinv(B)
-
-        xB, Z, _ = self._compute_current_solution()
+        # 1) Solución y precios duales de la base actual (actualizados con el paso theta)
+        xB, y, factor = self._current_state()
+        Z = self._objective_value(xB)
 
-        # 2) Calcular costos reducidos según fase
-        if self.phase == 1 and self.c_phase1 is not None:
-            r = self._reduced_costs(B_inv, c_vector=self.c_phase1)
-        else:
-            r = self._reduced_costs(B_inv, c_vector=self.c)
+        # 2) Precios según fase: variable entrante (None si la fase terminó)
+        entering = self._choose_entering(factor, y)
 
         # Fase I: ver si terminó la fase I
         if self.phase == 1:
@@ -285,7 +675,6 @@ class SimplexSolver:
             art_vals = [ xB[i] for i,bidx in enumerate(self.basis) if bidx in self.artificials ]
             phase1_obj = sum(art_vals) if len(art_vals)>0 else 0.0
 
-            entering = self._choose_entering(r)
             if entering is None:
                 # terminó fase 1
                 if phase1_obj > 1e-6:
@@ -299,41 +688,100 @@ class SimplexSolver:
                     return {"status": "infeasible", "error": str(e)}
                 self.phase = 2
                 # recalc y devolver snapshot de cambio de fase
-                B, N, nonbas = self._get_B_and_N()
-                try:
-                    B_inv = np.linalg.inv(B)
-                except np.linalg.LinAlgError:
-                    B_inv = np.linalg.pinv(B)
-                xB, Z, _ = self._compute_current_solution()
-                r = self._reduced_costs(B_inv, c_vector=self.c)
+                xB, _, factor = self._current_state()
+                Z = self._objective_value(xB)
                 self.iteration += 1
                 return {
                     "status": "phase1_to_phase2",
                     "phase1_obj": phase1_obj,
                     "iteration": self.iteration,
                     "Z": Z,
-                    "snapshot": self.get_tableau_display()
+                    "snapshot": self._snapshot() if snapshot else None
                 }
-            # si hay entering en fase1, seguimos a pivoteo de fase1 (usa r calculado arriba)
+            # si hay entering en fase1, seguimos a pivoteo de fase1 (elegido arriba)
 
-        # Fase II normal: seleccionar entrante
-        entering = self._choose_entering(r)
+        # Fase II normal: sin entrante -> óptimo
         if entering is None:
             self.status_flag = "optimal"
-            return {"status": "optimal", "iteration": self.iteration, "Z": Z, "snapshot": self.get_tableau_display()}
+            return {"status": "optimal", "iteration": self.iteration, "Z": Z, "snapshot": self._snapshot() if snapshot else None}
 
-        row, leaving_var = self._choose_leaving(B_inv, entering, xB)
+        d = factor.ftran(self._col(entering))
+        delta = -1.0 if self.at_upper[entering] else 1.0
+        row, ratio, to_upper = self._choose_leaving(d, xB, delta, self.upper[entering])
         if row is None:
-            self.status_flag = "unbounded"
-            return {"status": "unbounded", "iteration": self.iteration, "entering": entering, "Z": Z}
+            if np.isinf(ratio):
+                self.status_flag = "unbounded"
+                return {"status": "unbounded", "iteration": self.iteration, "entering": entering, "Z": Z}
+            self._advance(entering, d, None, ratio, delta)
+            return self._bound_flip(entering, Z, ratio, snapshot, record)
+
+        rho = self._advance(entering, d, row, ratio, delta)
+        return self._pivot(row, entering, d, Z, ratio, snapshot, record, to_upper, rho)
 
-        # Actual pivot: reemplazar basis[row] por entering
+    def _iterate_dual(self, snapshot: bool = True, record: bool = True):
+        """
+        Pivote dual (base dual factible pero primal infactible: arranque en caliente o cambio de un
+        lado derecho en Parametrico.py): sale la básica más alejada de sus cotas (negativa, o por encima
+        de su cota superior y queda en ella) y entra la no básica con menor |r_j / alpha_j| entre las
+        que la devuelven hacia la cota (Bland en empates).
+        Cuando 0 <= B^{-1} b <= u se desactiva dual_mode y sigue el simplex primal.
+        No mantiene el estado del paso theta: el próximo pivote primal lo vuelve a calcular.
+        """
+        self._estado = None
+        xB, Z, factor = self._compute_current_solution()
+        exceso = xB - self.upper[self.basis]
+        infactibilidad = np.maximum(-xB, exceso)
+        row = int(np.argmax(infactibilidad))
+        if infactibilidad[row] <= EPS:
+            self.dual_mode = False
+            return self._iterate(snapshot, record)
+        to_upper = bool(exceso[row] > EPS)
+
+        e_r = np.zeros(len(self.basis))
+        e_r[row] = 1.0
+        alpha = self._yA(factor.btran(e_r))  # fila 'row' del tableau
+        r = self._reduced_costs(factor)
+        # la no básica se mueve hacia adentro de sus cotas (sube desde 0 o baja desde la superior)
+        alpha_dir = np.where(self.at_upper, -alpha, alpha)
+        if not to_upper:
+            alpha_dir = -alpha_dir
+        candidates = np.flatnonzero(self.pricing.nonbasic & (self.upper > EPS) & (alpha_dir > EPS))
+        if candidates.size == 0:
+            self.status_flag = "infeasible"
+            return {"status": "infeasible", "iteration": self.iteration, "leaving": self.basis[row]}
+        entering = int(candidates[np.argmin(np.abs(r[candidates] / alpha[candidates]))])
+        d = factor.ftran(self._col(entering))
+        return self._pivot(row, entering, d, Z, abs(r[entering] / alpha[entering]), snapshot, record, to_upper)
+
+    def _pivot(self, row, entering, d, Z, ratio, snapshot, record, to_upper=False, rho=None):
+        """Reemplaza basis[row] por entering, actualiza factorización y máscara y registra la iteración.
+        ratio: razón mínima del pivote (se guarda en el historial compacto).
+        to_upper: la saliente queda no básica en su cota superior.
+        rho: fila 'row' de B^{-1} si ya se calculó (se reusa para los pesos de Devex / steepest-edge)."""
         leaving_index = self.basis[row]
+        if record:
+            self.history.registrar(self.iteration + 1, entering, leaving_index, row, Z, ratio,
+                                   (self.A, self.b, self.c, self.var_names), self.basis,
+                                   *self._history_bounds(), sale_superior=to_upper)
+        if self.pricing.usa_pesos and self.pricing.pesos is not None:
+            # fila 'row' del tableau (y A^T B^{-T} d para steepest-edge) con la base previa al pivote
+            factor = self._get_factor()
+            if rho is None:
+                e_r = np.zeros(len(self.basis))
+                e_r[row] = 1.0
+                rho = factor.btran(e_r)
+            alpha = self._yA(rho)
+            tau = self._yA(factor.btran(d)) if self.pricing.regla == "steepest" else None
+            self.pricing.actualizar_pesos(alpha, row, entering, leaving_index, d, tau)
+        self.pricing.registrar_pivote(ratio)
         self.basis[row] = entering
+        self._update_factor(row, d)
+        self.pricing.pivot(row, entering, leaving_index)
+        self.at_upper[entering] = False
+        self.at_upper[leaving_index] = to_upper
 
         # registrar iteración
         self.iteration += 1
-        snapshot = self.get_tableau_display()
         info = {
             "status": "continue",
             "iteration": self.iteration,
@@ -341,67 +789,202 @@ class SimplexSolver:
             "entering_name": self.var_names[entering],
             "leaving": leaving_index,
             "leaving_name": self.var_names[leaving_index] if 0 <= leaving_index < len(self.var_names) else str(leaving_index),
+            "row": row,
             "Z": float(Z),
-            "snapshot": snapshot
+            "ratio": float(ratio),
+            # la base después del pivote; el tableau se arma sólo si alguien lo consulta
+            "snapshot": self._snapshot() if snapshot else None
         }
-        self.history.append(info)
         return info
 
+    def _bound_flip(self, entering, Z, ratio, snapshot, record):
+        """La entrante pasa de una cota a la otra sin cambiar la base (no hay pivote ni factorización)."""
+        if record:
+            self.history.registrar(self.iteration + 1, entering, entering, -1, Z, ratio,
+                                   (self.A, self.b, self.c, self.var_names), self.basis, *self._history_bounds())
+        self.pricing.registrar_pivote(ratio)
+        self.at_upper[entering] = not self.at_upper[entering]
+        self.iteration += 1
+        return {
+            "status": "continue",
+            "iteration": self.iteration,
+            "entering": entering,
+            "entering_name": self.var_names[entering],
+            "leaving": entering,
+            "leaving_name": self.var_names[entering],
+            "row": -1,
+            "bound_flip": True,
+            "Z": float(Z),
+            "ratio": float(ratio),
+            "snapshot": self._snapshot() if snapshot else None
+        }
+
+    def _history_bounds(self):
+        """(cotas, superior) para el historial si el modelo tiene variables acotadas o desplazadas."""
+        if not self._bounded() and self.z0 == 0.0:
+            return None, None
+        return (self.upper, self.z0), self.at_upper.copy()
+
+
+    # ################ Resolución completa (sin interfaz) ################
+    def solve(self, max_iter: int = 1000, record_history: bool = False):
+        """
+        Itera hasta un estado final sin construir snapshots del tableau (uso por lotes, sin Textual/Rich).
+        Requiere initialize() previo.
+        Devuelve dict: {'status': 'optimal'|'unbounded'|'infeasible'|'iteration_limit',
+                        'iterations': k, 'solution': get_solution() si es óptimo, si no None}
+        """
+        if self.A is None:
+            raise RuntimeError("Debe llamar a initialize() antes de solve().")
+        if not record_history:
+            return self.run_to_completion(max_iter)
+        status = "iteration_limit"
+        for _ in range(max_iter):
+            info = self._iterate(snapshot=False, record=record_history)
+            if info["status"] in ("optimal", "unbounded", "infeasible"):
+                status = info["status"]
+                break
+        return self._resultado(status)
+
+    def run_to_completion(self, max_iter: int = 1000):
+        """
+        Motor rápido sin interfaz ni historial: mismos pivotes que iterate_one, con el mismo estado
+        xB / y actualizado por el paso theta (ver _current_state y _advance), pero sin snapshots,
+        dicts por iteración, Z por pivote ni llamadas a is_optimal().
+        Devuelve lo mismo que solve().
+        """
+        if self.A is None:
+            raise RuntimeError("Debe llamar a initialize() antes de run_to_completion().")
+        if self.status_flag in ("optimal", "unbounded", "infeasible"):
+            return self._resultado(self.status_flag)
+        status = "iteration_limit"
+        for _ in range(max_iter):
+            if self.dual_mode:
+                info = self._iterate_dual(snapshot=False, record=False)
+                if info["status"] in ("optimal", "unbounded", "infeasible"):
+                    status = info["status"]
+                    break
+                continue
+            xB, y, factor = self._current_state()
+            entering = self._choose_entering(factor, y)
+
+            if self.phase == 1 and entering is None:
+                es_artificial = np.zeros(self.A.shape[1], dtype=bool)
+                es_artificial[self.artificials] = True
+                if xB[es_artificial[self.basis]].sum() > 1e-6:
+                    status = self.status_flag = "infeasible"
+                    break
+                try:
+                    self._remove_artificials()
+                except RuntimeError:
+                    status = self.status_flag = "infeasible"
+                    break
+                self.phase = 2
+                self.iteration += 1
+                continue
+            if entering is None:
+                status = self.status_flag = "optimal"
+                break
+
+            d = factor.ftran(self._col(entering))
+            delta = -1.0 if self.at_upper[entering] else 1.0
+            row, ratio, to_upper = self._choose_leaving(d, xB, delta, self.upper[entering])
+            if row is None and np.isinf(ratio):
+                status = self.status_flag = "unbounded"
+                break
+            rho = self._advance(entering, d, row, ratio, delta)
+            if row is None:
+                # cambio de cota: la base no cambia
+                self.pricing.registrar_pivote(ratio)
+                self.at_upper[entering] = not self.at_upper[entering]
+                self.iteration += 1
+                continue
+            self._pivot(row, entering, d, 0.0, ratio, snapshot=False, record=False, to_upper=to_upper, rho=rho)
+        return self._resultado(status)
+
+    def _resultado(self, status):
+        return {
+            "status": status,
+            "iterations": self.iteration,
+            "solution": self.get_solution() if status == "optimal" else None,
+        }
+
 
     # ################ Utilidades ################
     def _remove_artificials(self):
-        """Elimina columnas artificiales de forma robusta o marca inconsistencia."""
+        """Elimina columnas artificiales de forma robusta o marca inconsistencia.
+        Las artificiales que siguen básicas (en nivel 0) se sacan con un pivote degenerado
+        sobre su fila del tableau; si esa fila no tiene pivote posible la restricción es redundante y se elimina.
+        """
         to_remove = set(self.artificials)
         if not to_remove:
             return
 
+        # Sacar de la base las artificiales que quedaron en nivel 0 tras la fase I
+        redundant = []  # posiciones de la base cuya fila original es redundante
+        for row in range(len(self.basis)):
+            if self.basis[row] not in to_remove:
+                continue
+            factor = self._get_factor()
+            e_r = np.zeros(len(self.basis))
+            e_r[row] = 1.0
+            alpha = self._yA(factor.btran(e_r))  # fila 'row' de B_inv * A
+            candidates = self.pricing.sync(self.basis, self.A.shape[1]) & (np.abs(alpha) > EPS)
+            candidates[list(to_remove)] = False
+            replacement = self.pricing.first(candidates)
+            if replacement is None:
+                redundant.append(row)
+                continue
+            d = factor.ftran(self._col(replacement))
+            self.basis[row] = replacement
+            self._update_factor(row, d)
+            self.at_upper[replacement] = False  # entra a la base con el mismo valor (pivote degenerado)
+
+        # Eliminar las filas redundantes (la artificial básica identifica la fila original)
+        if redundant:
+            drop_rows = [int(np.argmax(np.abs(self._col(self.basis[pos])))) for pos in redundant]
+            keep_rows = [i for i in range(self.A.shape[0]) if i not in drop_rows]
+            if len(self.tipos) == self.A.shape[0]:
+                self.tipos = [self.tipos[i] for i in keep_rows]
+            self.A = self._take(rows=keep_rows)
+            self.b = self.b[keep_rows]
+            self.row_ids = self.row_ids[keep_rows]
+            self.logicas = self.logicas[keep_rows]
+            self.basis = [bidx for pos, bidx in enumerate(self.basis) if pos not in redundant]
+
         m = self.A.shape[0]
         old_n = self.A.shape[1]
 
         # Construir nuevas columnas (no artificiales) y mapeo
         keep_cols = [j for j in range(old_n) if j not in to_remove]
-        new_col_list = [ self.A[:, j].copy() for j in keep_cols ]
         new_names = [ self.var_names[j] for j in keep_cols ]
         new_c = [ float(self.c[j]) for j in keep_cols ]
-
-        if len(new_col_list) > 0:
-            new_A = np.column_stack(new_col_list)
-        else:
-            new_A = np.zeros((m, 0))
+        new_A = self._take(cols=keep_cols)
 
         # Mapeo old->new
         new_idx_map = { old: new for new, old in enumerate(keep_cols) }
 
-        # Reconstruir basis: intentar mapear cada basic old index a new index
+        # Reconstruir basis: ya no quedan artificiales básicas
         new_basis = []
         for old_b in self.basis:
-            if old_b in to_remove:
-                # buscar reemplazo en la fila correspondiente: prefer columna canónica (1 en esa fila y 0 elsewhere)
-                row_index = self.basis.index(old_b)
-                replacement = None
-                for new_j, old_j in enumerate(keep_cols):
-                    if abs(new_A[row_index, new_j]) > 1e-9:
-                        # candidate: ensure it's not creating multiple nonzeros in other rows? We'll accept and hope pivot can fix
-                        replacement = new_j
-                        break
-                if replacement is None:
-                    # No hay columna que pueda reemplazar la básica artificial -> problema potencialmente inconsistente
-                    raise RuntimeError("No se encontró columna pivote al eliminar artificiales; modelo inconsistente.")
-                new_basis.append(replacement)
+            if old_b in new_idx_map:
+                new_basis.append(new_idx_map[old_b])
             else:
-                # simple mapping
-                if old_b in new_idx_map:
-                    new_basis.append(new_idx_map[old_b])
-                else:
-                    # shouldn't happen, but guard
-                    raise RuntimeError("Error interno al reconstruir base tras eliminar artificiales.")
+                # shouldn't happen, but guard
+                raise RuntimeError("Error interno al reconstruir base tras eliminar artificiales.")
 
         # Actualizar estructuras
         self.A = new_A
         self.c = np.array(new_c, dtype=float)
+        self.lower = self.lower[keep_cols]
+        self.upper = self.upper[keep_cols]
+        self.at_upper = self.at_upper[keep_cols]
+        self.col_scale = self.col_scale[keep_cols]
+        self.logicas = np.array([new_idx_map.get(int(j), -1) for j in self.logicas], dtype=np.int64)
         self.var_names = new_names
         self.basis = new_basis
         self.artificials = []
+        self.factor = None
 
 
     # ################ Estado y solución ################
@@ -409,23 +992,22 @@ class SimplexSolver:
         """Devuelve True si el problema está en estado óptimo (fase 2)"""
         if self.status_flag == "optimal":
             return True
-        # calcular B_inv y costos reducidos
-        B, N, nonbas = self._get_B_and_N()
-        if B.size == 0:
-            B_inv = np.zeros((self.A.shape[0], self.A.shape[0]))
-        else:
-            try:
-                B_inv = np.linalg.inv(B)
-            except np.linalg.LinAlgError:
-                B_inv = np.linalg.pinv(B)
-        r = self._reduced_costs(B_inv)
+        if self.dual_mode:
+            # base dual factible pero todavía primal infactible
+            return False
+        # costos reducidos con la factorización vigente
+        r = self._reduced_costs(self._get_factor())
+        if self._bounded():
+            # en cota superior mejora bajar (signo contrario) y las fijas no se mueven
+            r = np.where(self.at_upper, -r, r)
+            r[self.upper <= EPS] = 0.0
         # En fase 1 no se considera "óptimo" para el problema original
         if self.phase == 1:
             # óptimo de fase1 si no hay costos reducidos < -EPS
-            return all(r[j] >= -EPS for j in range(len(r)) if j not in self.basis)
+            return not np.any(r < -EPS)
         else:
             # fase2: óptimo si no hay costos reducidos > EPS
-            return all(r[j] <= EPS for j in range(len(r)) if j not in self.basis)
+            return not np.any(r > EPS)
 
     def get_tableau_display(self):
         """
@@ -434,61 +1016,29 @@ class SimplexSolver:
             [BaseName, v1, v2, ..., RHS]
         y una última fila con 'Z' y costos reducidos
         """
-        m = self.A.shape[0]
-        n = self.A.shape[1]
-        B, N, nonbas = self._get_B_and_N()
-        try:
-            B_inv = np.linalg.inv(B) if B.size>0 else np.zeros((m,m))
-        except np.linalg.LinAlgError:
-            B_inv = np.linalg.pinv(B)
-        xB, Z, _ = self._compute_current_solution()
+        return self._snapshot(factor=self._get_factor()).materializar()
 
-        # coeficientes completos del tableau para mostrar: B_inv * A da los coeficientes actuales de las básicas en términos de las no básicas
-        tableau_rows = []
+    def _snapshot(self, factor=None):
+        """Vista perezosa del tableau con la base actual (no calcula nada hasta que se consulta)."""
+        cotas, superior = self._history_bounds()
+        if cotas is not None:
+            cotas = (cotas[0], superior, cotas[1])
+        return VistaTableau(self.A, self.b, self.c, self.var_names, self.basis, factor, cotas)
 
-        # Construir representación de la matriz completa de coeficientes: variables básicas actuales expresadas en términos de todas las variables
-        # En vez de eso, produciremos fila: BaseName, coeficientes para todas las variables (A_effective), RHS
-        # Calcular vector de solución actual x_full como ceros excepto básicas
-        x_full = np.zeros(n)
-        for i, bidx in enumerate(self.basis):
-            if 0 <= bidx < n:
-                x_full[bidx] = xB[i]
-        for i in range(m):
-            base_idx = self.basis[i]
-            row_coeffs = []
-
-            # Representación actual de la fila básica (B_inv * A) fila i
-            # calcular row_i = e_i^T * B_inv * A  => (B_inv[i,:].dot(A))
-            row_i = B_inv[i,:].dot(self.A) if B_inv.size>0 else np.zeros(n)
-            for j in range(n):
-                row_coeffs.append(row_i[j])
-            rhs_val = xB[i] if i < len(xB) else 0.0
-            tableau_rows.append({
-                "base_name": self.var_names[base_idx] if 0 <= base_idx < len(self.var_names) else f"b{base_idx}",
-                "coeffs": row_coeffs,
-                "rhs": rhs_val
-            })
-        # fila de costos reducidos
-        red_costs = self._reduced_costs(B_inv)
-        z_row = {
-            "base_name": "Z",
-            "coeffs": list(red_costs),
-            "rhs": Z
-        }
-        return {
-            "var_names": self.var_names.copy(),
-            "rows": tableau_rows,
-            "z_row": z_row
-        }
+    def get_tableau_at(self, k: int):
+        """Tableau materializado de la iteración k del historial (None si no se registró o ya fue desalojada)."""
+        return self.history.tableau(k)
 
     def get_solution(self):
         """Devuelve la solución actual (valores de variables y Z)"""
         n = self.A.shape[1]
-        x = np.zeros(n)
+        x = np.where(self.at_upper, self.upper, 0.0)  # no básicas en 0 o en su cota superior
         xB, Z, _ = self._compute_current_solution()
         for i, bidx in enumerate(self.basis):
             if bidx >= 0 and bidx < n and i < len(xB):
                 x[bidx] = xB[i]
+        x += self.lower  # deshacer el desplazamiento x = lower + x'
+        x *= self.col_scale  # y el escalado (1 si no se escaló)
         Z_val = Z
         # Si el modo es "Min", revertimos el signo de Z porque el solver convierte Min a Max internamente.
         if self.modo == "Min":
@@ -499,5 +1049,16 @@ class SimplexSolver:
         sol["Z"] = float(Z_val)
         return sol
 
+    def get_duals(self):
+        """
+        Precios sombra (y_i = dZ/db_i, en el sentido de la FO original) de las filas del modelo construido.
+        Con cotas_nativas las filas de una sola variable ya no son filas y no aparecen.
+        Las filas eliminadas por redundantes valen 0.
+        """
+        y = self._get_factor().btran(self.c[self.basis])
+        duales = np.zeros(self.row_sign.size)
+        duales[self.row_ids] = y * self.row_sign[self.row_ids] * self.row_scale[self.row_ids]
+        return -duales if self.modo == "Min" else duales
+
     def status(self):
         return self.status_flag
@@ -0,0 +1,36 @@
+"""
+Modelos de prueba compartidos por los test_*.py de esta carpeta.
+lp_con_optimo arma un PL aleatorio con óptimo conocido por holgura complementaria, sin depender
+de otro solver: se eligen x* >= 0 e y* y se ajustan b y c para que los dos sean óptimos.
+"""
+import numpy as np
+import pytest
+
+
+def generar_lp(rng, m, n, tipos=("<=",), modo="Max", densidad=0.6):
+    """
+    {"modo", "c", "A", "tipos", "b", "Z"} con Z el valor óptimo. Cada fila toma un tipo de 'tipos'.
+    En forma <= (G x <= h, Max): y_i >= 0 (libre en las "="), y_i = 0 => holgura > 0;
+    c = G^T y - z con z >= 0 y z_j = 0 si x_j > 0, así que Z = c^T x* = h^T y*.
+    """
+    A = rng.integers(1, 9, (m, n)) * (rng.random((m, n)) < densidad)
+    A[np.arange(m), rng.integers(0, n, m)] = rng.integers(1, 9, m)  # ninguna fila vacía
+    tipo = rng.choice(list(tipos), m)
+    G = np.where((tipo == ">=")[:, None], -A, A).astype(float)
+    x = np.where(rng.random(n) < 0.5, rng.integers(1, 6, n), 0).astype(float)
+    y = np.where(rng.random(m) < 0.6, rng.integers(1, 4, m), 0).astype(float)
+    y[tipo == "="] = rng.integers(-3, 4, (tipo == "=").sum())
+    holgura = np.where((y == 0) & (tipo != "="), rng.integers(1, 5, m), 0)
+    h = G.dot(x) + holgura
+    z = np.where(x > 0, 0, rng.integers(1, 4, n))
+    c = G.T.dot(y) - z
+    Z = float(c.dot(x))
+    b = np.where(tipo == ">=", -h, h)
+    if modo == "Min":
+        c, Z = -c, -Z
+    return {"modo": modo, "c": c, "A": A.astype(float), "tipos": list(tipo), "b": b, "Z": Z, "x": x}
+
+
+@pytest.fixture
+def lp_con_optimo():
+    return generar_lp
@@ -0,0 +1,106 @@
+"""
+Pruebas de ArchivosModelo.py: ida y vuelta MPS / LP (con la constante de la FO), el Z que
+reporta el solver cargado con cargar_en (con y sin presolve) y las cotas fijas en SolverDualSimplex.
+Correr con: python -m pytest -q test_archivos.py
+"""
+import numpy as np
+import pytest
+
+from Simplex.SolverSimplex import SimplexSolver
+from DualSimplex.SolverDualSimplex import SolverDualSimplex
+from ArchivosModelo import ModeloLP, leer_modelo, escribir_modelo, leer_lp
+from Lote import resolver_instancia
+
+MPS_CON_CONSTANTE = """NAME ejemplo
+OBJSENSE
+    MAX
+ROWS
+ N  obj
+ L  c1
+ L  c2
+ L  c3
+COLUMNS
+    x1  obj  3  c1  1
+    x1  c3  3
+    x2  obj  5  c2  2
+    x2  c3  2
+RHS
+    RHS  obj  -10
+    RHS  c1  4
+    RHS  c2  12
+    RHS  c3  18
+ENDATA
+"""
+
+
+def modelo_wyndor(offset=0.0):
+    modelo = ModeloLP.desde_texto("Max", "3x1 + 5x2", ["x1 <= 4", "2x2 <= 12", "3x1 + 2x2 <= 18"])
+    modelo.offset = offset
+    return modelo
+
+
+def iguales(m1, m2):
+    assert (m1.modo, m1.var_names, m1.tipos, m1.row_names) == (m2.modo, m2.var_names, m2.tipos, m2.row_names)
+    assert np.allclose(m1.A.toarray(), m2.A.toarray())
+    for campo in ("c", "b", "lo", "up"):
+        assert np.array_equal(getattr(m1, campo), getattr(m2, campo)), campo
+    assert m1.offset == m2.offset
+
+
+# ################ Ida y vuelta ################
+@pytest.mark.parametrize("extension", [".mps", ".lp"])
+@pytest.mark.parametrize("offset", [0.0, 10.0, -2.5])
+def test_ida_y_vuelta_conserva_el_modelo(tmp_path, extension, offset):
+    modelo = modelo_wyndor(offset)
+    modelo.lo[1], modelo.up[0] = 1.0, 3.5
+    ruta = str(tmp_path / f"modelo{extension}")
+    escribir_modelo(modelo, ruta)
+    iguales(modelo, leer_modelo(ruta))
+
+
+def test_lp_acepta_constantes_en_la_fo(tmp_path):
+    ruta = tmp_path / "const.lp"
+    ruta.write_text("Maximize\n obj: 3 x1 + 10\n + 5 x2 - 2.5\nSubject To\n c1: x1 + x2 <= 4\nEnd\n")
+    modelo = leer_lp(str(ruta))
+    assert modelo.offset == 7.5 and list(modelo.c) == [3.0, 5.0]
+
+
+# ################ Z con la constante ################
+@pytest.mark.parametrize("clase", [SimplexSolver, SolverDualSimplex])
+@pytest.mark.parametrize("modo", ["Max", "Min"])
+def test_cargar_en_suma_el_offset(clase, modo):
+    modelo = modelo_wyndor(10.0)
+    modelo.modo = modo
+    res = modelo.cargar_en(clase()).solve()
+    assert res["solution"]["Z"] == pytest.approx(46.0 if modo == "Max" else 10.0)
+
+
+@pytest.mark.parametrize("metodo", ["simplex", "dualsimplex"])
+@pytest.mark.parametrize("presolve", [False, True])
+def test_mps_con_constante_mismo_z_con_y_sin_presolve(tmp_path, metodo, presolve):
+    ruta = tmp_path / "ejemplo.mps"
+    ruta.write_text(MPS_CON_CONSTANTE)
+    res = resolver_instancia({"nombre": "ejemplo", "modelo": leer_modelo(str(ruta))}, metodo, presolve=presolve)
+    assert res["status"] == "optimal" and res["solution"]["Z"] == pytest.approx(46.0)
+
+
+def test_presolve_con_todas_las_variables_fijas_suma_el_offset():
+    modelo = ModeloLP.desde_texto("Max", "3x1 + 5x2", ["x1 <= 4", "x1 >= 4", "x2 <= 1", "x2 >= 1"])
+    modelo.offset = 2.0
+    res = resolver_instancia({"nombre": "fijas", "modelo": modelo}, "simplex", presolve=True)
+    assert res["status"] == "optimal" and res["solution"]["Z"] == pytest.approx(19.0)
+
+
+# ################ Cotas en SolverDualSimplex ################
+@pytest.mark.parametrize("clase", [SimplexSolver, SolverDualSimplex])
+def test_cota_fija_se_respeta_en_los_dos_solvers(clase):
+    modelo = ModeloLP.desde_texto("Max", "3x1 + 5x2 + x3", ["x1 + x3 <= 4", "2x2 <= 12", "3x1 + 2x2 <= 18"])
+    modelo.lo[2] = modelo.up[2] = 3.0
+    sol = modelo.cargar_en(clase()).solve()["solution"]
+    assert sol["x3"] == pytest.approx(3.0) and sol["Z"] == pytest.approx(36.0)
+
+
+def test_dual_simplex_rechaza_igualdades():
+    modelo = ModeloLP.desde_texto("Max", "3x1 + 5x2", ["x1 + x2 = 4"])
+    with pytest.raises(ValueError, match="igualdades"):
+        modelo.cargar_en(SolverDualSimplex())
@@ -0,0 +1,61 @@
+"""
+Pruebas de Benchmark.py: los generadores de cada tipo dan el estado esperado con SimplexSolver y
+las filas del informe (ejecutar_banco / escribir_informe) tienen las columnas CAMPOS y los pivotes.
+Correr con: python -m pytest -q test_benchmark.py
+"""
+import csv
+import json
+
+import pytest
+
+from Benchmark import generar_lp, ejecutar_banco, escribir_informe, medir, CAMPOS, TIPOS, ESPERADO
+from Simplex.SolverSimplex import SimplexSolver
+
+
+@pytest.mark.parametrize("tipo", TIPOS)
+@pytest.mark.parametrize("m,n", [(3, 4), (8, 10), (15, 20)])
+@pytest.mark.parametrize("frac_mayor", [0.0, 0.4])
+@pytest.mark.parametrize("semilla", range(3))
+def test_generadores_dan_el_estado_esperado(tipo, m, n, frac_mayor, semilla):
+    problema = generar_lp(m, n, tipo, semilla, densidad=0.7, frac_mayor=frac_mayor)
+    assert problema["esperado"] == ESPERADO[tipo]
+    solver = SimplexSolver()
+    solver.initialize(problema["modo"], problema["funcion_objetivo"], problema["restricciones"])
+    assert solver.solve(5000)["status"] == problema["esperado"]
+
+
+def test_tipo_desconocido():
+    with pytest.raises(ValueError):
+        generar_lp(3, 3, "ciclico")
+
+
+def test_filas_del_informe(tmp_path):
+    solvers = ["simplex", "dualsimplex", "dosfases", "optimizer", "pulp"]
+    filas = list(ejecutar_banco([(4, 5)], solvers=solvers, instancias=2, repeticiones=2, memoria=True))
+    assert len(filas) == len(TIPOS) * 2 * len(solvers)
+    for fila in filas:
+        assert sorted(fila) == sorted(CAMPOS)
+        if fila["status"] in ("error", "no_disponible"):
+            assert fila["pivotes"] is None and fila["error"]
+        elif fila["solver"] != "pulp":  # CBC no informa pivotes
+            assert isinstance(fila["pivotes"], int) and fila["pivotes"] >= 0
+            assert fila["memoria_pico_kib"] > 0
+        assert 0 <= fila["tiempo_min"] <= fila["tiempo_medio"]
+    propios = [f for f in filas if f["solver"] in ("simplex", "dualsimplex")]
+    assert all(f["status"] == f["esperado"] for f in propios)
+
+    ruta_csv, ruta_json = str(tmp_path / "informe.csv"), str(tmp_path / "informe.json")
+    escribir_informe(filas, ruta_csv)
+    escribir_informe(filas, ruta_json)
+    with open(ruta_csv, encoding="utf-8", newline="") as f:
+        lector = csv.DictReader(f)
+        assert lector.fieldnames == CAMPOS and len(list(lector)) == len(filas)
+    with open(ruta_json, encoding="utf-8") as f:
+        assert json.load(f) == filas
+
+
+def test_medir_con_error_deja_pivotes_en_none():
+    problema = {"tipo": "factible", "esperado": "optimal", "modo": "Max", "funcion_objetivo": "3x1",
+                "restricciones": ["x1 <= abc"]}
+    fila = medir(problema, "simplex", repeticiones=1)
+    assert fila["status"] == "error" and fila["pivotes"] is None and fila["memoria_pico_kib"] is None
@@ -0,0 +1,122 @@
+"""
+Pruebas de SolverDualSimplex contra PL aleatorios con óptimo conocido (conftest.generar_lp):
+arranque dual factible (Min con filas >=), con la cota artificial cuando falta optimalidad dual,
+la razón dual de Harris en modelos degenerados, el estado incremental (xB, y, r, Z, B^{-1}) contra
+un recálculo desde cero y la saliente por steepest-edge dual.
+Correr con: python -m pytest -q test_dual_simplex.py
+"""
+import numpy as np
+import pytest
+
+from DualSimplex.SolverDualSimplex import SolverDualSimplex
+
+
+def resolver(lp, **kw):
+    solver = SolverDualSimplex(**kw)
+    solver.initialize_from_arrays(lp["modo"], lp["c"], lp["A"], lp["tipos"], lp["b"])
+    return solver, solver.solve(5000)
+
+
+@pytest.mark.parametrize("semilla", range(8))
+def test_base_de_holguras_dual_factible(lp_con_optimo, semilla):
+    # Min con filas >= y c >= 0: la base de holguras ya es dual factible y no hace falta la cota
+    lp = lp_con_optimo(np.random.default_rng(800 + semilla), 7, 10, tipos=(">=",), modo="Min")
+    solver, res = resolver(lp)
+    assert solver.fila_cota is None
+    assert res["status"] == "optimal" and res["solution"]["Z"] == pytest.approx(lp["Z"], abs=1e-6)
+
+
+# ################ Cota artificial ################
+@pytest.mark.parametrize("semilla", range(8))
+def test_cota_artificial_llega_al_optimo(lp_con_optimo, semilla):
+    lp = lp_con_optimo(np.random.default_rng(850 + semilla), 7, 10, tipos=("<=", ">="))
+    solver, res = resolver(lp)
+    assert res["status"] == "optimal" and res["solution"]["Z"] == pytest.approx(lp["Z"], abs=1e-6)
+    assert not solver._cota_activa()  # al óptimo la cota no limita (precio sombra 0 o ya se quitó)
+    _, sin_cota = resolver(lp, cota_artificial=False)
+    if np.any(lp["c"] > 0):
+        assert sin_cota["status"] == "dual_infeasible"
+
+
+def test_cota_artificial_detecta_no_acotado_e_infactible():
+    s = SolverDualSimplex()
+    s.initialize("Max", "x1 + x2", ["x1 - x2 <= 2", "x1 <= 5"])
+    assert s.solve()["status"] == "unbounded"
+    s.initialize("Max", "x1 + x2", ["x1 + x2 <= 2", "x1 >= 3"])
+    assert s.solve()["status"] == "infeasible"
+
+
+# ################ Razón dual de Harris ################
+def test_harris_prefiere_el_pivote_grande_entre_razones_casi_empatadas():
+    s = SolverDualSimplex()
+    s.initialize("Min", "x1 + x2 + x3", ["x1 + x2 + x3 >= 1", "x2 >= 1"])  # columnas x1 x2 x3 s1 s2
+    # la razón exacta mínima (0 / 1e-3) cae en x1 con un pivote diminuto; x2 empata dentro de TOL_HARRIS
+    r = np.array([0.0, -1e-10, -0.5, 0.0, 0.0])
+    y_kj = np.array([-1e-3, -1.0, -1.0, 1.0, 0.0])
+    assert s._choose_entering_dual(None, 0, r, y_kj) == 1
+    # fuera de la tolerancia manda la razón
+    r[1] = -1e-4
+    assert s._choose_entering_dual(None, 0, r, y_kj) == 0
+    # sin y_kj < 0 no hay entrante: la fila prueba infactibilidad
+    assert s._choose_entering_dual(None, 0, r, np.abs(y_kj)) is None
+
+
+@pytest.mark.parametrize("semilla", range(6))
+def test_modelos_degenerados_llegan_al_optimo(lp_con_optimo, semilla):
+    # muchas filas con holgura 0 en x* y coeficientes enteros: razones duales empatadas
+    lp = lp_con_optimo(np.random.default_rng(900 + semilla), 14, 8, tipos=(">=",), modo="Min", densidad=0.8)
+    _, res = resolver(lp)
+    assert res["status"] == "optimal" and res["solution"]["Z"] == pytest.approx(lp["Z"], abs=1e-6)
+
+
+# ################ Steepest-edge dual ################
+@pytest.mark.parametrize("semilla", range(8))
+def test_steepest_edge_llega_al_optimo(lp_con_optimo, semilla):
+    lp = lp_con_optimo(np.random.default_rng(950 + semilla), 9, 12, tipos=("<=", ">=") if semilla % 2 else (">=",),
+                       modo="Min", densidad=0.5)
+    _, res = resolver(lp, regla_salida="steepest", sparse=semilla % 3 == 0)
+    _, ref = resolver(lp)
+    assert res["status"] == "optimal"
+    assert res["solution"]["Z"] == pytest.approx(lp["Z"], abs=1e-6) == pytest.approx(ref["solution"]["Z"], abs=1e-6)
+
+
+def test_pesos_actualizados_igual_que_recalculados(lp_con_optimo):
+    lp = lp_con_optimo(np.random.default_rng(990), 10, 12, tipos=(">=",), modo="Min")
+    s = SolverDualSimplex(regla_salida="steepest")
+    s.initialize_from_arrays(lp["modo"], lp["c"], lp["A"], lp["tipos"], lp["b"])
+    while s._iterate(snapshot=False)["status"] == "continue":
+        estado = s._estado
+        if estado is not None and estado["pesos"] is not None:
+            B_inv = np.linalg.inv(s.A[:, s.basis])
+            assert np.allclose(estado["pesos"], (B_inv ** 2).sum(axis=1))
+    assert s.status() == "optimal" and s.iteration > 1
+
+
+@pytest.mark.parametrize("semilla", [1, 2, 4])
+def test_estado_incremental_igual_que_recalculado(lp_con_optimo, semilla):
+    # m > n con holgura 0 en muchas filas: vértice óptimo degenerado y más de RECALCULO_CADA pivotes
+    lp = lp_con_optimo(np.random.default_rng(1200 + semilla), 80, 40, tipos=(">=",), modo="Min", densidad=0.8)
+    s = SolverDualSimplex()
+    s.initialize_from_arrays(lp["modo"], lp["c"], lp["A"], lp["tipos"], lp["b"])
+    recalculos = 0
+    while s._iterate(snapshot=False)["status"] == "continue":
+        estado = s._estado
+        if estado is None:  # llegó a RECALCULO_CADA: el próximo pivote parte de cero
+            recalculos += 1
+            continue
+        B_inv = np.linalg.inv(s.A[:, s.basis])
+        xB, y = B_inv.dot(s.b), s.c[s.basis].dot(B_inv)
+        r = s.c - y.dot(s.A)
+        r[s.basis] = 0.0
+        assert estado["basis"] == s.basis
+        assert np.allclose(estado["B_inv"], B_inv, atol=1e-8) and np.allclose(estado["xB"], xB, atol=1e-8)
+        assert np.allclose(estado["y"], y, atol=1e-8) and np.allclose(estado["r"], r, atol=1e-8)
+        assert estado["Z"] == pytest.approx(s.c[s.basis].dot(xB) + s.z0, abs=1e-8)
+    assert s.status() == "optimal" and s.iteration > 60 and recalculos >= 1
+    assert s.get_solution()["Z"] == pytest.approx(lp["Z"], abs=1e-6)
+    assert np.sum(np.abs(s._compute_current_solution()[0]) < 1e-9) > 0  # base óptima degenerada
+
+
+def test_regla_de_salida_desconocida():
+    with pytest.raises(ValueError):
+        SolverDualSimplex(regla_salida="devex")
@@ -0,0 +1,63 @@
+"""
+Pruebas de Escalado.py: factores potencia de 2 que reducen la dispersión de A, y SimplexSolver con
+escalar=True contra el mismo modelo sin escalar (Z, x y duales en las unidades originales).
+Correr con: python -m pytest -q test_escalado.py
+"""
+import numpy as np
+import pytest
+
+from Escalado import factores_escala
+from Simplex.SolverSimplex import SimplexSolver
+
+
+def mal_escalada(lp, rng):
+    """El mismo PL con filas y columnas multiplicadas por potencias de 10 (el óptimo no cambia de Z)."""
+    m, n = lp["A"].shape
+    fr, fc = 10.0 ** rng.integers(-3, 4, m), 10.0 ** rng.integers(-3, 4, n)
+    return dict(lp, A=lp["A"] * fr[:, None] * fc, b=lp["b"] * fr, c=lp["c"] * fc), fc
+
+
+def dispersion(D):
+    l = np.log2(np.abs(D[D != 0]))
+    return l.max() - l.min()
+
+
+@pytest.mark.parametrize("semilla", range(4))
+def test_factores_potencia_de_2_que_equilibran(lp_con_optimo, semilla):
+    rng = np.random.default_rng(1000 + semilla)
+    lp, _ = mal_escalada(lp_con_optimo(rng, 8, 10), rng)
+    D = lp["A"]
+    filas, columnas = np.nonzero(D)
+    R, S = factores_escala(filas, columnas, D[filas, columnas], D.shape)
+    assert np.array_equal(np.log2(R), np.round(np.log2(R))) and np.array_equal(np.log2(S), np.round(np.log2(S)))
+    assert dispersion(D * R[:, None] * S) < dispersion(D)
+
+
+def test_filas_y_columnas_vacias_quedan_con_factor_1():
+    R, S = factores_escala([0], [1], [8.0], (3, 3))
+    assert R[1] == R[2] == S[0] == S[2] == 1.0
+    assert factores_escala([], [], [], (2, 2))[0].tolist() == [1.0, 1.0]
+
+
+@pytest.mark.parametrize("sparse", [False, True])
+@pytest.mark.parametrize("semilla", range(6))
+def test_escalar_no_cambia_la_solucion(lp_con_optimo, sparse, semilla):
+    rng = np.random.default_rng(1050 + semilla)
+    lp = lp_con_optimo(rng, 7, 9, tipos=("<=", ">=", "="), modo="Min" if semilla % 2 else "Max")
+    lp, _ = mal_escalada(lp, rng)
+    resultados = []
+    for escalar in (False, True):
+        solver = SimplexSolver(escalar=escalar, sparse=sparse, regla_precios="dantzig")
+        solver.initialize_from_arrays(lp["modo"], lp["c"], lp["A"], lp["tipos"], lp["b"])
+        res = solver.solve(5000)
+        assert res["status"] == "optimal"
+        resultados.append((res["solution"], solver.get_duals()))
+    (sin, y_sin), (con, y_con) = resultados
+    assert con["Z"] == pytest.approx(sin["Z"], rel=1e-9) == pytest.approx(lp["Z"], rel=1e-9)
+    # x y los duales vuelven a las unidades originales
+    x = np.array([con[f"x{j + 1}"] for j in range(lp["c"].size)])
+    Ax, tol = lp["A"].dot(x), 1e-7 * np.abs(lp["b"]).max()
+    cumple = {"<=": Ax <= lp["b"] + tol, ">=": Ax >= lp["b"] - tol, "=": np.abs(Ax - lp["b"]) <= tol}
+    assert all(cumple[t][i] for i, t in enumerate(lp["tipos"])) and np.all(x >= -1e-9)
+    assert lp["c"].dot(x) == pytest.approx(lp["Z"], rel=1e-9)
+    assert np.dot(y_con, lp["b"]) == pytest.approx(np.dot(y_sin, lp["b"]), rel=1e-9)
@@ -0,0 +1,72 @@
+"""
+Pruebas de Factorizacion.py: ftran / btran contra resolver el sistema con NumPy, con y sin etas.
+Correr con: python -m pytest -q test_factorizacion.py
+"""
+import numpy as np
+import pytest
+
+from Factorizacion import FactorizacionLU
+
+
+def base_aleatoria(rng, m, densidad=1.0):
+    """B bien condicionada: lógicas (±e_i permutadas) con algunas columnas estructurales."""
+    B = np.eye(m)
+    k = int(m * densidad)
+    B[:, :k] = (rng.random((m, k)) < 0.4) * rng.normal(size=(m, k)) * 0.5 + 4 * np.eye(m)[:, :k]
+    B *= rng.choice([-1.0, 1.0], m)
+    return B[rng.permutation(m)][:, rng.permutation(m)]
+
+
+@pytest.mark.parametrize("semilla", range(6))
+@pytest.mark.parametrize("densidad", [0.0, 0.3, 1.0])
+def test_ftran_btran(semilla, densidad):
+    rng = np.random.default_rng(semilla)
+    m = 3 + semilla * 5
+    B = base_aleatoria(rng, m, densidad)
+    f = FactorizacionLU(B)
+    a, c = rng.normal(size=m), rng.normal(size=m)
+    assert np.allclose(B.dot(f.ftran(a)), a)
+    assert np.allclose(f.btran(c).dot(B), c)
+    bloque = rng.normal(size=(m, 4))
+    assert np.allclose(B.dot(f.ftran(bloque)), bloque)
+    assert np.allclose(f.inverse(), np.linalg.inv(B))
+
+
+def test_etas_siguen_a_la_base():
+    rng = np.random.default_rng(7)
+    m = 12
+    B = base_aleatoria(rng, m, 0.5)
+    f = FactorizacionLU(B, refactor_cada=5)
+    for _ in range(5):
+        a = rng.normal(size=m)
+        d = f.ftran(a)
+        r = int(np.argmax(np.abs(d)))
+        f.update(r, d)
+        B[:, r] = a
+        x = rng.normal(size=m)
+        assert np.allclose(B.dot(f.ftran(x)), x)
+        assert np.allclose(f.btran(x).dot(B), x)
+    assert f.necesita_refactor()
+    f.refactor(B)
+    assert f.etas == [] and np.allclose(B.dot(f.ftran(x)), x)
+
+
+def test_pivote_nulo_y_base_singular():
+    f = FactorizacionLU(np.eye(3))
+    with pytest.raises(np.linalg.LinAlgError):
+        f.update(0, np.array([0.0, 1.0, 1.0]))
+    with pytest.raises(np.linalg.LinAlgError):
+        FactorizacionLU(np.array([[1.0, 2.0], [2.0, 4.0]]))
+
+
+def test_reparacion_con_logicas():
+    # la segunda columna repite la primera: se reemplaza por la holgura de la fila libre
+    B = np.array([[1.0, 1.0, 0.0], [2.0, 2.0, 0.0], [0.0, 0.0, 3.0]])
+    f = FactorizacionLU(B, logicas=np.array([1.0, -1.0, 1.0]))
+    assert len(f.reparadas) == 1
+    pos, fila = f.reparadas[0]
+    reparada = B.copy()
+    reparada[:, pos] = 0.0
+    reparada[fila, pos] = [1.0, -1.0, 1.0][fila]
+    x = np.array([1.0, 2.0, 3.0])
+    assert np.allclose(reparada.dot(f.ftran(x)), x)
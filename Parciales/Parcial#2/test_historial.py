@@ -0,0 +1,68 @@
+"""
+Pruebas de Historial.py: el tableau reconstruido desde el historial compacto igual al que se vio en
+vivo en cada iterate_one (con cambio de fase y con variables acotadas), la retención acotada
+(historial_max) y el derrame de los pivotes desalojados a archivo.
+Correr con: python -m pytest -q test_historial.py
+"""
+import numpy as np
+import pytest
+
+from Simplex.SolverSimplex import SimplexSolver
+from Historial import HistorialIteraciones
+
+
+def paso_a_paso(lp, **kw):
+    """Resuelve con iterate_one y devuelve (solver, {iteración: tableau visto en vivo})."""
+    solver = SimplexSolver(**kw)
+    solver.initialize_from_arrays(lp["modo"], lp["c"], lp["A"], lp["tipos"], lp["b"], lo=lp.get("lo"), up=lp.get("up"))
+    vivos = {}
+    while solver.status() not in ("optimal", "unbounded", "infeasible"):
+        info = solver.iterate_one()
+        if info.get("status") == "continue":
+            vivos[info["iteration"]] = dict(info["snapshot"])
+    return solver, vivos
+
+
+def mismo_tableau(t1, t2):
+    assert t1["var_names"] == t2["var_names"]
+    for f1, f2 in zip(t1["rows"] + [t1["z_row"]], t2["rows"] + [t2["z_row"]]):
+        assert f1["base_name"] == f2["base_name"]
+        assert np.allclose(f1["coeffs"], f2["coeffs"]) and f1["rhs"] == pytest.approx(f2["rhs"])
+    assert len(t1["rows"]) == len(t2["rows"])
+
+
+@pytest.mark.parametrize("acotado", [False, True])
+@pytest.mark.parametrize("semilla", range(4))
+def test_tableau_reconstruido_igual_al_vivo(lp_con_optimo, acotado, semilla):
+    rng = np.random.default_rng(1100 + semilla)
+    lp = lp_con_optimo(rng, 6, 8, tipos=("<=", ">=", "="))  # con "=" y ">=" hay fase I y cambio de fase
+    if acotado:
+        lp["up"] = np.where(rng.random(8) < 0.5, lp["x"] + rng.integers(0, 3, 8), np.inf)
+    solver, vivos = paso_a_paso(lp)
+    assert len(vivos) > 0 and len(solver.history) == len(vivos)
+    for k, vivo in vivos.items():
+        mismo_tableau(solver.get_tableau_at(k), vivo)
+    for info in solver.history:  # el recorrido incremental da lo mismo que el acceso por índice
+        mismo_tableau(dict(info["snapshot"]), vivos[info["iteration"]])
+
+
+@pytest.mark.parametrize("semilla", range(3))
+def test_retencion_acotada_y_derrame_a_archivo(lp_con_optimo, tmp_path, semilla):
+    lp = lp_con_optimo(np.random.default_rng(1150 + semilla), 8, 10, tipos=("<=", ">=", "="))
+    completo, vivos = paso_a_paso(lp)
+    archivo = str(tmp_path / "pivotes.bin")
+    acotado, _ = paso_a_paso(lp, historial_max=3, historial_archivo=archivo)
+    todos = completo.history.registros()
+    assert todos.size > 3 and len(acotado.history) == 3 and acotado.history.total == todos.size
+    # los retenidos son los 3 últimos y se reconstruyen igual; los desalojados están en el archivo
+    retenidos = acotado.history.registros()
+    assert np.array_equal(retenidos, todos[-3:])
+    for k in retenidos["iteration"]:
+        mismo_tableau(acotado.get_tableau_at(int(k)), vivos[int(k)])
+    assert acotado.get_tableau_at(int(todos[0]["iteration"])) is None
+    assert np.array_equal(HistorialIteraciones.leer_archivo(archivo), todos[:-3])
+
+
+def test_capacidad_no_positiva():
+    with pytest.raises(ValueError):
+        HistorialIteraciones(capacidad=0)
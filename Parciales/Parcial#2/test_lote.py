@@ -0,0 +1,119 @@
+"""
+Pruebas de Lote.py: lectura de instancias (texto plano, .json, .mps), resolver_instancia con cada
+método y resolver_en_paralelo / main contra la resolución secuencial.
+Correr con: python -m pytest -q test_lote.py
+"""
+import json
+import os
+import sys
+
+import pytest
+
+from ArchivosModelo import escribir_modelo, ModeloLP
+from Lote import cargar_instancias, resolver_instancia, resolver_en_paralelo, main, DIR_PARCIAL
+
+WYNDOR = {"modo": "Max", "funcion_objetivo": "3x1 + 5x2", "restricciones": ["x1 <= 4", "2x2 <= 12", "3x1 + 2x2 <= 18"]}
+
+TEXTO = """# dos problemas separados por una línea en blanco
+Max 3x1 + 5x2
+x1 <= 4
+2x2 <= 12   # comentario al final
+3x1 + 2x2 <= 18
+
+min: 2x1 + 3x2
+x1 + x2 >= 4
+x1 >= 1
+"""
+
+
+# ################ Lectura de instancias ################
+def test_texto_plano(tmp_path):
+    ruta = tmp_path / "problemas.txt"
+    ruta.write_text(TEXTO, encoding="utf-8")
+    a, b = cargar_instancias(str(ruta))
+    assert a == dict(WYNDOR, nombre="problemas.txt#1")
+    assert b == {"modo": "Min", "funcion_objetivo": "2x1 + 3x2", "restricciones": ["x1 + x2 >= 4", "x1 >= 1"],
+                 "nombre": "problemas.txt#2"}
+
+
+def test_texto_sin_encabezado(tmp_path):
+    ruta = tmp_path / "malo.txt"
+    ruta.write_text("x1 <= 4\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="malo.txt:1"):
+        cargar_instancias(str(ruta))
+
+
+def test_json_uno_o_lista(tmp_path):
+    uno, lista = tmp_path / "uno.json", tmp_path / "lista.json"
+    uno.write_text(json.dumps(WYNDOR), encoding="utf-8")
+    lista.write_text(json.dumps([WYNDOR, dict(WYNDOR, nombre="propio")]), encoding="utf-8")
+    assert [p["nombre"] for p in cargar_instancias(str(uno))] == ["uno.json"]
+    assert [p["nombre"] for p in cargar_instancias(str(lista))] == ["lista.json#1", "propio"]
+
+
+def test_mps_se_carga_como_modelo(tmp_path):
+    ruta = str(tmp_path / "wyndor.mps")
+    escribir_modelo(ModeloLP.desde_texto(WYNDOR["modo"], WYNDOR["funcion_objetivo"], WYNDOR["restricciones"]), ruta)
+    (problema,) = cargar_instancias(ruta)
+    assert problema["nombre"] == "wyndor.mps"
+    assert resolver_instancia(problema, "dualsimplex")["solution"]["Z"] == pytest.approx(36.0)
+
+
+# ################ Resolución ################
+@pytest.mark.parametrize("metodo,opciones", [("simplex", {}), ("simplex", {"sparse": True, "regla_precios": "devex"}),
+                                             ("simplex", {"presolve": True, "escalar": True}),
+                                             ("dualsimplex", {}), ("dualsimplex", {"regla_precios": "steepest"})])
+def test_resolver_instancia(metodo, opciones):
+    res = resolver_instancia(dict(WYNDOR, nombre="wyndor"), metodo, **opciones)
+    assert (res["nombre"], res["metodo"], res["status"]) == ("wyndor", metodo, "optimal")
+    assert [res["solution"][k] for k in ("x1", "x2", "Z")] == pytest.approx([2.0, 6.0, 36.0])
+    assert res["tiempo"] >= 0.0
+    json.dumps(res)  # serializable
+
+
+@pytest.mark.parametrize("metodo", ["dosfases", "optimizer"])
+def test_metodos_externos(metodo):
+    pytest.importorskip("rich")
+    res = resolver_instancia(dict(WYNDOR), metodo)
+    assert res["status"] == "optimal" and res["solution"]["Z"] == pytest.approx(36.0)
+
+
+def test_dosfases_sin_show_steps_no_imprime(capsys):
+    pytest.importorskip("rich")
+    sys.path.append(os.path.join(DIR_PARCIAL, "Parcial#2p2"))
+    from SimplexDosFases import metodo_dos_fases
+
+    # RHS negativo (normalización) y una fila >= (Fase I): todos los mensajes quedan bajo show_steps
+    salida = metodo_dos_fases("MAX", [3, 5], [[1, 0], [0, 2], [3, 2], [-1, -1]], ["<=", "<=", "<=", "<="],
+                              [4, 12, 18, -1], show_steps=False)
+    assert salida[1] == pytest.approx(36.0)
+    assert capsys.readouterr().out == ""
+
+
+def test_errores_se_devuelven_en_el_resultado():
+    modelo = ModeloLP.desde_texto("Max", "x1", ["x1 <= 1"])
+    res = resolver_instancia({"nombre": "m", "modelo": modelo}, "dosfases")
+    assert res["status"] == "error" and "sólo acepta problemas en texto" in res["error"]
+    res = resolver_instancia({"modo": "Max", "funcion_objetivo": "3x1", "restricciones": ["x1 <= abc"]})
+    assert res["status"] == "error" and res["solution"] is None and "abc" in res["error"]
+    assert res["iterations"] is None  # no se confunde con una resolución sin pivotes
+
+
+def test_en_paralelo_igual_que_secuencial():
+    problemas = [dict(WYNDOR, nombre=f"w{k}", restricciones=WYNDOR["restricciones"] + [f"x1 + x2 <= {k}"])
+                 for k in range(1, 8)]
+    secuencial = {p["nombre"]: resolver_instancia(dict(p)) for p in problemas}
+    paralelo = list(resolver_en_paralelo(problemas, procesos=2, bloque=3))
+    assert sorted(r["nombre"] for r in paralelo) == sorted(secuencial)
+    for r in paralelo:
+        ref = secuencial[r["nombre"]]
+        assert r["status"] == ref["status"] and r["solution"] == ref["solution"]
+
+
+def test_main_escribe_json_lines(tmp_path):
+    entrada, salida = tmp_path / "p.txt", tmp_path / "r.jsonl"
+    entrada.write_text(TEXTO, encoding="utf-8")
+    assert main([str(entrada), "--metodo", "simplex", "--salida", str(salida)]) == 0
+    resultados = [json.loads(linea) for linea in salida.read_text(encoding="utf-8").splitlines()]
+    assert [r["nombre"] for r in resultados] == ["p.txt#1", "p.txt#2"]
+    assert [r["solution"]["Z"] for r in resultados] == pytest.approx([36.0, 8.0])
@@ -0,0 +1,74 @@
+"""
+Pruebas de MatrizDispersa.py: cada operación de MatrizCSC contra la misma operación sobre la
+matriz densa, las tripletas y las filas agregadas, y los solvers con sparse=True contra sparse=False.
+Correr con: python -m pytest -q test_matriz_dispersa.py
+"""
+import numpy as np
+import pytest
+
+from MatrizDispersa import MatrizCSC
+from Simplex.SolverSimplex import SimplexSolver
+from DualSimplex.SolverDualSimplex import SolverDualSimplex
+
+
+def aleatoria(semilla, m=7, n=11):
+    rng = np.random.default_rng(semilla)
+    return (rng.random((m, n)) < 0.3) * rng.normal(size=(m, n)), rng
+
+
+@pytest.mark.parametrize("semilla", range(5))
+def test_operaciones_contra_la_densa(semilla):
+    D, rng = aleatoria(semilla)
+    A = MatrizCSC.from_dense(D)
+    m, n = D.shape
+    x, y, Y = rng.normal(size=n), rng.normal(size=m), rng.normal(size=(3, m))
+    assert np.array_equal(A.toarray(), D) and A.nnz == np.count_nonzero(D)
+    assert np.allclose(A.matvec(x), D.dot(x))
+    assert np.allclose(A.rmatvec(y), y.dot(D))
+    assert np.allclose(A.rmatvec_rango(y, 2, 8), y.dot(D[:, 2:8]))
+    assert np.allclose(A.rmatvec_cols(y, [5, 0, 9]), y.dot(D[:, [5, 0, 9]]))
+    assert np.allclose(A.rmatmat(Y), Y.dot(D))
+    assert np.array_equal(A.column(4), D[:, 4])
+    assert np.array_equal(A.columns([3, 1]), D[:, [3, 1]])
+    assert np.array_equal(A.take(rows=[6, 0, 2], cols=[1, 10, 4]).toarray(), D[[6, 0, 2]][:, [1, 10, 4]])
+
+
+def test_tripletas_suman_repetidos_y_descartan_ceros():
+    A = MatrizCSC.from_triplets([0, 1, 0, 1], [2, 0, 2, 1], [1.5, 2.0, 2.5, 0.0], (2, 3))
+    assert np.array_equal(A.toarray(), [[0, 0, 4.0], [2.0, 0, 0]]) and A.nnz == 2
+    assert MatrizCSC.from_triplets([], [], [], (3, 2)).toarray().shape == (3, 2)
+
+
+@pytest.mark.parametrize("semilla", range(3))
+def test_tripletas_y_filas_agregadas(semilla):
+    D, _ = aleatoria(semilla)
+    A = MatrizCSC.from_dense(D)
+    filas, columnas, valores = A.triplets()
+    assert np.array_equal(MatrizCSC.from_triplets(filas, columnas, valores, D.shape).toarray(), D)
+    assert np.all(np.diff(columnas) >= 0)  # ordenadas por columna, como el almacenamiento
+    m, n = D.shape
+    # dos filas nuevas (una con el 0 que se descarta) y una columna vacía más
+    ampliada = A.agregar_filas([m, m, m + 1, m + 1], [0, 10, 3, 5], [1.0, 2.0, -1.0, 0.0])
+    esperada = np.vstack([D, np.zeros((2, n))])
+    esperada[m, [0, 10]], esperada[m + 1, 3] = [1.0, 2.0], -1.0
+    assert np.array_equal(ampliada.toarray(), esperada)
+    con_columna = A.agregar_filas([m], [n], [1.0], (m + 1, n + 1))
+    assert con_columna.shape == (m + 1, n + 1) and con_columna.column(n).tolist() == [0.0] * m + [1.0]
+    assert np.array_equal(A.toarray(), D)  # la original no cambia
+
+
+@pytest.mark.parametrize("clase", [SimplexSolver, SolverDualSimplex])
+@pytest.mark.parametrize("semilla", range(6))
+def test_solvers_densos_y_dispersos_coinciden(lp_con_optimo, clase, semilla):
+    lp = lp_con_optimo(np.random.default_rng(500 + semilla), 9, 12, tipos=("<=", ">="),
+                       modo="Min" if semilla % 2 else "Max", densidad=0.3)
+    soluciones = []
+    for sparse in (False, True):
+        solver = clase(sparse=sparse)
+        solver.initialize_from_arrays(lp["modo"], lp["c"], lp["A"], lp["tipos"], lp["b"])
+        res = solver.solve(5000)
+        assert res["status"] == "optimal"
+        soluciones.append((res["solution"]["Z"], res["iterations"], solver.get_duals()))
+    (Z_d, it_d, y_d), (Z_s, it_s, y_s) = soluciones
+    assert Z_d == pytest.approx(Z_s) == pytest.approx(lp["Z"], abs=1e-6)
+    assert it_d == it_s and np.allclose(y_d, y_s)
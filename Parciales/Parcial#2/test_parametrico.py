@@ -0,0 +1,153 @@
+"""
+Pruebas de Parametrico.py: la curva Z*(t) de un lado derecho o de un costo se compara con resolver
+el modelo desde cero en cada quiebre, en los extremos del intervalo y entre quiebres.
+Correr con: python -m pytest -q test_parametrico.py
+"""
+import numpy as np
+import pytest
+
+from Simplex.SolverSimplex import SimplexSolver
+from DualSimplex.SolverDualSimplex import SolverDualSimplex
+from Parametrico import curva_rhs, curva_costo, evaluar, barrido_rhs
+
+
+def resolver(modo, fo, restricciones, clase=SimplexSolver, **kw):
+    solver = clase(**kw)
+    solver.initialize(modo, fo, restricciones)
+    res = solver.solve(5000)
+    return solver, res
+
+
+def z_en_frio(modo, fo, restricciones, clase=SimplexSolver, **kw):
+    """Z* resolviendo desde cero: NaN si es infactible, +-inf si no es acotado."""
+    _, res = resolver(modo, fo, restricciones, clase, **kw)
+    if res["status"] == "optimal":
+        return res["solution"]["Z"]
+    if res["status"] == "unbounded":
+        return -np.inf if modo == "Min" else np.inf
+    return np.nan
+
+
+def modelo_aleatorio(rng, m, n, mixto):
+    """FO y restricciones en texto con una solución factible conocida (x0) antes de mover el RHS."""
+    A = rng.integers(1, 9, (m, n)) * (rng.random((m, n)) < 0.6)
+    c = rng.integers(1, 9, n)
+    b = A.dot(rng.random(n) * 3)
+    restricciones = []
+    for i in range(m):
+        if not A[i].any():
+            continue
+        tipo = rng.choice(["<=", ">=", "="]) if mixto else "<="
+        rhs = {"<=": b[i] + rng.integers(1, 5), ">=": b[i] - rng.integers(1, 5), "=": b[i]}[tipo]
+        izquierda = " + ".join(f"{A[i, j]}x{j + 1}" for j in range(n) if A[i, j])
+        restricciones.append(f"{izquierda} {tipo} {round(float(rhs), 2)}")
+    return " + ".join(f"{c[j]}x{j + 1}" for j in range(n)), restricciones
+
+
+def con_rhs(restricciones, i, valor):
+    return restricciones[:i] + [restricciones[i].rsplit(" ", 1)[0] + f" {float(valor):.12f}"] + restricciones[i + 1:]
+
+
+def fo_con_costo(fo, j, valor):
+    costos = [float(t.split("x")[0]) for t in fo.split(" + ")]
+    costos[j] = float(valor)
+    return " + ".join(f"{v:.12f}x{k + 1}" for k, v in enumerate(costos))
+
+
+def puntos_de_control(curva, desde, hasta):
+    """Extremos, quiebres y puntos medios de cada tramo."""
+    puntos = {desde, hasta}
+    for t in curva:
+        puntos.update((t["desde"], t["hasta"], (t["desde"] + t["hasta"]) / 2))
+    return np.array(sorted(puntos))
+
+
+def iguales(a, b):
+    return np.allclose(a, b, rtol=1e-6, atol=1e-6, equal_nan=True)
+
+
+# ################ Casos chicos ################
+def test_extremo_factible_de_la_curva_no_es_nan():
+    solver, _ = resolver("Max", "x1", ["x1 <= 10", "x1 >= 2"])
+    curva = curva_rhs(solver, 1, 0, 20)  # x1 >= t: factible sólo hasta t = 10
+    assert [t["estado"] for t in curva] == ["optimal", "infeasible"]
+    assert iguales(evaluar(curva, [0, 10, 10.5, 20]), [10, 10, np.nan, np.nan])
+
+    curva = curva_rhs(solver, 0, 0, 20)  # x1 <= t: infactible por debajo de 2
+    assert iguales(evaluar(curva, [0, 1.9, 2, 20]), [np.nan, np.nan, 2, 20])
+
+
+def test_wyndor_quiebres_del_rhs_y_del_costo():
+    restricciones = ["x1 <= 4", "2x2 <= 12", "3x1 + 2x2 <= 18"]
+    solver, _ = resolver("Max", "3x1 + 5x2", restricciones)
+    curva = curva_rhs(solver, 2, 0, 40)
+    assert [(t["desde"], t["hasta"], t["pendiente"]) for t in curva] == [(0, 12, 2.5), (12, 24, 1.0), (24, 40, 0.0)]
+    curva = curva_costo(solver, "x1", -5, 20)
+    assert [t["hasta"] for t in curva] == [0.0, 7.5, 20.0]
+    assert iguales(evaluar(curva, [-5, 0, 7.5, 20]), [30, 30, 45, 95])
+    # el solver vuelve al modelo original
+    assert solver.status() == "optimal" and solver.get_solution()["Z"] == pytest.approx(36.0)
+
+
+def test_cambios_no_tocan_el_historial():
+    solver = SimplexSolver()
+    solver.initialize("Max", "3x1 + 5x2", ["x1 <= 4", "2x2 <= 12", "3x1 + 2x2 <= 18"])
+    solver.solve(record_history=True)
+    iteraciones = solver.history.registros()["iteration"]
+    antes = [solver.get_tableau_at(k) for k in iteraciones]
+    solver.cambiar_rhs(2, 30)
+    solver.solve(record_history=True)
+    solver.cambiar_costo("x1", 10)
+    solver.solve(record_history=True)
+    despues = [solver.get_tableau_at(k) for k in iteraciones]
+    assert len(antes) > 0
+    for a, d in zip(antes, despues):
+        for fila_a, fila_d in zip(a["rows"] + [a["z_row"]], d["rows"] + [d["z_row"]]):
+            assert np.allclose(fila_a["coeffs"] + [fila_a["rhs"]], fila_d["coeffs"] + [fila_d["rhs"]])
+
+
+def test_sin_tramos_de_ancho_cero():
+    solver, _ = resolver("Max", "3x1 + 2x2", ["0.1x1 + 0.3x2 <= 6", "0.7x1 + 0.2x2 <= 14", "x1 + x2 <= 25"])
+    for fila in range(3):
+        curva = curva_rhs(solver, fila, 0, 60)
+        assert all(t["hasta"] - t["desde"] > 1e-9 for t in curva)
+        assert curva[0]["desde"] == 0 and curva[-1]["hasta"] == 60
+
+
+# ################ Modelos aleatorios contra resolver desde cero ################
+@pytest.mark.parametrize("semilla", range(24))
+def test_curva_rhs_contra_resolver_en_frio(semilla):
+    rng = np.random.default_rng(semilla)
+    mixto = semilla % 2 == 0
+    fo, restricciones = modelo_aleatorio(rng, 5, 6, mixto)
+    modo = "Min" if mixto and semilla % 4 == 0 else "Max"
+    clase, kw = [(SimplexSolver, {}), (SimplexSolver, {"escalar": True, "sparse": True}),
+                 (SolverDualSimplex, {}), (SimplexSolver, {"regla_precios": "steepest"})][semilla % 4]
+    if clase is SolverDualSimplex and mixto:
+        clase, kw = SimplexSolver, {"regla_precios": "dantzig"}
+    solver, res = resolver(modo, fo, restricciones, clase, **kw)
+    if res["status"] != "optimal":
+        pytest.skip("el modelo original no tiene óptimo")
+    i = semilla % len(restricciones)
+    base = float(restricciones[i].rsplit(" ", 1)[1])
+    curva = curva_rhs(solver, i, base - 30, base + 30)
+    puntos = puntos_de_control(curva, base - 30, base + 30)
+    esperado = [z_en_frio(modo, fo, con_rhs(restricciones, i, v), clase, **kw) for v in puntos]
+    assert iguales(evaluar(curva, puntos), esperado)
+    assert iguales(barrido_rhs(solver, i, puntos), esperado)
+
+
+@pytest.mark.parametrize("semilla", range(12))
+def test_curva_costo_contra_resolver_en_frio(semilla):
+    rng = np.random.default_rng(100 + semilla)
+    fo, restricciones = modelo_aleatorio(rng, 5, 6, semilla % 2 == 0)
+    modo = "Min" if semilla % 3 == 0 else "Max"
+    solver, res = resolver(modo, fo, restricciones)
+    if res["status"] != "optimal":
+        pytest.skip("el modelo original no tiene óptimo")
+    j = semilla % 6
+    costo = float(fo.split(" + ")[j].split("x")[0])
+    curva = curva_costo(solver, f"x{j + 1}", costo - 15, costo + 15)
+    puntos = puntos_de_control(curva, costo - 15, costo + 15)
+    esperado = [z_en_frio(modo, fo_con_costo(fo, j, v), restricciones) for v in puntos]
+    assert iguales(evaluar(curva, puntos), esperado)
@@ -0,0 +1,71 @@
+"""
+Pruebas de Parser.py: términos dispersos, parse_many, el orden de las columnas de TablaVariables y
+la caché LRU de expresiones (aciertos y resultados que el llamador puede modificar sin romperla).
+Correr con: python -m pytest -q test_parser.py
+"""
+import numpy as np
+import pytest
+
+from Parser import Parsear, parse_many, TablaVariables, _parsear_normalizada
+from Simplex.SolverSimplex import SimplexSolver
+from DualSimplex.SolverDualSimplex import SolverDualSimplex
+
+
+def test_parsear_sin_tabla_usa_el_indice_natural():
+    p = Parsear("3*X2 - x1 + 2x12 >= 7.5")
+    assert p["terminos"] == [(1, 3.0), (0, -1.0), (11, 2.0)]
+    assert (p["operador"], p["constante"], p["max_var"]) == (">=", 7.5, 11)
+    assert len(p["coef"]) == 12 and p["coef"][11] == 2.0
+
+
+def test_parse_many_tripletas():
+    p = parse_many(["x1 + 2x3 <= 4", "5x2 = 1"], densa=True)
+    assert list(p["filas"]) == [0, 0, 1] and list(p["columnas"]) == [0, 2, 1]
+    assert p["operadores"] == ["<=", "="] and list(p["constantes"]) == [4.0, 1.0]
+    assert np.array_equal(p["coef"], [[1, 0, 2], [0, 5, 0]])
+
+
+@pytest.mark.parametrize("expresion", ["", "3 <= 4", "3w1 <= 2", "x1 <= a"])
+def test_errores(expresion):
+    with pytest.raises(ValueError):
+        Parsear(expresion)
+
+
+def test_tabla_ordenada_por_indice():
+    tabla = TablaVariables.ordenada(["5x7 + 3x2", "x10 + x1 <= 4"])
+    assert tabla.nombres == ["x1", "x2", "x7", "x10"]
+    assert Parsear("5x7 + 3x2", tabla)["terminos"] == [(2, 5.0), (1, 3.0)]
+
+
+def test_cache_acierta_y_no_comparte_resultados_mutables():
+    expresion = "7x3 - 2.5x41 + x9 <= 123.25"  # no aparece en otras pruebas: el primer parseo es un fallo
+    antes = _parsear_normalizada.cache_info()
+    p = Parsear(expresion)
+    assert _parsear_normalizada.cache_info().misses == antes.misses + 1
+    # la misma expresión (también con otros espacios / mayúsculas) sale de la caché
+    q = Parsear(expresion)
+    Parsear("  7X3 -   2.5x41 + x9 <= 123.25 ")
+    assert _parsear_normalizada.cache_info().hits == antes.hits + 2
+    assert p == q and p is not q and p["terminos"] is not q["terminos"] and p["coef"] is not q["coef"]
+
+    # lo que guarda la caché es inmutable, y modificar un resultado no cambia los siguientes
+    terminos, _, _ = _parsear_normalizada("7x3 - 2.5x41 + x9 <= 123.25")
+    assert isinstance(terminos, tuple) and all(isinstance(t, tuple) for t in terminos)
+    p["terminos"].append((0, 99.0))
+    p["coef"][2] = -1.0
+    p["constante"] = 0.0
+    r = Parsear(expresion)
+    assert r == q and r["terminos"] == [(2, 7.0), (40, -2.5), (8, 1.0)] and r["coef"][2] == 7.0
+    a, b = parse_many([expresion]), parse_many([expresion])
+    a["valores"][0] = 0.0
+    assert b["valores"][0] == 7.0 and parse_many([expresion])["valores"][0] == 7.0
+
+
+@pytest.mark.parametrize("clase", [SimplexSolver, SolverDualSimplex])
+def test_columnas_no_dependen_del_orden_de_los_terminos(clase):
+    a, b = clase(), clase()
+    a.initialize("Max", "x1 + 3x2", ["x1 <= 4", "2x2 <= 12", "3x1 + 2x2 <= 18"])
+    b.initialize("Max", "3x2 + x1", ["x1 <= 4", "2x2 <= 12", "2x2 + 3x1 <= 18"])
+    assert a.var_names == b.var_names and a.var_names[:5] == ["x1", "x2", "s1", "s2", "s3"]
+    assert a.solve()["iterations"] == b.solve()["iterations"]
+    assert a.get_solution() == b.get_solution()
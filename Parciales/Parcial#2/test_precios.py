@@ -0,0 +1,121 @@
+"""
+Pruebas de Precios.py: costos reducidos sobre la máscara de no básicas (A densa o CSC), la entrante
+de cada regla, precios parciales / múltiples, variables acotadas, el paso a Bland tras pivotes
+degenerados y la actualización de los pesos steepest-edge contra los exactos.
+Correr con: python -m pytest -q test_precios.py
+"""
+import numpy as np
+import pytest
+
+from MatrizDispersa import MatrizCSC
+from Precios import MotorPrecios, MAX_DEGENERADOS
+
+
+def modelo(semilla, m=5, n=12):
+    """[A | I] con la base de holguras, y un y cualquiera."""
+    rng = np.random.default_rng(semilla)
+    A = np.hstack([(rng.random((m, n - m)) < 0.6) * rng.normal(size=(m, n - m)), np.eye(m)])
+    return A, rng.normal(size=n), rng.normal(size=m), list(range(n - m, n))
+
+
+@pytest.mark.parametrize("sparse", [False, True])
+def test_costos_reducidos_y_mascara(sparse):
+    A, c, y, basis = modelo(0)
+    p = MotorPrecios()
+    p.sync(basis, A.shape[1])
+    r = p.reduced_costs(MatrizCSC.from_dense(A) if sparse else A, c, y)
+    esperado = c - y.dot(A)
+    esperado[basis] = 0.0
+    assert np.allclose(r, esperado)
+    p.pivot(0, 2, basis[0])
+    assert not p.nonbasic[2] and p.nonbasic[basis[0]]
+    mascara = np.ones(A.shape[1], dtype=bool)
+    mascara[[2] + basis[1:]] = False
+    assert np.array_equal(p.sync([2] + basis[1:], A.shape[1]), mascara)
+
+
+def test_elegir_segun_la_regla():
+    r = np.array([0.5, 3.0, -4.0, 2.0])
+    candidatos = r > 0
+    assert MotorPrecios("bland").elegir(candidatos, r) == 0
+    assert MotorPrecios("dantzig").elegir(candidatos, r) == 1
+    steepest = MotorPrecios("steepest")
+    steepest.pesos = np.array([1.0, 100.0, 1.0, 1.0])  # r^2 / w: 0.25, 0.09, -, 4
+    assert steepest.elegir(candidatos, r) == 3
+    assert MotorPrecios("dantzig").elegir(np.zeros(4, dtype=bool), r) is None
+
+
+def test_reglas_y_tamanos_invalidos():
+    with pytest.raises(ValueError):
+        MotorPrecios("mayor")
+    with pytest.raises(ValueError):
+        MotorPrecios("dantzig", candidatos=0)
+
+
+@pytest.mark.parametrize("opciones", [{}, {"bloque": 3}, {"candidatos": 2}, {"bloque": 4, "candidatos": 3}])
+@pytest.mark.parametrize("signo", [1, -1])
+def test_entrante_mejora_o_none(opciones, signo):
+    A, c, y, basis = modelo(1)
+    r = c - y.dot(A)
+    p = MotorPrecios("dantzig", **opciones)
+    p.sync(basis, A.shape[1])
+    vistos = set()
+    for _ in range(6):  # varias llamadas: rota el bloque y consume la lista de candidatas
+        q = p.entrante(A, c, y, signo)
+        assert q not in basis and signo * r[q] > 0
+        vistos.add(q)
+    if not opciones:
+        assert vistos == {int(np.argmax(np.where(p.nonbasic, signo * r, -np.inf)))}
+    # sin columnas que mejoren: óptimo
+    assert p.entrante(A, np.where(p.nonbasic, y.dot(A) - signo, c), y, signo) is None
+
+
+def test_entrante_con_variables_acotadas():
+    A, c, y, basis = modelo(2)
+    r = c - y.dot(A)
+    p = MotorPrecios("dantzig")
+    p.sync(basis, A.shape[1])
+    n = A.shape[1]
+    q = p.entrante(A, c, y)
+    fijas = np.zeros(n, dtype=bool)
+    fijas[q] = True
+    assert p.entrante(A, c, y, fijas=fijas) != q  # las fijas nunca entran
+    superior = np.zeros(n, dtype=bool)
+    superior[p.nonbasic] = True  # todas en su cota superior: mejoran las de r_j < 0
+    q = p.entrante(A, c, y, superior=superior)
+    assert r[q] == np.min(np.where(p.nonbasic, r, np.inf))
+
+
+def test_racha_degenerada_pasa_a_bland():
+    p = MotorPrecios("dantzig")
+    r = np.array([0.5, 3.0])
+    for _ in range(MAX_DEGENERADOS):
+        p.registrar_pivote(0.0)
+    assert p.bland_activo and p.elegir(r > 0, r) == 0
+    p.registrar_pivote(1.0)
+    assert not p.bland_activo and p.elegir(r > 0, r) == 1
+
+
+@pytest.mark.parametrize("semilla", range(4))
+def test_pesos_steepest_edge_exactos_tras_el_pivote(semilla):
+    A, _, _, basis = modelo(10 + semilla)
+    n = A.shape[1]
+    p = MotorPrecios("steepest")
+    p.sync(basis, n)
+
+    def exactos(basis):
+        B_inv = np.linalg.inv(A[:, basis])
+        return 1.0 + ((B_inv.dot(A)) ** 2).sum(axis=0), B_inv
+
+    normas, B_inv = exactos(basis)
+    p.iniciar_pesos(normas - 1.0)
+    q = int(np.flatnonzero(p.nonbasic)[0])
+    d = B_inv.dot(A[:, q])
+    row = int(np.argmax(np.abs(d)))
+    alpha = B_inv[row].dot(A)
+    tau = A.T.dot(B_inv.T.dot(d))
+    p.actualizar_pesos(alpha, row, q, basis[row], d, tau)
+    p.pivot(row, q, basis[row])
+    nueva = basis[:row] + [q] + basis[row + 1:]
+    normas, _ = exactos(nueva)
+    assert np.allclose(p.pesos[p.nonbasic], normas[p.nonbasic])
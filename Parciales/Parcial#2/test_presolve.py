@@ -0,0 +1,76 @@
+"""
+Pruebas de Presolve.py: presolve + postsolve contra resolver el modelo completo, sobre PL
+aleatorios con filas vacías, singletons, duplicadas y variables fijas agregadas a propósito;
+infactibilidad detectada en el presolve y duales reconstruidos para las filas eliminadas.
+Correr con: python -m pytest -q test_presolve.py
+"""
+import numpy as np
+import pytest
+
+from ArchivosModelo import ModeloLP
+from MatrizDispersa import MatrizCSC
+from Presolve import presolve
+from Simplex.SolverSimplex import SimplexSolver
+from DualSimplex.SolverDualSimplex import SolverDualSimplex
+
+
+def con_reducciones(lp, rng):
+    """El PL de generar_lp más filas que el presolve debe quitar; x* sigue siendo factible."""
+    A, b, tipos = lp["A"], lp["b"], list(lp["tipos"])
+    n = A.shape[1]
+    j = int(rng.integers(n))
+    floja = 1.0 if tipos[0] == "<=" else -1.0
+    extra = [(2.0 * A[0], tipos[0], 2.0 * b[0] + floja),  # duplicada (más floja)
+             (np.eye(n)[j], "<=", lp["x"][j] + 2.0),      # singleton
+             (np.zeros(n), "<=", 1.0)]                    # vacía
+    A = np.vstack([A] + [f for f, _, _ in extra])
+    tipos += [t for _, t, _ in extra]
+    b = np.concatenate([b, [v for _, _, v in extra]])
+    lo, up = np.zeros(n), np.full(n, np.inf)
+    k = int(rng.integers(n))
+    lo[k] = up[k] = lp["x"][k]  # fija en su valor óptimo
+    return ModeloLP("aleatorio", lp["modo"], [f"x{i + 1}" for i in range(n)], lp["c"], MatrizCSC.from_dense(A),
+                    tipos, b, [f"c{i + 1}" for i in range(A.shape[0])], lo, up)
+
+
+def resolver_con_presolve(modelo, clase):
+    reducido, post = presolve(modelo)
+    assert post.estado == "ok"
+    res = reducido.cargar_en(clase()).solve(5000)
+    return res["status"], post.solucion(res["solution"]), post
+
+
+@pytest.mark.parametrize("clase", [SimplexSolver, SolverDualSimplex])
+@pytest.mark.parametrize("semilla", range(8))
+def test_presolve_mismo_optimo_que_el_modelo_completo(lp_con_optimo, clase, semilla):
+    rng = np.random.default_rng(600 + semilla)
+    lp = lp_con_optimo(rng, 7, 10, tipos=("<=", ">="), modo="Min" if semilla % 2 else "Max")
+    modelo = con_reducciones(lp, rng)
+    status, sol, post = resolver_con_presolve(modelo, clase)
+    ref = modelo.cargar_en(clase()).solve(5000)
+    assert status == ref["status"] == "optimal"
+    assert sol["Z"] == pytest.approx(ref["solution"]["Z"], abs=1e-6) == pytest.approx(lp["Z"], abs=1e-6)
+    assert post.eliminadas["filas_vacias"] >= 1 and post.eliminadas["fijas"] + post.eliminadas["dominadas"] >= 1
+    # la solución reconstruida cumple el modelo original
+    x = np.array([sol[v] for v in modelo.var_names])
+    Ax = modelo.A.matvec(x)
+    for i, t in enumerate(modelo.tipos):
+        assert {"<=": Ax[i] <= modelo.b[i] + 1e-6, ">=": Ax[i] >= modelo.b[i] - 1e-6}[t]
+    assert np.all(x >= modelo.lo - 1e-9) and np.all(x <= modelo.up + 1e-9)
+
+
+def test_singletons_contradictorios_son_infactibles():
+    modelo = ModeloLP.desde_texto("Max", "x1 + x2", ["x1 + x2 <= 10", "x1 <= 2", "x1 >= 3"])
+    _, post = presolve(modelo)
+    assert post.estado == "infeasible"
+    assert modelo.cargar_en(SimplexSolver()).solve()["status"] == "infeasible"
+
+
+def test_duales_de_las_filas_convertidas_en_cota():
+    # 2x2 <= 12 queda como cota x2 <= 6 y está activa: recibe el costo reducido de x2
+    modelo = ModeloLP.desde_texto("Max", "3x1 + 5x2", ["x1 <= 4", "2x2 <= 12", "3x1 + 2x2 <= 18"])
+    reducido, post = presolve(modelo)
+    solver = reducido.cargar_en(SimplexSolver())
+    sol = post.solucion(solver.solve()["solution"])
+    assert sol == pytest.approx({"x1": 2.0, "x2": 6.0, "Z": 36.0})
+    assert post.duales(solver.get_duals(), sol) == pytest.approx({"c1": 0.0, "c2": 1.5, "c3": 1.0})
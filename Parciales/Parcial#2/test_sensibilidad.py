@@ -0,0 +1,83 @@
+"""
+Pruebas de Sensibilidad.py: rangos de Wyndor a mano y, en PL aleatorios, que moviendo un costo o un
+lado derecho dentro de su rango la resolución en frío da el Z que predicen la solución y los duales.
+Correr con: python -m pytest -q test_sensibilidad.py
+"""
+import numpy as np
+import pytest
+
+from Simplex.SolverSimplex import SimplexSolver
+from DualSimplex.SolverDualSimplex import SolverDualSimplex
+from Sensibilidad import sensibilidad, rango_costo, rango_rhs
+
+WYNDOR = ("Max", "3x1 + 5x2", ["x1 <= 4", "2x2 <= 12", "3x1 + 2x2 <= 18"])
+
+
+def punto_interior(desde, hasta, actual):
+    """Un valor dentro de [desde, hasta] distinto del actual (los extremos infinitos se acotan)."""
+    desde, hasta = max(desde, actual - 4.0), min(hasta, actual + 4.0)
+    return 0.5 * (actual + hasta) if hasta - actual >= actual - desde else 0.5 * (actual + desde)
+
+
+def resolver(clase, lp, c=None, b=None, **kw):
+    solver = clase(**kw)
+    solver.initialize_from_arrays(lp["modo"], lp["c"] if c is None else c, lp["A"], lp["tipos"],
+                                  lp["b"] if b is None else b)
+    return solver, solver.solve(5000)
+
+
+@pytest.mark.parametrize("clase", [SimplexSolver, SolverDualSimplex])
+def test_rangos_de_wyndor(clase):
+    solver = clase()
+    solver.initialize(*WYNDOR)
+    solver.solve()
+    sens = sensibilidad(solver)
+    x1, x2 = sens["variables"]["x1"], sens["variables"]["x2"]
+    assert (x1["desde"], x1["hasta"]) == pytest.approx((0.0, 7.5))
+    assert x2["desde"] == pytest.approx(2.0) and x2["hasta"] == np.inf
+    rangos = [(f["desde"], f["hasta"]) for f in sens["filas"][:3]]
+    assert rangos == [(pytest.approx(2.0), np.inf), pytest.approx((6.0, 18.0)), pytest.approx((12.0, 24.0))]
+    assert [f["dual"] for f in sens["filas"][:3]] == pytest.approx([0.0, 1.5, 1.0])
+    assert rango_costo(solver, "x1") == sens["variables"]["x1"] and rango_rhs(solver, 2) == sens["filas"][2]
+
+
+@pytest.mark.parametrize("clase", [SimplexSolver, SolverDualSimplex])
+@pytest.mark.parametrize("semilla", range(6))
+def test_dentro_del_rango_se_cumple_la_prediccion(lp_con_optimo, clase, semilla):
+    lp = lp_con_optimo(np.random.default_rng(700 + semilla), 6, 8, tipos=("<=", ">="),
+                       modo="Min" if semilla % 2 else "Max")
+    solver, res = resolver(clase, lp)
+    sens = sensibilidad(solver)
+    Z = res["solution"]["Z"]
+    for j in range(lp["c"].size):
+        v = sens["variables"][f"x{j + 1}"]
+        nuevo = punto_interior(v["desde"], v["hasta"], v["costo"])
+        c = lp["c"].copy()
+        c[j] = nuevo
+        _, ref = resolver(clase, lp, c=c)
+        # la base sigue siendo óptima: x no cambia y Z se mueve x_j * delta
+        assert ref["solution"]["Z"] == pytest.approx(Z + v["valor"] * (nuevo - v["costo"]), abs=1e-6)
+    for i in range(lp["b"].size):
+        f = sens["filas"][i]
+        nuevo = punto_interior(f["desde"], f["hasta"], f["rhs"])
+        b = lp["b"].copy()
+        b[i] = nuevo
+        _, ref = resolver(clase, lp, b=b)
+        # la base sigue siendo factible: los duales no cambian y Z se mueve y_i * delta
+        assert ref["status"] == "optimal"
+        assert ref["solution"]["Z"] == pytest.approx(Z + f["dual"] * (nuevo - f["rhs"]), abs=1e-6)
+
+
+@pytest.mark.parametrize("semilla", range(4))
+def test_escalado_no_cambia_los_rangos(lp_con_optimo, semilla):
+    lp = lp_con_optimo(np.random.default_rng(750 + semilla), 6, 8, tipos=("<=", ">="))
+    lp["A"][0] *= 1000.0
+    lp["b"][0] *= 1000.0
+    sin, _ = resolver(SimplexSolver, lp)
+    con, _ = resolver(SimplexSolver, lp, escalar=True)
+    s1, s2 = sensibilidad(sin), sensibilidad(con)
+    for nombre, v in s1["variables"].items():
+        otro = s2["variables"][nombre]
+        assert (v["desde"], v["hasta"]) == pytest.approx((otro["desde"], otro["hasta"]), abs=1e-9)
+    for f1, f2 in zip(s1["filas"], s2["filas"]):
+        assert (f1["desde"], f1["hasta"], f1["dual"]) == pytest.approx((f2["desde"], f2["hasta"], f2["dual"]), abs=1e-9)
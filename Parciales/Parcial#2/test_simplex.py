@@ -0,0 +1,175 @@
+"""
+Pruebas de SimplexSolver: cada regla de precios (también con precios parciales) contra PL
+aleatorios con óptimo conocido (conftest.generar_lp), con A densa o en CSC y con filas <=, >= e =;
+variables acotadas contra el mismo modelo con las cotas como filas, arranque en caliente,
+run_to_completion contra el paso a paso y el xB / y del paso theta contra un recálculo desde cero.
+Correr con: python -m pytest -q test_simplex.py
+"""
+import numpy as np
+import pytest
+
+from Simplex.SolverSimplex import SimplexSolver
+from Precios import REGLAS
+
+
+def resolver(lp, **kw):
+    solver = SimplexSolver(**kw)
+    solver.initialize_from_arrays(lp["modo"], lp["c"], lp["A"], lp["tipos"], lp["b"])
+    return solver, solver.solve(5000)
+
+
+def factible(lp, sol):
+    x = np.array([sol[f"x{j + 1}"] for j in range(lp["c"].size)])
+    Ax = lp["A"].dot(x)
+    cumple = {"<=": Ax <= lp["b"] + 1e-6, ">=": Ax >= lp["b"] - 1e-6, "=": np.abs(Ax - lp["b"]) <= 1e-6}
+    return np.all(x >= -1e-9) and all(cumple[t][i] for i, t in enumerate(lp["tipos"]))
+
+
+@pytest.mark.parametrize("regla", REGLAS)
+@pytest.mark.parametrize("sparse", [False, True])
+@pytest.mark.parametrize("semilla", range(8))
+def test_reglas_de_precios_llegan_al_optimo(lp_con_optimo, regla, sparse, semilla):
+    rng = np.random.default_rng(semilla)
+    lp = lp_con_optimo(rng, 6 + semilla, 8 + semilla, tipos=("<=", ">=", "=") if semilla % 2 else ("<=",),
+                       modo="Min" if semilla % 3 == 0 else "Max")
+    solver, res = resolver(lp, regla_precios=regla, sparse=sparse)
+    assert res["status"] == "optimal"
+    assert res["solution"]["Z"] == pytest.approx(lp["Z"], abs=1e-6)
+    assert factible(lp, res["solution"])
+
+
+def test_wyndor_paso_a_paso_igual_que_solve():
+    a, b = SimplexSolver(), SimplexSolver()
+    for s in (a, b):
+        s.initialize("Max", "3x1 + 5x2", ["x1 <= 4", "2x2 <= 12", "3x1 + 2x2 <= 18"])
+    while a.status() not in ("optimal", "unbounded", "infeasible"):
+        a.iterate_one()
+    assert b.solve()["solution"] == a.get_solution()
+    assert a.get_solution()["Z"] == pytest.approx(36.0)
+    assert a.get_duals() == pytest.approx([0.0, 1.5, 1.0])
+
+
+@pytest.mark.parametrize("regla", REGLAS)
+def test_infactible_y_no_acotado(regla):
+    s = SimplexSolver(regla_precios=regla)
+    s.initialize("Max", "x1 + x2", ["x1 + x2 <= 2", "x1 >= 3"])
+    assert s.solve()["status"] == "infeasible"
+    s.initialize("Max", "x1 + x2", ["x1 - x2 <= 2"])
+    assert s.solve()["status"] == "unbounded"
+
+
+# ################ Precios parciales y múltiples ################
+@pytest.mark.parametrize("regla", ["dantzig", "devex", "steepest"])
+@pytest.mark.parametrize("opciones", [{"bloque_precios": 5}, {"candidatos_precios": 4},
+                                      {"bloque_precios": 7, "candidatos_precios": 3}])
+@pytest.mark.parametrize("semilla", range(4))
+def test_precios_parciales_llegan_al_optimo(lp_con_optimo, regla, opciones, semilla):
+    lp = lp_con_optimo(np.random.default_rng(50 + semilla), 10, 40, tipos=("<=", ">="))
+    _, res = resolver(lp, regla_precios=regla, sparse=semilla % 2 == 1, **opciones)
+    assert res["status"] == "optimal" and res["solution"]["Z"] == pytest.approx(lp["Z"], abs=1e-6)
+
+
+def test_precios_parciales_rechazan_tamanos_no_positivos():
+    with pytest.raises(ValueError):
+        SimplexSolver(bloque_precios=0).initialize("Max", "x1", ["x1 <= 1"])
+
+
+# ################ Variables acotadas ################
+def cotas_como_filas(lp, lo, up):
+    """El mismo modelo con las cotas escritas como filas (x >= 0 implícito)."""
+    n = lp["c"].size
+    sup, inf = np.flatnonzero(np.isfinite(up)), np.flatnonzero(lo > 0)
+    A = np.vstack([lp["A"], np.eye(n)[sup], np.eye(n)[inf]])
+    return dict(lp, A=A, tipos=lp["tipos"] + ["<="] * sup.size + [">="] * inf.size,
+                b=np.concatenate([lp["b"], up[sup], lo[inf]]))
+
+
+@pytest.mark.parametrize("regla", ["bland", "dantzig", "steepest"])
+@pytest.mark.parametrize("semilla", range(8))
+def test_cotas_sin_filas_igual_que_con_filas(lp_con_optimo, regla, semilla):
+    rng = np.random.default_rng(200 + semilla)
+    lp = lp_con_optimo(rng, 6, 9, tipos=("<=", ">="), modo="Min" if semilla % 2 else "Max")
+    lo = np.where(rng.random(9) < 0.3, rng.integers(0, 3, 9), 0).astype(float)
+    up = np.where(rng.random(9) < 0.5, lo + rng.integers(1, 6, 9), np.inf)
+    acotado = SimplexSolver(regla_precios=regla, sparse=semilla % 3 == 0)
+    acotado.initialize_from_arrays(lp["modo"], lp["c"], lp["A"], lp["tipos"], lp["b"], lo=lo, up=up)
+    res = acotado.solve(5000)
+    _, ref = resolver(cotas_como_filas(lp, lo, up), regla_precios="bland")
+    assert res["status"] == ref["status"]
+    if ref["status"] == "optimal":
+        assert res["solution"]["Z"] == pytest.approx(ref["solution"]["Z"], abs=1e-6)
+        x = np.array([res["solution"][f"x{j + 1}"] for j in range(9)])
+        assert np.all(x >= lo - 1e-9) and np.all(x <= up + 1e-9)
+
+
+def test_cotas_nativas_desde_texto():
+    restricciones = ["x1 + x2 <= 10", "x1 <= 4", "x2 >= 1", "2x1 + x2 >= 3"]
+    con, sin = SimplexSolver(cotas_nativas=True), SimplexSolver()
+    for s in (con, sin):
+        s.initialize("Max", "3x1 + 2x2", restricciones)
+    assert con.A.shape[0] == 2 and sin.A.shape[0] == 4
+    assert con.solve()["solution"]["Z"] == pytest.approx(sin.solve()["solution"]["Z"]) == pytest.approx(24.0)
+
+
+# ################ Arranque en caliente ################
+@pytest.mark.parametrize("semilla", range(6))
+def test_arranque_en_caliente_con_la_base_previa(lp_con_optimo, semilla):
+    rng = np.random.default_rng(300 + semilla)
+    lp = lp_con_optimo(rng, 8, 10, tipos=("<=", ">="))
+    previo, _ = resolver(lp, regla_precios="dantzig")
+    # la misma base con b un poco cambiado: primal factible (0 pivotes) o reparable con pivotes duales
+    cambiado = dict(lp, b=lp["b"] + rng.normal(scale=0.3, size=lp["b"].size))
+    frio, ref = resolver(cambiado, regla_precios="dantzig")
+    caliente = SimplexSolver(regla_precios="dantzig")
+    caliente.initialize_from_arrays(lp["modo"], lp["c"], lp["A"], lp["tipos"], cambiado["b"],
+                                    basis=previo.basis_names())
+    res = caliente.solve(5000)
+    assert caliente.warm_start in ("primal", "dual")
+    assert res["status"] == ref["status"]
+    if ref["status"] == "optimal":
+        assert res["solution"]["Z"] == pytest.approx(ref["solution"]["Z"], abs=1e-6)
+        assert res["iterations"] <= ref["iterations"]
+
+
+def test_base_previa_que_no_sirve_arranca_en_frio():
+    s = SimplexSolver()
+    s.initialize("Max", "3x1 + 5x2", ["x1 <= 4", "2x2 <= 12", "3x1 + 2x2 <= 18"], basis=["x1", "zz", "s3"])
+    assert s.warm_start is None and s.solve()["solution"]["Z"] == pytest.approx(36.0)
+
+
+# ################ Motor rápido ################
+@pytest.mark.parametrize("regla", REGLAS)
+@pytest.mark.parametrize("semilla", range(4))
+def test_run_to_completion_mismos_pivotes_que_iterate_one(lp_con_optimo, regla, semilla):
+    lp = lp_con_optimo(np.random.default_rng(400 + semilla), 10, 14, tipos=("<=", ">=", "="))
+    rapido, lento = SimplexSolver(regla_precios=regla), SimplexSolver(regla_precios=regla)
+    for s in (rapido, lento):
+        s.initialize_from_arrays(lp["modo"], lp["c"], lp["A"], lp["tipos"], lp["b"])
+    res = rapido.solve(5000)
+    ref = lento.solve(5000, record_history=True)
+    assert res["iterations"] == ref["iterations"]
+    assert res["solution"]["Z"] == pytest.approx(ref["solution"]["Z"]) == pytest.approx(lp["Z"])
+    assert rapido.basis == lento.basis
+
+
+@pytest.mark.parametrize("acotado", [False, True])
+@pytest.mark.parametrize("semilla", range(4))
+def test_iterate_one_actualiza_xB_e_y_con_el_paso_theta(lp_con_optimo, acotado, semilla):
+    rng = np.random.default_rng(450 + semilla)
+    lp = lp_con_optimo(rng, 10, 14, tipos=("<=", ">=", "="))
+    up = np.where(rng.random(14) < 0.5, lp["x"] + rng.integers(0, 3, 14), np.inf) if acotado else None
+    solver = SimplexSolver(regla_precios="dantzig")
+    solver.initialize_from_arrays(lp["modo"], lp["c"], lp["A"], lp["tipos"], lp["b"], up=up)
+    incrementales = 0
+    while solver.status() not in ("optimal", "unbounded", "infeasible"):
+        solver.iterate_one()
+        if solver._estado is None or solver._estado[0] is not solver.factor:
+            continue  # se rehízo la factorización: el próximo paso recalcula desde cero
+        incrementales += 1
+        _, xB, y, _, c_fase = solver._estado
+        fresco, Z, factor = solver._compute_current_solution()
+        assert np.allclose(xB, fresco, atol=1e-9)
+        assert np.allclose(y, factor.btran(c_fase[solver.basis]), atol=1e-9)
+        assert solver._objective_value(xB) == pytest.approx(Z, abs=1e-9)
+    assert incrementales > 0 and solver.status() == "optimal"
+    assert solver.get_solution()["Z"] == pytest.approx(lp["Z"])
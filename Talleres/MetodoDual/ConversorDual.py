@@ -4,8 +4,10 @@ import numpy as np
 
 def Parsear(expresion: str) -> dict:
     """
-    Parsea una restricción o función objetivo con hasta 10 variables.
-    Retorna: { 'coef': [...], 'operador': <=|>=|=|None, 'constante': float, 'max_var': int }
+    Parsea una restricción o función objetivo con cualquier número de variables.
+    Retorna: { 'coef': [...], 'terminos': [(idx, valor), ...], 'operador': <=|>=|=|None, 'constante': float, 'max_var': int }
+    'terminos' son los pares dispersos (índice, coeficiente) en orden de aparición; 'coef' es la
+    misma información como lista densa de al menos 10 posiciones.
     """
     match = re.search(r"(<=|>=|=)", expresion)
     if match:
@@ -18,7 +20,7 @@ def Parsear(expresion: str) -> dict:
         izquierda = expresion.strip()
         derecha = "0"
 
-    coef = [0.0] * 10
+    coef = {}  # índice -> coeficiente (tabla dispersa, sin límite de variables)
     max_idx = -1
 
     # términos tipo: (coeficiente opcional) (variable como x, y, z, x1..x10)
@@ -36,8 +38,8 @@ def Parsear(expresion: str) -> dict:
         else:
             raise ValueError(f"Variable no reconocida: {var_str}")
 
-        if idx < 0 or idx >= 10:
-            raise ValueError(f"Variable fuera de rango (1..10): {var_str}")
+        if idx < 0:
+            raise ValueError(f"Variable fuera de rango (x1, x2, ...): {var_str}")
 
         if coef_str in ["", "+"]:
             valor = 1.0
@@ -46,7 +48,7 @@ def Parsear(expresion: str) -> dict:
         else:
             valor = float(coef_str)
 
-        coef[idx] += valor
+        coef[idx] = coef.get(idx, 0.0) + valor
         if idx > max_idx:
             max_idx = idx
 
@@ -55,7 +57,20 @@ def Parsear(expresion: str) -> dict:
     except ValueError:
         raise ValueError(f"Constante inválida: {derecha}")
 
-    return {"coef": coef, "operador": operador, "constante": constante, "max_var": max_idx}
+    pares = list(coef.items())
+    densa = [0.0] * max(10, max_idx + 1)
+    for idx, valor in pares:
+        densa[idx] = valor
+
+    return {"coef": densa, "terminos": pares, "operador": operador, "constante": constante, "max_var": max_idx}
+
+
+def fila_densa(parsed: dict, n_vars: int) -> list:
+    """Coeficientes de una expresión parseada como lista de largo n_vars."""
+    fila = [0.0] * n_vars
+    for idx, valor in parsed["terminos"]:
+        fila[idx] = valor
+    return fila
 
 
 # ################ helpers de formateo ################
@@ -193,13 +208,13 @@ if __name__ == "__main__":
         if p["max_var"] > max_idx:
             max_idx = p["max_var"]
     if max_idx < 0:
-        raise ValueError("No se detectaron variables (x1..x10 / x,y,z).")
+        raise ValueError("No se detectaron variables (x1, x2, ... / x,y,z).")
 
     n_vars = max_idx + 1
 
     # recortar/extraer vectores y matriz con la cantidad correcta de variables
-    c = parsed_fo["coef"][:n_vars]
-    A = [p["coef"][:n_vars] for p in parsed_constraints]
+    c = fila_densa(parsed_fo, n_vars)
+    A = [fila_densa(p, n_vars) for p in parsed_constraints]
     b = [p["constante"] for p in parsed_constraints]
     tipos = [p["operador"] for p in parsed_constraints]
 